@@ -0,0 +1,53 @@
+# validate_many throughput on synthetic Item JSON from 1 to N threads, against one thread without an executor.
+#
+#   python benchmarks/bench_batch.py [count] [max_threads]
+#
+# Threads only scale where validation releases the GIL: in shapely on a standard build, and throughout on a
+# free-threaded one (python3.13t), which is reported with the results.
+
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from stac_factory.batch import validate_many
+from stac_factory.models import clear_geometry_cache, clear_url_cache
+from stac_factory.synthetic import SyntheticItems
+
+
+def run(documents: list[str], threads: int | None) -> float:
+    # items per second, with the caches cold, as each run would be in a fresh process
+    clear_url_cache()
+    clear_geometry_cache()
+    t0 = time.perf_counter()
+    if threads is None:
+        results = validate_many(documents)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = validate_many(documents, executor)
+    elapsed = time.perf_counter() - t0
+    if not all(result.valid for result in results):
+        raise RuntimeError("a synthetic Item is invalid")
+    return len(documents) / elapsed
+
+
+def main(count: int, max_threads: int) -> None:
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True  # noqa: SLF001
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    documents = list(SyntheticItems(seed=0, median_vertices=64).json(count))
+
+    baseline = run(documents, None)
+    print(f"no executor: {baseline:8,.0f} items/s")
+    threads = 1
+    while threads <= max_threads:
+        rate = run(documents, threads)
+        print(f"{threads:3} threads: {rate:8,.0f} items/s, {rate / baseline:.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
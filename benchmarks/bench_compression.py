@@ -0,0 +1,70 @@
+# Reading compressed NDJSON of synthetic Items: decompressing to a temporary file and reading that, against
+# open_input, sequentially and with workers decompressing zstd frames in parallel.
+#
+#   python benchmarks/bench_compression.py [count] [workers]
+#
+# Parallel decompression needs as many cores as workers to help.
+
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+
+import zstandard
+
+from stac_factory.compression import open_input
+from stac_factory.synthetic import SyntheticItems
+
+# uncompressed bytes per zstd frame
+FRAME_SIZE = 1 << 22
+
+
+def timed(label: str, read: Callable[[], int]) -> None:
+    # read returns the number of bytes read
+    t0 = time.perf_counter()
+    size = read()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<24} {elapsed:6.2f}s  {size / elapsed / 1e6:,.0f} MB/s")
+
+
+def main(count: int, workers: int) -> None:
+    data = "".join(f"{line}\n" for line in SyntheticItems().json(count)).encode()
+    directory = Path(tempfile.mkdtemp())
+    try:
+        gzipped = directory / "items.ndjson.gz"
+        gzipped.write_bytes(gzip.compress(data, compresslevel=6))
+        frames = directory / "items.ndjson.zst"
+        compressor = zstandard.ZstdCompressor()
+        frames.write_bytes(
+            b"".join(compressor.compress(data[i : i + FRAME_SIZE]) for i in range(0, len(data), FRAME_SIZE))
+        )
+        print(f"{len(data) / 1e6:,.0f} MB of NDJSON, {os.cpu_count()} cpus")
+
+        def to_temporary_file() -> int:
+            temporary = directory / "items.ndjson"
+            with gzip.open(gzipped) as source, temporary.open("wb") as target:
+                shutil.copyfileobj(source, target)
+            return len(temporary.read_bytes())
+
+        def lines(path: Path, workers: int = 1) -> int:
+            with open_input(path, workers=workers) as f:
+                return sum(len(line) for line in f)
+
+        timed("gzip via temporary file", to_temporary_file)
+        timed("gzip streamed", lambda: lines(gzipped))
+        timed("zstd streamed", lambda: lines(frames))
+        timed(f"zstd, {workers} workers", lambda: lines(frames, workers))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,39 @@
+# Keys per second through DuplicateDetector, while exact and once spilled to the Bloom filter, and the peak memory
+# it allocates, measured in a second pass as tracing slows it down.
+#
+#   python benchmarks/bench_dedupe.py [count] [memory budget in MiB]
+#
+# Memory should stay within the budget however large count is.
+
+import sys
+import time
+import tracemalloc
+
+from stac_factory.dedupe import DuplicateDetector
+
+
+def run(count: int, budget: int) -> tuple[float, float, DuplicateDetector]:
+    duplicates = DuplicateDetector(memory_budget=budget << 20)
+    exact = min(count, duplicates.max_exact_keys)
+    t0 = time.perf_counter()
+    for i in range(exact):
+        duplicates.seen("collection", f"item-{i}")
+    t1 = time.perf_counter()
+    for i in range(exact, count):
+        duplicates.seen("collection", f"item-{i}")
+    return t1 - t0, time.perf_counter() - t1, duplicates
+
+
+def main(count: int, budget: int) -> None:
+    exact_seconds, filter_seconds, duplicates = run(count, budget)
+    exact = min(count, duplicates.max_exact_keys)
+    print(f"exact:  {exact / exact_seconds:,.0f} keys/s")
+    if count > exact:
+        print(f"filter: {(count - exact) / filter_seconds:,.0f} keys/s, {duplicates.duplicates} false positives")
+    tracemalloc.start()
+    run(count, budget)
+    print(f"peak:   {tracemalloc.get_traced_memory()[1] / 2**20:,.0f} MiB of {budget} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else 64)
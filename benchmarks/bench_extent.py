@@ -0,0 +1,48 @@
+# Items per second computing a Collection extent from an NDJSON file of synthetic Items, validating each Item and
+# scanning a projection of its bbox and datetimes, and the peak memory of each pass, which for Items includes the URL
+# and geometry caches.
+#
+#   python benchmarks/bench_extent.py [count]
+
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from stac_factory.extent import EXTENT_FIELDS, ExtentAggregator
+from stac_factory.models import Item
+from stac_factory.projection import scan_ndjson
+from stac_factory.synthetic import SyntheticItems
+
+
+def items(path: Path) -> Iterator[Item]:
+    with path.open("rb") as f:
+        for line in f:
+            yield Item.model_validate_json(line)
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "items.ndjson"
+        with path.open("w") as f:
+            f.writelines(line + "\n" for line in SyntheticItems(seed=0, antimeridian_fraction=0.05).json(count))
+
+        for name, records in [
+            ("items", lambda: items(path)),
+            ("projection", lambda: scan_ndjson(path, EXTENT_FIELDS)),
+        ]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            aggregator = ExtentAggregator().update(records())
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:>10}: {count / elapsed:10,.0f} items/s, peak {peak / 1e6:.1f} MB")
+        print(aggregator.extent())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,57 @@
+# Polygon validation throughput on a tile-grid workload, with the geometry cache cold for each Polygon and warm.
+#
+#   python benchmarks/bench_geometry_cache.py [tiles] [repeat]
+#
+# Like an MGRS or WRS-2 product, the workload is tiles distinct footprints, each seen repeat times in a shuffled
+# order, as Items of the same tiles on different dates.
+
+import sys
+import time
+
+import numpy as np
+
+from pydantic import TypeAdapter
+
+from stac_factory.models import Polygon, clear_geometry_cache, geometry_cache_info
+
+VERTICES = 64
+
+
+def footprint(rng: np.random.Generator) -> dict[str, object]:
+    # a counter-clockwise ring of VERTICES points around a random center, about 1 degree across
+    center = rng.uniform([-170.0, -60.0], [170.0, 60.0])
+    angles = np.linspace(0.0, 2 * np.pi, VERTICES, endpoint=False)
+    ring = (center + 0.5 * np.column_stack([np.cos(angles), np.sin(angles)])).tolist()
+    return {"type": "Polygon", "coordinates": [[*ring, ring[0]]]}
+
+
+def main(tiles: int, repeat: int) -> None:
+    rng = np.random.default_rng(0)
+    footprints = [footprint(rng) for _ in range(tiles)]
+    workload = [footprints[i] for i in rng.permutation(np.repeat(np.arange(tiles), repeat))]
+    adapter = TypeAdapter(Polygon)
+    print(f"{len(workload):,} polygons of {VERTICES + 1} positions, {tiles:,} distinct")
+
+    t0 = time.perf_counter()
+    for geometry in workload:
+        clear_geometry_cache()
+        adapter.validate_python(geometry)
+    elapsed = time.perf_counter() - t0
+    print(f"cold cache: {len(workload) / elapsed:,.0f} polygons/s")
+
+    clear_geometry_cache()
+    t0 = time.perf_counter()
+    for geometry in workload:
+        adapter.validate_python(geometry)
+    elapsed = time.perf_counter() - t0
+    print(f"warm cache: {len(workload) / elapsed:,.0f} polygons/s")
+
+    info = geometry_cache_info()
+    print(f"hit rate {info.hit_rate:.1%} ({info.hits:,} hits, {info.misses:,} misses, {info.size:,} cached)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
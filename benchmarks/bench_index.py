@@ -0,0 +1,99 @@
+# Build time and query latency of ItemIndex against a linear scan.
+#
+#   python benchmarks/bench_index.py [count]
+#
+# Items are copies of one validated Item with updated bbox and datetime, since validating a million Items would
+# dominate the run and isn't what's being measured.
+
+import sys
+import time
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from stac_factory.index import ItemIndex
+from stac_factory.models import BBox2d, Item, Polygon
+
+
+def make_items(count: int) -> list[Item]:
+    template = Item.create(
+        extensions=[],
+        id="template",
+        geometry=Polygon.model_validate(
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]},
+        ),
+        bbox=BBox2d(w_lon=0, s_lat=0, e_lon=1, n_lat=1),
+        assets=[],
+        links=[],
+        datetime=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        collection=None,
+    )
+    rng = np.random.default_rng(42)
+    lons = rng.uniform(-179, 178, count)
+    lats = rng.uniform(-89, 88, count)
+    days = rng.uniform(0, 5 * 365, count)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return [
+        template.model_copy(
+            update={
+                "id": f"item-{i}",
+                "bbox": BBox2d.model_construct(w_lon=lon, s_lat=lat, e_lon=lon + 1, n_lat=lat + 1),
+                "datetime": start + timedelta(days=day),
+            }
+        )
+        for i, (lon, lat, day) in enumerate(zip(lons.tolist(), lats.tolist(), days.tolist(), strict=True))
+    ]
+
+
+def linear_scan(items: list[Item], area: BBox2d, lo: datetime, hi: datetime) -> list[Item]:
+    return [
+        item
+        for item in items
+        if item.bbox.w_lon <= area.e_lon
+        and item.bbox.e_lon >= area.w_lon
+        and item.bbox.s_lat <= area.n_lat
+        and item.bbox.n_lat >= area.s_lat
+        and item.datetime is not None
+        and lo <= item.datetime <= hi
+    ]
+
+
+def main(count: int) -> None:
+    t0 = time.perf_counter()
+    items = make_items(count)
+    print(f"generated {count:,} items in {time.perf_counter() - t0:.2f}s")
+
+    t0 = time.perf_counter()
+    index = ItemIndex(items)
+    index.build()
+    print(f"bulk load and build: {time.perf_counter() - t0:.2f}s")
+
+    area = BBox2d(w_lon=10, s_lat=10, e_lon=20, n_lat=20)
+    lo = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    hi = datetime(2021, 3, 1, tzinfo=timezone.utc)
+
+    repeat = 100
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        found = index.query(area, lo, hi)
+    print(f"indexed query: {(time.perf_counter() - t0) / repeat * 1000:.3f} ms ({len(found)} items)")
+
+    t0 = time.perf_counter()
+    scanned = linear_scan(items, area, lo, hi)
+    print(f"linear scan:   {(time.perf_counter() - t0) * 1000:.3f} ms ({len(scanned)} items)")
+
+    inserted = [item.model_copy(update={"id": f"inserted-{item.id}"}) for item in items[:1000]]
+    t0 = time.perf_counter()
+    for item in inserted:
+        index.insert(item)
+    print(f"1,000 incremental inserts: {(time.perf_counter() - t0) * 1000:.3f} ms")
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        found = index.query(area, lo, hi)
+    print(f"query with 1,000 pending: {(time.perf_counter() - t0) / repeat * 1000:.3f} ms ({len(found)} items)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
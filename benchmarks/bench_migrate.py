@@ -0,0 +1,41 @@
+# Throughput of migrate_lines on a Sentinel-2 L2A Item with eo:bands, raster:bands, and proj:epsg, as 1.0.0 Items to
+# migrate and as 1.1.0 Items that are passed through, with 1 and N worker processes.
+#
+#   python benchmarks/bench_migrate.py [count] [workers]
+
+import json
+import os
+import sys
+import time
+
+from pathlib import Path
+
+from stac_factory.migrate import migrate_item, migrate_lines
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T01WCR_20250427T000611_L2A.json"
+
+
+def main(count: int, workers: int) -> None:
+    item = json.loads(FIXTURE.read_text())
+    old = json.dumps(item, separators=(",", ":")).encode() + b"\n"
+    migrate_item(item)
+    current = json.dumps(item, separators=(",", ":")).encode() + b"\n"
+
+    for name, line in [("1.0.0", old), ("1.1.0", current)]:
+        for n in sorted({1, workers}):
+            start = time.perf_counter()
+            failures = sum(
+                result.error is not None
+                for result in migrate_lines(((f"items:{i}", line) for i in range(count)), workers=n)
+            )
+            elapsed = time.perf_counter() - start
+            if failures:
+                raise RuntimeError(f"{failures} failures")
+            print(f"{name}, {n} workers: {count / elapsed:10,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
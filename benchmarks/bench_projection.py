@@ -0,0 +1,42 @@
+# Items per second and MB/s parsing an NDJSON file of copies of a Sentinel-2 Item as Items, and as a projection of
+# the fields an inventory needs.
+#
+#   python benchmarks/bench_projection.py [count]
+
+import json
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+from stac_factory.models import Item
+from stac_factory.projection import project, scan_ndjson
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T38XNF_20250422T091553_L2A.json"
+
+
+def main(count: int) -> None:
+    line = json.dumps(json.loads(FIXTURE.read_bytes())).encode() + b"\n"
+    inventory = project("id", "collection", "bbox", "datetime", "eo:cloud_cover")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "items.ndjson"
+        path.write_bytes(line * count)
+        size = path.stat().st_size / 1e6
+
+        start = time.perf_counter()
+        with path.open("rb") as f:
+            for document in f:
+                Item.model_validate_json(document)
+        seconds = time.perf_counter() - start
+        print(f"Item:       {count / seconds:,.0f} items/s, {size / seconds:,.0f} MB/s")
+
+        start = time.perf_counter()
+        for _ in scan_ndjson(path, inventory):
+            pass
+        seconds = time.perf_counter() - start
+        print(f"projection: {count / seconds:,.0f} items/s, {size / seconds:,.0f} MB/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,41 @@
+# Conversions per second between an Item from the Sentinel-2 fixture and a pystac Item, through a JSON dict and
+# directly.
+#
+#   python benchmarks/bench_pystac.py [count]
+
+import sys
+import time
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pystac
+
+from stac_factory.models import Item
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T01WCR_20250427T000611_L2A.json"
+
+
+def rate(count: int, convert: Callable[[], Any]) -> float:
+    t0 = time.perf_counter()
+    for _ in range(count):
+        convert()
+    return count / (time.perf_counter() - t0)
+
+
+def main(count: int) -> None:
+    item = Item.model_validate_json(FIXTURE.read_text())
+    pystac_item = item.to_pystac()
+
+    via_dict = rate(count, lambda: pystac.Item.from_dict(item.model_dump(mode="json")))
+    direct = rate(count, item.to_pystac)
+    print(f"to pystac:   {via_dict:,.0f}/s with from_dict, {direct:,.0f}/s direct ({direct / via_dict:.1f}x)")
+
+    via_dict = rate(count, lambda: Item.model_validate(pystac_item.to_dict(transform_hrefs=False)))
+    direct = rate(count, lambda: Item.from_pystac(pystac_item))
+    print(f"from pystac: {via_dict:,.0f}/s with to_dict, {direct:,.0f}/s direct ({direct / via_dict:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
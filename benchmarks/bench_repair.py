@@ -0,0 +1,68 @@
+# Items per second validating NDJSON lines of synthetic Items of which a tenth have a clockwise ring and a fiftieth
+# a Polygon crossing the antimeridian: by validating each line, and parsing, repairing, and validating again the ones
+# that fail, and by parsing each batch of lines and repairing it before validating.
+#
+#   python benchmarks/bench_repair.py [count] [batch size]
+
+import json
+import sys
+import time
+
+from pydantic import ValidationError
+
+from stac_factory.models import Item
+from stac_factory.repair import repair_geometries, repair_items
+from stac_factory.synthetic import SyntheticItems
+
+CROSSING = [[170.0, 0.0], [-170.0, 0.0], [-170.0, 10.0], [170.0, 10.0], [170.0, 0.0]]
+
+
+def lines(count: int) -> list[str]:
+    result = []
+    for i, raw in enumerate(SyntheticItems(antimeridian_fraction=0.0).json(count)):
+        document = json.loads(raw)
+        if i % 50 == 0:
+            document["geometry"] = {"type": "Polygon", "coordinates": [CROSSING]}
+            document["bbox"] = [170.0, 0.0, -170.0, 10.2]
+        elif i % 10 == 0:
+            for polygon in document["geometry"]["coordinates"][:1]:
+                (polygon if document["geometry"]["type"] == "Polygon" else polygon[0]).reverse()
+        result.append(json.dumps(document))
+    return result
+
+
+def validate_or_repair(line: str) -> bool:
+    # whether the line failed, and was repaired and validated again
+    try:
+        Item.model_validate_json(line)
+    except ValidationError:
+        document = json.loads(line)
+        document["geometry"] = repair_geometries([document["geometry"]])[0][0]
+        Item.model_validate(document)
+        return True
+    return False
+
+
+def after_failure(batch: list[str]) -> int:
+    return sum(map(validate_or_repair, batch))
+
+
+def before(batch: list[str]) -> int:
+    documents = [json.loads(line) for line in batch]
+    repaired = len(repair_items(documents))
+    for document in documents:
+        Item.model_validate(document)
+    return repaired
+
+
+def main(count: int, batch_size: int) -> None:
+    items = lines(count)
+    batches = [items[i : i + batch_size] for i in range(0, count, batch_size)]
+    for label, run in (("after failure", after_failure), ("batch repair", before)):
+        start = time.perf_counter()
+        repaired = sum(run(batch) for batch in batches)
+        print(f"{label:<14} {count / (time.perf_counter() - start):,.0f} items/s, {repaired:,} repaired")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000, int(sys.argv[2]) if len(sys.argv) > 2 else 100)
@@ -0,0 +1,62 @@
+# Validations per second of a single Item file with a new `stac-factory validate` process each time, and with
+# `stac-factory-client validate` processes and in-process client requests to a running server.
+#
+#   python benchmarks/bench_server.py [count]
+
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+
+from stac_factory.client import ValidationClient
+from stac_factory.server import ValidationServer
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T01WCR_20250427T000611_L2A.json"
+
+
+def main(count: int) -> None:
+    t0 = time.perf_counter()
+    for _ in range(count):
+        subprocess.run(  # noqa: S603 - this interpreter
+            [sys.executable, "-m", "stac_factory.cli", "validate", str(FIXTURE)], check=True, capture_output=True
+        )
+    print(f"validate process:       {count / (time.perf_counter() - t0):,.1f}/s")
+
+    with tempfile.TemporaryDirectory() as directory, ValidationServer(f"{directory}/validate.sock") as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            t0 = time.perf_counter()
+            for _ in range(count):
+                command = [
+                    sys.executable,
+                    "-m",
+                    "stac_factory.client",
+                    "validate",
+                    str(FIXTURE),
+                    "--address",
+                    server.url,
+                ]
+                subprocess.run(command, check=True, capture_output=True)  # noqa: S603 - this interpreter
+            print(f"client process:         {count / (time.perf_counter() - t0):,.1f}/s")
+
+            document = FIXTURE.read_bytes()
+            requests = count * 100
+            with ValidationClient(server.url) as client:
+                t0 = time.perf_counter()
+                for _ in range(requests):
+                    client.validate(document)
+                print(f"client requests:        {requests / (time.perf_counter() - t0):,.1f}/s")
+                t0 = time.perf_counter()
+                client.validate_many([document] * requests)
+                print(f"client batch request:   {requests / (time.perf_counter() - t0):,.1f}/s")
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,50 @@
+# Items per second sorting a shuffled NDJSON file of synthetic Items in memory and with runs on disk, and merging
+# updates of a tenth of them with latest, with the peak memory allocated, measured in separate passes as tracing
+# slows it down.
+#
+#   python benchmarks/bench_sort.py [count] [memory budget in MiB]
+#
+# Peak memory should stay near the budget however large count is.
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from stac_factory.sort import sort_items
+from stac_factory.synthetic import SyntheticItems
+
+
+def measure(label: str, count: int, run: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<10} {count / seconds:,.0f} items/s, peak {peak / 2**20:,.0f} MiB")
+
+
+def main(count: int, budget: int) -> None:
+    lines = [raw.encode() + b"\n" for raw in SyntheticItems().json(count)]
+    lines = [lines[i] for i in np.random.default_rng(0).permutation(len(lines))]
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "wb") as devnull:  # noqa: PTH123
+        path, updates = Path(tmp) / "items.ndjson", Path(tmp) / "updates.ndjson"
+        path.write_bytes(b"".join(lines))
+        updates.write_bytes(b"".join(lines[: count // 10]))
+        print(f"{path.stat().st_size / 2**20:,.0f} MiB of {count:,} items")
+
+        measure("in memory", count, lambda: sort_items([path], devnull, memory=1 << 40))
+        measure("runs", count, lambda: sort_items([path], devnull, memory=budget << 20))
+        measure("latest", count, lambda: sort_items([path, updates], devnull, latest=True, memory=budget << 20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000, int(sys.argv[2]) if len(sys.argv) > 2 else 16)
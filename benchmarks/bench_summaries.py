@@ -0,0 +1,93 @@
+# Accuracy and throughput of SummaryBuilder on synthetic records with a few platforms, a tile id past the exact cap,
+# and skewed cloud cover and off-nadir angles, against exact summaries of the same values.
+#
+#   python benchmarks/bench_summaries.py [count]
+#
+# Builders of four parts are merged, as from four workers, and compared with one builder of all the records.
+
+import json
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+import numpy as np
+
+from stac_factory.projection import scan_ndjson
+from stac_factory.summaries import SummaryBuilder
+
+QUANTILES = [0.01, 0.5, 0.9, 0.99]
+
+
+def main(count: int) -> None:
+    rng = np.random.default_rng(0)
+    platforms = rng.choice(["sentinel-2a", "sentinel-2b", "sentinel-2c"], count).tolist()
+    tiles = [f"T{tile:05d}" for tile in rng.integers(0, 60_000, count)]
+    cloud_cover = np.minimum(rng.exponential(20.0, count), 100.0)
+    off_nadir = rng.gamma(2.0, 2.0, count)
+    lines = [
+        json.dumps(
+            {
+                "properties": {
+                    "platform": platform,
+                    "instruments": ["msi"],
+                    "s2:tile": tile,
+                    "eo:cloud_cover": cloud,
+                    "view:off_nadir": angle,
+                }
+            }
+        )
+        for platform, tile, cloud, angle in zip(platforms, tiles, cloud_cover.tolist(), off_nadir.tolist(), strict=True)
+    ]
+
+    def builder() -> SummaryBuilder:
+        return SummaryBuilder(
+            distinct=["platform", "instruments", "s2:tile"], numeric=["eo:cloud_cover", "view:off_nadir"]
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "items.ndjson"
+        path.write_text("\n".join(lines))
+        records = list(scan_ndjson(path, builder().projection))
+
+        start = time.perf_counter()
+        whole = builder().update(records)
+        elapsed = time.perf_counter() - start
+        print(f"sketches:  {count / elapsed:10,.0f} records/s")
+
+        # the same fields in a set or a list each, as an exact summary would be computed
+        start = time.perf_counter()
+        exact_platforms: set[str] = set()
+        exact_tiles: set[str] = set()
+        clouds: list[float] = []
+        angles: list[float] = []
+        for record in records:
+            exact_platforms.add(record.platform)  # type: ignore[attr-defined]
+            exact_tiles.add(record.s2_tile)  # type: ignore[attr-defined]
+            clouds.append(record.eo_cloud_cover)  # type: ignore[attr-defined]
+            angles.append(record.view_off_nadir)  # type: ignore[attr-defined]
+        quantiles = np.quantile(clouds, QUANTILES), np.quantile(angles, QUANTILES)
+        elapsed = time.perf_counter() - start
+        print(f"exact:     {count / elapsed:10,.0f} records/s, holding every value")
+
+        start = time.perf_counter()
+        parts = [builder().update(records[i::4]) for i in range(4)]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        print(f"4 merged:  {count / (time.perf_counter() - start):10,.0f} records/s")
+
+    estimate, exact = merged.distinct["s2:tile"].cardinality(), len(exact_tiles)
+    print(f"distinct tiles: {exact:,} exact, {estimate:,.0f} estimated ({estimate / exact - 1:+.2%})")
+    print(f"platforms: {merged.summaries()['platform']}")
+    for name, expected in zip(["eo:cloud_cover", "view:off_nadir"], quantiles, strict=True):
+        sketch = merged.numeric[name]
+        errors = [abs(sketch.quantile(q) / value - 1) for q, value in zip(QUANTILES, expected, strict=True)]  # type: ignore[operator]
+        print(f"{name}: max relative quantile error {max(errors):.2%} over {QUANTILES}")
+    if merged.summaries() != whole.summaries():
+        raise RuntimeError("merged summaries differ")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,31 @@
+# Synthetic Items per second as raw JSON and as validated Items.
+#
+#   python benchmarks/bench_synthetic.py [count]
+#
+# Raw JSON should stay well above the rate of anything it feeds, at least 100k items/s.
+
+import sys
+import time
+
+from stac_factory.synthetic import SyntheticItems
+
+
+def main(count: int) -> None:
+    t0 = time.perf_counter()
+    generator = SyntheticItems()
+    print(f"setup:      {time.perf_counter() - t0:.2f}s")
+
+    t0 = time.perf_counter()
+    size = sum(len(raw) for raw in generator.json(count))
+    elapsed = time.perf_counter() - t0
+    print(f"raw JSON:   {count / elapsed:,.0f} items/s, {size / elapsed / 1e6:,.0f} MB/s")
+
+    validated = max(count // 100, 1)
+    t0 = time.perf_counter()
+    for _ in generator.items(validated):
+        pass
+    print(f"Items:      {validated / (time.perf_counter() - t0):,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
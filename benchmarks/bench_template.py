@@ -0,0 +1,78 @@
+# Items per second created from the Sentinel-2 fixture's fields with Item.create and with an ItemTemplate.
+#
+#   python benchmarks/bench_template.py [count]
+#
+# Item.create is given Links, Assets, and Providers validated per Item, as a generator without a template does.
+
+import json
+import sys
+import time
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stac_factory.models import Asset, BBox2d, Item, Link, MultiPolygon, Provider
+from stac_factory.template import ItemTemplate
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T01WCR_20250427T000611_L2A.json"
+SHARED_RELS = {"license", "collection", "parent", "root"}
+PROVIDERS = [
+    {"name": "ESA", "description": "European Space Agency", "roles": ["producer", "licensor"], "url": "https://esa.int"}
+]
+COMMONS = {
+    "collection": "sentinel-2-c1-l2a",
+    "license": "proprietary",
+    "platform": "sentinel-2b",
+    "constellation": "sentinel-2",
+    "instruments": ["msi"],
+    "gsd": 10,
+}
+
+
+def main(count: int) -> None:
+    item_dict = json.loads(FIXTURE.read_text())
+    geometry = MultiPolygon.model_validate(item_dict["geometry"])
+    w_lon, s_lat, e_lon, n_lat = item_dict["bbox"]
+    bbox = BBox2d(w_lon=w_lon, s_lat=s_lat, e_lon=e_lon, n_lat=n_lat)
+    links = [link for link in item_dict["links"] if link["rel"] in SHARED_RELS]
+    hrefs = {name: asset["href"] for name, asset in item_dict["assets"].items()}
+    defaults = {
+        name: {key: asset[key] for key in ("title", "type", "roles") if key in asset}
+        for name, asset in item_dict["assets"].items()
+    }
+    dt = datetime(2025, 4, 27, tzinfo=timezone.utc)
+    print(f"{len(hrefs)} assets, {len(links)} shared links")
+
+    t0 = time.perf_counter()
+    for i in range(count):
+        Item.create(
+            extensions=[],
+            id=f"item-{i}",
+            geometry=geometry,
+            bbox=bbox,
+            links=[Link.model_validate(link) for link in links],
+            assets=[
+                Asset.model_validate({**defaults[name], "name": name, "href": href}) for name, href in hrefs.items()
+            ],
+            datetime=dt,
+            providers=[Provider.model_validate(provider) for provider in PROVIDERS],
+            **COMMONS,  # type: ignore[arg-type]
+        )
+    create = count / (time.perf_counter() - t0)
+    print(f"Item.create:  {create:,.0f} items/s")
+
+    template = ItemTemplate(
+        links=[Link.model_validate(link) for link in links],
+        asset_defaults=defaults,  # type: ignore[arg-type]
+        providers=[Provider.model_validate(provider) for provider in PROVIDERS],
+        **COMMONS,  # type: ignore[arg-type]
+    )
+    t0 = time.perf_counter()
+    for i in range(count):
+        template.create(id=f"item-{i}", geometry=geometry, bbox=bbox, datetime=dt, assets=hrefs)
+    templated = count / (time.perf_counter() - t0)
+    print(f"ItemTemplate: {templated:,.0f} items/s ({templated / create:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,54 @@
+# Validation time of the Sentinel-2 fixture with the URL cache warm and cold, and of its hrefs alone.
+#
+#   python benchmarks/bench_urls.py [repeat]
+#
+# Each repetition validates the Item with a different id and the same hrefs, as with Items sharing license,
+# collection, and root links.
+
+import json
+import sys
+import time
+
+from pathlib import Path
+
+from pydantic import AnyUrl, TypeAdapter
+
+from stac_factory.models import URI, Item, clear_url_cache, url_cache_info
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "S2B_T01WCR_20250427T000611_L2A.json"
+
+
+def main(repeat: int) -> None:
+    item_json = FIXTURE.read_text()
+    item_dict = json.loads(item_json)
+    hrefs = [link["href"] for link in item_dict["links"]] + [asset["href"] for asset in item_dict["assets"].values()]
+    print(f"{len(hrefs)} hrefs per item, {len(set(hrefs))} distinct")
+
+    for name, adapter in [("uncached", TypeAdapter(AnyUrl)), ("cached", TypeAdapter(URI))]:
+        clear_url_cache()
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for href in hrefs:
+                adapter.validate_python(href)
+        print(f"{name} hrefs: {(time.perf_counter() - t0) / repeat * 1e6:.1f} us per item")
+
+    documents = [json.dumps(item_dict | {"id": f"{item_dict['id']}-{i}"}) for i in range(repeat)]
+
+    t0 = time.perf_counter()
+    for document in documents:
+        clear_url_cache()
+        Item.model_validate_json(document)
+    print(f"Item, cold cache: {(time.perf_counter() - t0) / repeat * 1e6:.1f} us per item")
+
+    clear_url_cache()
+    t0 = time.perf_counter()
+    for document in documents:
+        Item.model_validate_json(document)
+    print(f"Item, warm cache: {(time.perf_counter() - t0) / repeat * 1e6:.1f} us per item")
+
+    info = url_cache_info()
+    print(f"hit rate {info.hit_rate:.1%} ({info.hits:,} hits, {info.misses:,} misses, {info.size:,} cached)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,61 @@
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from typing import Any, NamedTuple
+
+from pydantic import ValidationError
+
+from stac_factory.models import Item
+
+# Validating many Items in one process across threads, rather than a pool of processes that each hold a copy of the
+# validators and caches:
+#
+#   with ThreadPoolExecutor(max_workers=8) as executor:
+#       for result in validate_many(lines, executor):
+#           result.item or result.error
+#
+# Validation holds the GIL except in shapely, so threads scale on free-threaded builds (3.13t), where pydantic-core
+# runs without it too. Validation shares no mutable state but the URL and geometry caches, which are lru_caches and
+# thread-safe, and memoized Item properties, which are computed from frozen fields, so a race computes the same value.
+# Validation doesn't modify dicts it's given.
+
+type Document = bytes | str | Mapping[str, Any]
+
+
+class ValidationResult(NamedTuple):
+    # the Item, or why the document isn't one
+    item: Item | None
+    error: ValidationError | None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+def validate_one(document: Document) -> ValidationResult:
+    try:
+        if isinstance(document, Mapping):
+            item = Item.model_validate(dict(document))
+        else:
+            item = Item.model_validate_json(document)
+    except ValidationError as e:
+        return ValidationResult(None, e)
+    return ValidationResult(item, None)
+
+
+def _validate_chunk(documents: Sequence[Document]) -> list[ValidationResult]:
+    return [validate_one(document) for document in documents]
+
+
+def validate_many(
+    documents: Iterable[Document], executor: Executor | None = None, *, chunk_size: int = 64
+) -> list[ValidationResult]:
+    # A result for each document, Item JSON or a parsed dict, in order. Documents are validated in chunks of
+    # chunk_size on executor, e.g. a ThreadPoolExecutor, or on this thread without one. A document that isn't a valid
+    # Item has its ValidationError in its result, and any other exception is raised.
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    batch = list(documents)
+    if executor is None or len(batch) <= chunk_size:
+        return _validate_chunk(batch)
+    chunks = [batch[i : i + chunk_size] for i in range(0, len(batch), chunk_size)]
+    return [result for results in executor.map(_validate_chunk, chunks) for result in results]
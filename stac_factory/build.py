@@ -0,0 +1,265 @@
+import csv
+import importlib
+import json
+import runpy
+import time
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, count
+from pathlib import Path
+from typing import IO, Any, Literal, NamedTuple, Self
+
+from stac_factory.compression import content_suffix, open_input
+from stac_factory.dedupe import DuplicateDetector, ItemKey
+from stac_factory.models import Item
+from stac_factory.pipeline import DeadLetters, error_details, map_bounded
+from stac_factory.repair import Repair, repair_items
+from stac_factory.telemetry import Telemetry
+
+# a parsed JSON line, a CSV row, or the path of a sidecar metadata file
+type Record = dict[str, Any] | Path
+# maps a Record to Item.create keyword arguments, or to an Item, e.g. from an ItemTemplate
+type Mapper = Callable[[Record], dict[str, Any] | Item]
+type RecordFormat = Literal["jsonl", "csv", "sidecar"]
+
+
+class RecordError(NamedTuple):
+    # a JSON line or CSV row that couldn't be read, which is a failure of its own rather than of the whole build
+    error: dict[str, Any]
+
+
+class BuildResult(NamedTuple):
+    # where the record came from, e.g. "records.jsonl:12", either the Item as a JSON line or why it failed, the
+    # time taken to map, validate, and serialize it, the Item's (collection, id), and what was repaired in its geometry
+    source: str
+    line: bytes | None
+    error: dict[str, Any] | None
+    seconds: float = 0.0
+    key: ItemKey | None = None
+    repairs: tuple[Repair, ...] = ()
+
+
+class BuildStats(NamedTuple):
+    items: int
+    failures: int
+    # Items written with a repaired geometry
+    repaired: int = 0
+
+
+def load_mapper(spec: str) -> Mapper:
+    # "package.module:function", or "path/to/file.py:function"
+    module_name, _, function_name = spec.rpartition(":")
+    if not module_name or not function_name:
+        raise ValueError(f"mapper must be module:function or file.py:function, not {spec!r}")
+    if module_name.endswith(".py"):
+        mapper = runpy.run_path(module_name).get(function_name)
+    else:
+        mapper = getattr(importlib.import_module(module_name), function_name, None)
+    if not callable(mapper):
+        raise ValueError(f"{function_name!r} in {module_name!r} is not a callable")
+    return mapper  # type: ignore[no-any-return]
+
+
+class _Lines:
+    # The lines of a binary stream decoded as UTF-8. A line that can't be decoded raises UnicodeDecodeError, and
+    # iteration goes on with the next one, which it couldn't after a generator or io.TextIOWrapper raised.
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> str:
+        return next(self._stream).decode()
+
+
+def _json_record(line: bytes) -> Record | RecordError:
+    try:
+        return json.loads(line)  # type: ignore[no-any-return]
+    except ValueError as e:
+        return RecordError(error_details(e))
+
+
+def _csv_record(rows: Iterator[dict[str, Any]]) -> Record | RecordError | None:
+    # the next row, or None after the last
+    try:
+        return next(rows, None)
+    except (ValueError, csv.Error) as e:
+        return RecordError(error_details(e))
+
+
+def read_records(
+    source: Path, record_format: RecordFormat | None = None, pattern: str = "*"
+) -> Iterator[tuple[str, Record | RecordError]]:
+    # Records with their source, from a JSON lines file, a CSV file with a header, or a directory of sidecar files
+    # matching pattern. The format is inferred from the source if not given. Compressed files are decompressed as
+    # they're read. A line or row that isn't valid UTF-8, JSON, or CSV is a RecordError, and goes to the dead letters.
+    if record_format is None:
+        record_format = "sidecar" if source.is_dir() else "csv" if content_suffix(source) == ".csv" else "jsonl"
+    if record_format == "sidecar":
+        for path in sorted(source.rglob(pattern)):
+            if path.is_file():
+                yield str(path), path
+        return
+    with open_input(source) as f:
+        if record_format == "csv":
+            rows = csv.DictReader(_Lines(f))  # type: ignore[arg-type]
+            # a file without a readable header fails as a whole
+            _ = rows.fieldnames
+            # line 1 is the header
+            for number in count(2):
+                if (row := _csv_record(rows)) is None:
+                    return
+                yield f"{source}:{number}", row
+        else:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield f"{source}:{number}", _json_record(line)
+
+
+def _build(source: str, mapped: dict[str, Any] | Item, precision: int | None, seconds: float) -> BuildResult:
+    # validate and serialize a mapped record, adding the time taken to seconds
+    start = time.perf_counter()
+    try:
+        item = mapped if isinstance(mapped, Item) else Item.create(**mapped)
+        line = item.model_dump_json(context={"precision": precision}).encode() + b"\n"
+    except Exception as e:  # noqa: BLE001 - any failure of a record goes to the dead letters
+        return BuildResult(source, None, error_details(e), seconds + time.perf_counter() - start)
+    return BuildResult(source, line, None, seconds + time.perf_counter() - start, (item.collection, item.id))
+
+
+def build_one(mapper: Mapper, source: str, record: Record | RecordError, precision: int | None = None) -> BuildResult:
+    # precision rounds coordinates and bbox to that many decimal places, see Item.ser_model
+    if isinstance(record, RecordError):
+        return BuildResult(source, None, record.error)
+    start = time.perf_counter()
+    try:
+        mapped = mapper(record)
+    except Exception as e:  # noqa: BLE001
+        return BuildResult(source, None, error_details(e), time.perf_counter() - start)
+    return _build(source, mapped, precision, time.perf_counter() - start)
+
+
+def build_repaired(
+    mapper: Mapper, batch: Sequence[tuple[str, Record | RecordError]], precision: int | None = None
+) -> list[BuildResult]:
+    # build_one for each record, but with the geometries of the records mapped to Item.create arguments repaired in
+    # one pass before any are validated, see stac_factory.repair. Each result has its share of the repair's time.
+    mapped: list[tuple[str, dict[str, Any] | Item | BuildResult, float]] = []
+    for source, record in batch:
+        if isinstance(record, RecordError):
+            mapped.append((source, BuildResult(source, None, record.error), 0.0))
+            continue
+        start = time.perf_counter()
+        try:
+            mapped.append((source, mapper(record), time.perf_counter() - start))
+        except Exception as e:  # noqa: BLE001
+            mapped.append((source, BuildResult(source, None, error_details(e), time.perf_counter() - start), 0.0))
+
+    start = time.perf_counter()
+    arguments = [(i, value) for i, (_, value, _) in enumerate(mapped) if isinstance(value, dict)]
+    repairs: dict[int, tuple[Repair, ...]] = {
+        arguments[report.position][0]: report.repairs for report in repair_items([value for _, value in arguments])
+    }
+    share = (time.perf_counter() - start) / max(len(batch), 1)
+
+    results = []
+    for i, (source, value, seconds) in enumerate(mapped):
+        if isinstance(value, BuildResult):
+            results.append(value._replace(seconds=value.seconds + share))
+        else:
+            result = _build(source, value, precision, seconds + share)
+            results.append(result._replace(repairs=repairs.get(i, ())) if result.line is not None else result)
+    return results
+
+
+# the mapper of each worker process, loaded once by the pool initializer
+_worker_mapper: Mapper | None = None
+
+
+_worker_precision: int | None = None
+_worker_repair = False
+
+
+def _init_worker(spec: str, precision: int | None, repair: bool = False) -> None:  # noqa: FBT001, FBT002
+    global _worker_mapper, _worker_precision, _worker_repair  # noqa: PLW0603
+    _worker_mapper = load_mapper(spec)
+    _worker_precision = precision
+    _worker_repair = repair
+
+
+def _build_batch(batch: tuple[tuple[str, Record | RecordError], ...]) -> list[BuildResult]:
+    if _worker_repair:
+        return build_repaired(_worker_mapper, batch, _worker_precision)  # type: ignore[arg-type]
+    return [
+        build_one(_worker_mapper, source, record, _worker_precision)  # type: ignore[arg-type]
+        for source, record in batch
+    ]
+
+
+def build_items(
+    spec: str,
+    records: Iterable[tuple[str, Record | RecordError]],
+    *,
+    workers: int = 1,
+    batch_size: int = 100,
+    ordered: bool = True,
+    precision: int | None = None,
+    repair: bool = False,
+) -> Iterator[BuildResult]:
+    # Map and validate records with the mapper at spec, in batches of batch_size across worker processes. Items are
+    # serialized in the workers, so only bytes are sent back. Results are in record order if ordered, or as batches
+    # complete otherwise. At most two batches per worker are in flight. With repair, the geometries of each batch
+    # are repaired before they're validated, see build_repaired.
+    if workers <= 1:
+        mapper = load_mapper(spec)
+        if repair:
+            for batch in batched(records, batch_size):
+                yield from build_repaired(mapper, batch, precision)
+            return
+        for source, record in records:
+            yield build_one(mapper, source, record, precision)
+        return
+
+    initargs = (spec, precision, repair)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        batches = batched(records, batch_size)
+        for results in map_bounded(executor, _build_batch, batches, in_flight=2 * workers, ordered=ordered):
+            yield from results
+
+
+def _duplicate(result: BuildResult, duplicates: DuplicateDetector) -> BuildResult:
+    collection, item_id = result.key  # type: ignore[misc]
+    message = f"id {item_id!r} is already in collection {collection!r}"
+    if not duplicates.exact:
+        message += f", or is a false positive at a rate of about {duplicates.false_positive_rate:g}"
+    return result._replace(line=None, error={"type": "DuplicateItem", "message": message})
+
+
+def write_results(
+    results: Iterable[BuildResult],
+    output: IO[bytes],
+    dead_letter: Path,
+    *,
+    duplicates: DuplicateDetector | None = None,
+    telemetry: Telemetry | None = None,
+) -> BuildStats:
+    # Items as NDJSON to output, and failures as NDJSON to dead_letter, which is only created if there are any, and
+    # replaces the dead_letter of an earlier run. With duplicates, an Item whose (collection, id) was already written
+    # is a failure.
+    items = repaired = 0
+    with DeadLetters(dead_letter) as failed:
+        for result in results:
+            if duplicates is not None and result.key is not None and duplicates.seen(*result.key):
+                result = _duplicate(result, duplicates)  # noqa: PLW2901
+            if telemetry is not None:
+                telemetry.record("build", result.seconds, failures=int(result.line is None))
+            if result.line is not None:
+                output.write(result.line)
+                items += 1
+                repaired += bool(result.repairs)
+            else:
+                failed.write(result.source, result.error)
+    return BuildStats(items, failed.count, repaired)
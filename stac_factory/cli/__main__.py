@@ -1,25 +1,233 @@
 import json
+import os
+import signal
+import sys
+import threading
+import time
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import cyclopts
 
 from pydantic import ValidationError
 from rich import print as rprint
+from rich.console import Console
 
+from stac_factory.build import RecordFormat, build_items, read_records, write_results
+from stac_factory.client import default_address
+from stac_factory.compression import INPUT_ERRORS, read_input
+from stac_factory.dedupe import DuplicateDetector
+from stac_factory.migrate import migrate_lines, read_lines, write_migrated
 from stac_factory.models import Item
+from stac_factory.readers import read_feature_collection
+from stac_factory.server import ValidationServer
+from stac_factory.sort import sort_items
+from stac_factory.telemetry import Telemetry
 
 app = cyclopts.App(help="An application for validating STAC Item JSON.")
 
 
+@contextmanager
+def telemetry_report(path: Path | None, interval: float | None) -> Iterator[Telemetry | None]:
+    # a Telemetry writing JSON lines to path, with the final report when the command ends, or None if off
+    if path is None:
+        yield None
+        return
+    with path.open("w") as f:
+        telemetry = Telemetry(f, interval=interval)
+        try:
+            yield telemetry
+        finally:
+            telemetry.close()
+
+
+def record_validation(report: Telemetry | None, start: float, failures: int = 0) -> float:
+    # record the time since start, if there's a report, and return the time now
+    now = time.perf_counter()
+    if report is not None:
+        report.record("validate", now - start, failures=failures)
+    return now
+
+
+def duplicate_detector(unique: bool, memory: int, false_positive_rate: float) -> DuplicateDetector | None:  # noqa: FBT001
+    # memory in MiB
+    return DuplicateDetector(memory_budget=memory << 20, false_positive_rate=false_positive_rate) if unique else None
+
+
+@app.command
+def validate(
+    filename: Path,
+    *,
+    feature_collection: bool = False,
+    workers: int = 1,
+    unique: bool = False,
+    unique_memory: int = 512,
+    unique_false_positive_rate: float = 1e-4,
+    telemetry: Path | None = None,
+    telemetry_interval: float | None = 10.0,
+) -> None:
+    # A FeatureCollection is read from a memory map one feature at a time, optionally across worker processes.
+    # gzip, bz2, xz, and zstd files are decompressed as they're read. With unique, features repeating the
+    # (collection, id) of an earlier one are failures, found within unique_memory MiB, see DuplicateDetector.
+    if unique and not feature_collection:
+        rprint("[red]Failure:[/red] --unique requires --feature-collection, as a single Item can't be a duplicate")
+        return
+    count = 0
+    duplicates = duplicate_detector(unique, unique_memory, unique_false_positive_rate)
+    with telemetry_report(telemetry, telemetry_interval) as report:
+        if report is not None:
+            report.set_workers("validate", workers)
+        start = time.perf_counter()
+        try:
+            if feature_collection:
+                for item in read_feature_collection(filename, workers=workers):
+                    duplicate = duplicates is not None and duplicates.check(item)
+                    if duplicate:
+                        rprint(f"[red]Duplicate:[/red] feature {count}, id {item.id!r} in {item.collection!r}")
+                    count += 1
+                    # the time since the previous Item, as features are validated as they're read
+                    start = record_validation(report, start, int(duplicate))
+                if duplicates is not None and duplicates.duplicates:
+                    rprint(f"[red]Failure:[/red] {duplicates.duplicates} duplicates in {count} items")
+                else:
+                    rprint(f"[green]Success![/green] {count} items")
+            else:
+                Item.model_validate_json(read_input(filename, workers=workers))
+                record_validation(report, start)
+                rprint("[green]Success![/green]")
+        except ValidationError as e:
+            record_validation(report, start, 1)
+            rprint(f"[red]Failure:[/red] feature {count}" if feature_collection else "[red]Failure:[/red]")
+            print(e.json(indent=2))
+        except INPUT_ERRORS as e:
+            # input that can't be read, e.g. a .gz file that isn't gzip compressed, or is truncated or corrupt
+            record_validation(report, start, 1)
+            rprint("[red]Failure:[/red]")
+            print(e)
+
+
+@app.command
+def build(
+    source: Path,
+    mapper: str,
+    *,
+    output: Path | None = None,
+    dead_letter: Path = Path("dead-letter.ndjson"),
+    record_format: RecordFormat | None = None,
+    pattern: str = "*",
+    workers: int = os.cpu_count() or 1,
+    batch_size: int = 100,
+    ordered: bool = True,
+    precision: int | None = None,
+    repair: bool = False,
+    unique: bool = False,
+    unique_memory: int = 512,
+    unique_false_positive_rate: float = 1e-4,
+    telemetry: Path | None = None,
+    telemetry_interval: float | None = 10.0,
+) -> None:
+    # Build Items from the records in source with mapper, a module:function or file.py:function returning
+    # Item.create arguments or an Item, and write them as NDJSON to output, or stdout, with failures in dead_letter.
+    # With precision, coordinates and bboxes are rounded to that many decimal places. With repair, clockwise rings
+    # are reversed and Polygons crossing the antimeridian are split before validation. With unique, Items repeating
+    # the (collection, id) of an earlier one are failures, as in validate.
+    console = Console(stderr=True)
+    results = build_items(
+        mapper,
+        read_records(source, record_format, pattern),
+        workers=workers,
+        batch_size=batch_size,
+        ordered=ordered,
+        precision=precision,
+        repair=repair,
+    )
+    duplicates = duplicate_detector(unique, unique_memory, unique_false_positive_rate)
+    with telemetry_report(telemetry, telemetry_interval) as report:
+        if report is not None:
+            report.set_workers("build", workers)
+        if output is None:
+            stats = write_results(results, sys.stdout.buffer, dead_letter, duplicates=duplicates, telemetry=report)
+        else:
+            with output.open("wb") as f:
+                stats = write_results(results, f, dead_letter, duplicates=duplicates, telemetry=report)
+    console.print(f"[green]{stats.items} items[/green]")
+    if stats.repaired:
+        console.print(f"{stats.repaired} repaired")
+    if stats.failures:
+        console.print(f"[red]{stats.failures} failures[/red] in {dead_letter}")
+
+
+@app.command
+def sort(
+    inputs: list[Path],
+    *,
+    output: Path | None = None,
+    latest: bool = False,
+    memory: int = 256,
+    temp_dir: Path | None = None,
+) -> None:
+    # Write the Items in the NDJSON files inputs to output, or stdout, sorted by (collection, datetime, id), with about
+    # memory MiB of them in memory and the rest in run files in temp_dir. With latest, inputs are a snapshot and then
+    # updates, and only the line with the latest updated of each Item is written, or the last of those.
+    console = Console(stderr=True)
+    if output is None:
+        stats = sort_items(inputs, sys.stdout.buffer, latest=latest, memory=memory << 20, temp_dir=temp_dir)
+    else:
+        with output.open("wb") as f:
+            stats = sort_items(inputs, f, latest=latest, memory=memory << 20, temp_dir=temp_dir)
+    console.print(f"[green]{stats.items} items[/green]")
+    if latest:
+        console.print(f"{stats.superseded} superseded")
+
+
 @app.command
-def validate(filename: Path) -> None:
-    try:
-        Item.model_validate_json(filename.read_text())
-        rprint("[green]Success![/green]")
-    except ValidationError as e:
-        rprint("[red]Failure:[/red]")
-        print(e.json(indent=2))
+def migrate(
+    inputs: list[Path],
+    *,
+    output: Path | None = None,
+    dead_letter: Path = Path("dead-letter.ndjson"),
+    workers: int = os.cpu_count() or 1,
+    batch_size: int = 1000,
+) -> None:
+    # Migrate the STAC 1.0.0 Items in the NDJSON files inputs to 1.1.0, and write them as NDJSON to output, or stdout,
+    # in order, with Items that are already 1.1.0 as they were, and failures in dead_letter. See
+    # stac_factory.migrate for the rules.
+    console = Console(stderr=True)
+    results = migrate_lines(read_lines(inputs), workers=workers, batch_size=batch_size)
+    if output is None:
+        stats = write_migrated(results, sys.stdout.buffer, dead_letter)
+    else:
+        with output.open("wb") as f:
+            stats = write_migrated(results, f, dead_letter)
+    console.print(f"[green]{stats.items} items[/green], {stats.current} already current")
+    for rule, count in stats.rules.items():
+        console.print(f"{rule}: {count}")
+    if stats.failures:
+        console.print(f"[red]{stats.failures} failures[/red] in {dead_letter}")
+
+
+@app.command
+def serve(address: str | None = None, *, workers: int = os.cpu_count() or 1, batch_size: int = 100) -> None:
+    # Validate Items sent over HTTP to address, host:port or a Unix socket path, by default $STAC_FACTORY_ADDRESS or
+    # 127.0.0.1:8765, until SIGINT or SIGTERM, which finish the requests in progress before exiting. stac-factory-client
+    # validate is a drop-in for validate that sends the files to it.
+    console = Console(stderr=True)
+    with ValidationServer(address or default_address(), workers=workers, batch_size=batch_size) as server:
+
+        def stop(_signum: int, _frame: object) -> None:
+            # shutdown() waits for serve_forever() to return, so it can't be called on the thread running it
+            threading.Thread(target=server.shutdown).start()
+
+        handlers = {sig: signal.signal(sig, stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            console.print(f"Serving on {server.url} with {workers} workers")
+            server.serve_forever()
+        finally:
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+    console.print("Stopped")
 
 
 @app.command
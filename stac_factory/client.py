@@ -0,0 +1,118 @@
+import argparse
+import http.client
+import json
+import os
+import socket
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from stac_factory.compression import read_input
+
+# The client of the validation server started by `stac-factory serve`, and the stac-factory-client command, a drop-in
+# for `stac-factory validate` that has the server validate. It only uses the standard library, so it starts in a
+# fraction of the time of importing the models.
+#
+# An address containing a "/" is a Unix socket path, otherwise it's host:port.
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+
+def default_address() -> str:
+    return os.environ.get("STAC_FACTORY_ADDRESS", DEFAULT_ADDRESS)
+
+
+def parse_address(address: str) -> Path | tuple[str, int]:
+    if "/" in address:
+        return Path(address)
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"address must be host:port or a Unix socket path, not {address!r}")
+    return host, int(port)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: Path, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self.socket_path))
+
+
+class ValidationClient:
+    # requests over one kept-alive connection; results are {"valid": true, "id": ...} or
+    # {"valid": false, "errors": [...]}, with the errors of a pydantic ValidationError
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, *, timeout: float = 60.0) -> None:
+        parsed = parse_address(address)
+        self._connection = (
+            _UnixHTTPConnection(parsed, timeout)
+            if isinstance(parsed, Path)
+            else http.client.HTTPConnection(*parsed, timeout=timeout)
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def _request(self, method: str, path: str, body: bytes | None = None) -> bytes:
+        self._connection.request(method, path, body)
+        response = self._connection.getresponse()
+        data = response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f"{method} {path} failed with {response.status}: {data!r}")
+        return data
+
+    def health(self) -> bool:
+        return bool(json.loads(self._request("GET", "/health"))["status"] == "ok")
+
+    def validate(self, document: bytes) -> dict[str, Any]:
+        return json.loads(self._request("POST", "/validate", document))  # type: ignore[no-any-return]
+
+    def validate_many(self, documents: Iterable[bytes]) -> list[dict[str, Any]]:
+        # A result per document, in order. Documents are sent as JSON lines; a raw line break in JSON can only be
+        # whitespace, as strings escape them. A blank line isn't a document to the server, so blank documents are sent
+        # one at a time instead, and fail as invalid JSON.
+        documents = list(documents)
+        lines = [document.replace(b"\n", b" ").replace(b"\r", b" ") for document in documents if document.strip()]
+        results = iter(
+            [json.loads(line) for line in self._request("POST", "/validate/batch", b"\n".join(lines)).splitlines()]
+            if lines
+            else []
+        )
+        return [next(results) if document.strip() else self.validate(document) for document in documents]
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    # argparse rather than the cyclopts app, which would import the models
+    parser = argparse.ArgumentParser(prog="stac-factory-client", description="Validate STAC Items with a server.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    validate = commands.add_parser("validate", help="validate Item JSON files, as `stac-factory validate` does")
+    validate.add_argument("filenames", nargs="+", type=Path)
+    validate.add_argument("--address", default=None, help=f"by default $STAC_FACTORY_ADDRESS or {DEFAULT_ADDRESS}")
+    args = parser.parse_args(argv)
+
+    with ValidationClient(args.address or default_address()) as client:
+        results = client.validate_many(read_input(filename) for filename in args.filenames)
+    for filename, result in zip(args.filenames, results, strict=True):
+        prefix = f"{filename}: " if len(args.filenames) > 1 else ""
+        if result["valid"]:
+            print(f"{prefix}Success!")
+        else:
+            print(f"{prefix}Failure:")
+            print(json.dumps(result["errors"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import zlib
+
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Literal
+
+# Reading compressed input as a stream of decompressed bytes, so archives are validated without being decompressed
+# to temporary files first. gzip, bz2, and xz use the standard library; zstd needs zstandard (the "zstd" extra), which
+# is imported when a zstd file is opened. This module only imports the standard library, so the client can use it.
+#
+# Streams that are a sequence of independent, self-delimiting parts are decompressed in parallel with workers > 1:
+# zstd frames, whose compressed sizes are in their block headers, and BGZF gzip members (as written by bgzip), whose
+# sizes are in their headers. Other gzip files, including multi-member ones, have to be decompressed to find where
+# each member ends, so they're read sequentially.
+
+type Compression = Literal["gzip", "bz2", "xz", "zstd"]
+type Span = tuple[int, int]
+
+# raised opening or reading input that can't be read: ValueError for a suffix that isn't the compression, and for
+# corrupt zstd data, EOFError for a truncated file, OSError from gzip (BadGzipFile) and bz2, zlib.error from gzip, and
+# lzma.LZMAError from xz
+INPUT_ERRORS: tuple[type[Exception], ...] = (ValueError, EOFError, OSError, zlib.error, lzma.LZMAError)
+
+_MAGIC: dict[bytes, Compression] = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+_SUFFIXES: dict[str, Compression] = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd", ".zstd": "zstd"}
+
+_ZSTD_MAGIC = 0xFD2FB528
+_ZSTD_SKIPPABLE = range(0x184D2A50, 0x184D2A60)
+_BGZF_HEADER = b"\x1f\x8b\x08\x04"
+# decompressed parts in flight per worker
+_READ_AHEAD = 2
+_READ_SIZE = 1 << 17
+
+
+def detect_compression(path: Path) -> Compression | None:
+    # by the magic bytes at the start of the file; an extension claiming a compression the file doesn't have is an
+    # error, rather than a JSON error later
+    with path.open("rb") as f:
+        head = f.read(6)
+    for magic, compression in _MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    if head and (claimed := _SUFFIXES.get(path.suffix)) is not None:
+        raise ValueError(f"{path} has a {path.suffix} extension but isn't {claimed} compressed")
+    return None
+
+
+def content_suffix(path: Path) -> str:
+    # the suffix of the decompressed content, e.g. ".csv" for records.csv.gz
+    return Path(path.stem).suffix if path.suffix in _SUFFIXES else path.suffix
+
+
+def _zstandard() -> ModuleType:
+    try:
+        import zstandard  # noqa: PLC0415 - optional dependency
+    except ImportError as e:
+        raise ImportError("reading zstd files requires zstandard; install stac-factory[zstd]") from e
+    return zstandard
+
+
+def _zstd_frames(buffer: mmap.mmap) -> list[Span] | None:
+    # the byte range of each frame, from the frame and block headers, or None if the file isn't a well-formed
+    # sequence of frames, which is left to the decompressor to report
+    frames: list[Span] = []
+    offset, size = 0, len(buffer)
+    while offset < size:
+        if offset + 8 > size:
+            return None
+        magic = int.from_bytes(buffer[offset : offset + 4], "little")
+        if magic in _ZSTD_SKIPPABLE:
+            offset += 8 + int.from_bytes(buffer[offset + 4 : offset + 8], "little")
+            continue
+        if magic != _ZSTD_MAGIC:
+            return None
+        descriptor = buffer[offset + 4]
+        single_segment = descriptor >> 5 & 1
+        position = (
+            offset
+            + 5
+            + (1 - single_segment)
+            + (0, 1, 2, 4)[descriptor & 3]
+            + (single_segment, 2, 4, 8)[descriptor >> 6]
+        )
+        last = 0
+        while not last:
+            if position + 3 > size:
+                return None
+            header = int.from_bytes(buffer[position : position + 3], "little")
+            last, block_type, block_size = header & 1, header >> 1 & 3, header >> 3
+            if block_type == 3:
+                return None
+            # an RLE block is one byte repeated
+            position += 3 + (1 if block_type == 1 else block_size)
+        # the content checksum
+        position += 4 * (descriptor >> 2 & 1)
+        if position > size:
+            return None
+        frames.append((offset, position))
+        offset = position
+    return frames
+
+
+def _bgzf_members(buffer: mmap.mmap) -> list[Span] | None:
+    # the byte range of each member from the BSIZE in its "BC" extra subfield, or None if any member doesn't have one
+    members: list[Span] = []
+    offset, size = 0, len(buffer)
+    while offset < size:
+        if buffer[offset : offset + 4] != _BGZF_HEADER or offset + 12 > size:
+            return None
+        extra_end = offset + 12 + int.from_bytes(buffer[offset + 10 : offset + 12], "little")
+        position, block_size = offset + 12, None
+        while position + 4 <= extra_end:
+            length = int.from_bytes(buffer[position + 2 : position + 4], "little")
+            if buffer[position : position + 2] == b"BC" and length == 2:
+                block_size = int.from_bytes(buffer[position + 4 : position + 6], "little") + 1
+            position += 4 + length
+        if block_size is None or offset + block_size > size:
+            return None
+        members.append((offset, offset + block_size))
+        offset += block_size
+    return members
+
+
+def _gunzip(data: bytes) -> bytes:
+    return zlib.decompress(data, wbits=31)
+
+
+def _unzstd(data: bytes) -> bytes:
+    # a decompressor per frame, as they can't be shared across threads, and decompressobj doesn't need the frame to
+    # record its content size
+    zstandard = _zstandard()
+    try:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)  # type: ignore[no-any-return]
+    except zstandard.ZstdError as e:
+        raise ValueError(f"invalid zstd data: {e}") from e
+
+
+class _ZstdReader(io.RawIOBase):
+    # Decompresses zstd frames one after another, as gzip does members, raising EOFError for a truncated last frame,
+    # which zstandard's stream_reader returns what it has of instead
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        zstandard = _zstandard()
+        self._zstd_error = zstandard.ZstdError
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._frame = self._decompressor.decompressobj()
+        # whether the current frame has had any input
+        self._started = False
+        self._current = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _decompress(self, data: bytes) -> bytes:
+        output = []
+        while data:
+            self._started = True
+            output.append(self._frame.decompress(data))
+            if not self._frame.eof:
+                break
+            data = self._frame.unused_data
+            self._frame, self._started = self._decompressor.decompressobj(), False
+        return b"".join(output)
+
+    def readinto(self, b: "bytearray | memoryview") -> int:  # type: ignore[override]
+        while not self._current:
+            if not (data := self._handle.read(_READ_SIZE)):
+                if self._started:
+                    raise EOFError("zstd stream ended before the end of a frame")
+                return 0
+            try:
+                self._current = memoryview(self._decompress(data))
+            except self._zstd_error as e:
+                raise ValueError(f"invalid zstd data: {e}") from e
+        count = min(len(b), len(self._current))
+        b[:count] = self._current[:count]
+        self._current = self._current[count:]
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            self._current.release()
+            self._handle.close()
+        super().close()
+
+
+class _ParallelReader(io.RawIOBase):
+    # Decompresses the parts of a memory-mapped file on a thread pool (zlib and zstd release the GIL), in order, with
+    # at most _READ_AHEAD parts per worker decompressed ahead of the reader.
+
+    def __init__(
+        self, buffer: mmap.mmap, parts: Sequence[Span], decompress: Callable[[bytes], bytes], workers: int
+    ) -> None:
+        self._buffer = buffer
+        self._parts = iter(parts)
+        self._decompress = decompress
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending: deque[Future[bytes]] = deque()
+        for _ in range(_READ_AHEAD * workers):
+            self._submit()
+        self._current = memoryview(b"")
+
+    def _submit(self) -> None:
+        if (part := next(self._parts, None)) is not None:
+            start, end = part
+            self._pending.append(self._executor.submit(self._decompress, self._buffer[start:end]))
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: "bytearray | memoryview") -> int:  # type: ignore[override]
+        while not self._current:
+            if not self._pending:
+                return 0
+            self._current = memoryview(self._pending.popleft().result())
+            self._submit()
+        count = min(len(b), len(self._current))
+        b[:count] = self._current[:count]
+        self._current = self._current[count:]
+        return count
+
+    def close(self) -> None:
+        if not self.closed:
+            self._executor.shutdown(cancel_futures=True)
+            self._current.release()
+            self._buffer.close()
+        super().close()
+
+
+def _parallel(path: Path, compression: Compression, workers: int) -> io.BufferedIOBase | None:
+    # the map keeps its own handle on the file
+    with path.open("rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    parts = _zstd_frames(buffer) if compression == "zstd" else _bgzf_members(buffer)
+    if parts is None or len(parts) < 2:
+        buffer.close()
+        return None
+    return io.BufferedReader(_ParallelReader(buffer, parts, _unzstd if compression == "zstd" else _gunzip, workers))
+
+
+def open_input(path: Path, *, workers: int = 1) -> io.BufferedIOBase:
+    # A binary stream of the decompressed contents of path, or of path itself if it isn't compressed. With workers > 1,
+    # zstd frames and BGZF members are decompressed in parallel.
+    compression = detect_compression(path)
+    if compression is None:
+        return path.open("rb")
+    if compression == "zstd":
+        # before opening anything, if zstandard isn't installed
+        _zstandard()
+    if (
+        workers > 1
+        and compression in {"gzip", "zstd"}
+        and path.stat().st_size
+        and (reader := _parallel(path, compression, workers)) is not None
+    ):
+        return reader
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "bz2":
+        return bz2.open(path, "rb")
+    if compression == "xz":
+        return lzma.open(path, "rb")
+    return io.BufferedReader(_ZstdReader(path.open("rb")))
+
+
+def read_input(path: Path, *, workers: int = 1) -> bytes:
+    with open_input(path, workers=workers) as f:
+        return f.read()
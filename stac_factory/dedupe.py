@@ -0,0 +1,168 @@
+import hashlib
+import math
+
+from collections.abc import Iterable
+from itertools import islice
+
+import numpy as np
+import numpy.typing as npt
+
+from stac_factory.models import Item
+
+# an Item's (collection, id), which must be unique across a catalog
+type ItemKey = tuple[str | None, str]
+
+# a 16-byte digest as a bytes object (49 bytes) plus its share of the set's hash table, as measured
+_BYTES_PER_EXACT_KEY = 128
+_SPILL_BATCH = 1 << 12
+_UINT64 = (1 << 64) - 1
+
+
+def _digest(key: ItemKey) -> bytes:
+    # the collection and id separated by a byte neither can contain, so ("a", "b/c") and ("a/b", "c") differ
+    collection, item_id = key
+    return hashlib.blake2b(f"{collection or ''}\x00{item_id}".encode(), digest_size=16).digest()
+
+
+class BloomFilter:
+    # A Bloom filter of 16-byte digests in a fixed number of bits, with each digest's bits chosen by double hashing
+    # its two 64-bit halves. Membership can be a false positive, at about false_positive_rate() for the keys added.
+    # add() is plain Python, for one key at a time, and add_many() is vectorized, for batches.
+
+    def __init__(self, bits: int, hashes: int) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.count = 0
+        self._bytes = bytearray(-(-bits // 8))
+        # the same memory, for add_many
+        self._array = np.frombuffer(self._bytes, dtype=np.uint8)
+        self._steps = np.arange(hashes, dtype=np.uint64)
+
+    @classmethod
+    def for_budget(cls, memory_budget: int, false_positive_rate: float) -> "BloomFilter":
+        # memory_budget bytes, with the number of hashes that's optimal when it holds capacity keys
+        return cls(memory_budget * 8, max(1, round(-math.log2(false_positive_rate))))
+
+    @property
+    def capacity(self) -> int:
+        # the keys it holds before the false positive rate is above 2 ** -hashes
+        return int(self.bits * math.log(2) / self.hashes)
+
+    def false_positive_rate(self) -> float:
+        return float((1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes)
+
+    def add(self, digest: bytes) -> bool:
+        # add digest, returning whether it was (probably) already in the filter
+        position = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        data, bits = self._bytes, self.bits
+        present = True
+        for _ in range(self.hashes):
+            bit = position % bits
+            index, mask = bit >> 3, 1 << (bit & 7)
+            if not data[index] & mask:
+                present = False
+                data[index] |= mask
+            position = (position + step) & _UINT64
+        self.count += not present
+        return present
+
+    def add_many(self, digests: Iterable[bytes]) -> npt.NDArray[np.bool_]:
+        # add() for each digest, where a digest repeated in digests is present after its first occurrence, but one
+        # whose bits were all set by others earlier in digests isn't, which only makes false positives rarer
+        halves = np.frombuffer(b"".join(digests), dtype="<u8").reshape(-1, 2)
+        if not len(halves):
+            return np.zeros(0, dtype=bool)
+        # uint64 arithmetic wraps, as add() does
+        positions = (halves[:, :1] + self._steps * (halves[:, 1:] | np.uint64(1))) % np.uint64(self.bits)
+        indexes, masks = positions >> np.uint64(3), (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+        present = ((self._array[indexes] & masks) != 0).all(axis=1)
+
+        # a digest repeated in the batch wasn't in the filter before it, but was added by its first occurrence
+        _, first, inverse = np.unique(halves, axis=0, return_index=True, return_inverse=True)
+        present |= first[inverse.ravel()] != np.arange(len(halves))
+
+        np.bitwise_or.at(self._array, indexes.ravel(), masks.ravel())
+        self.count += int((~present).sum())
+        return present
+
+
+class DuplicateDetector:
+    # Finds Items whose (collection, id) was already seen in a run, e.g. in build or validating a FeatureCollection.
+    #
+    # Keys are kept as 16-byte digests in a set, which is exact (a collision would take around 2 ** 64 keys), until
+    # the set is over half of memory_budget. Then they move to a Bloom filter of the other half, so memory stays
+    # within the budget however many Items there are, including while moving, but a new key is reported as a
+    # duplicate at about false_positive_rate. That rate holds for up to capacity keys, about 110M with the defaults,
+    # and grows past it.
+
+    def __init__(self, *, memory_budget: int = 512 << 20, false_positive_rate: float = 1e-4) -> None:
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.memory_budget = memory_budget
+        self.false_positive_rate = false_positive_rate
+        self.max_exact_keys = memory_budget // 2 // _BYTES_PER_EXACT_KEY
+        self.duplicates = 0
+        self._exact: set[bytes] | None = set()
+        self._filter: BloomFilter | None = None
+
+    @property
+    def exact(self) -> bool:
+        # whether every duplicate reported so far is certain, rather than possibly a false positive
+        return self._filter is None
+
+    @property
+    def capacity(self) -> int:
+        if self._filter is None:
+            return BloomFilter.for_budget(self.memory_budget // 2, self.false_positive_rate).capacity
+        return self._filter.capacity
+
+    def __len__(self) -> int:
+        return len(self._exact) if self._exact is not None else self._filter.count  # type: ignore[union-attr]
+
+    def seen(self, collection: str | None, id: str) -> bool:
+        # whether (collection, id) was seen before, adding it if not
+        digest = _digest((collection, id))
+        if self._exact is None:
+            duplicate = self._filter.add(digest)  # type: ignore[union-attr]
+        elif not (duplicate := digest in self._exact):
+            self._exact.add(digest)
+            if len(self._exact) > self.max_exact_keys:
+                self._spill()
+        self.duplicates += duplicate
+        return duplicate
+
+    def check(self, item: Item) -> bool:
+        return self.seen(item.collection, item.id)
+
+    def seen_many(self, keys: Iterable[ItemKey]) -> npt.NDArray[np.bool_]:
+        # seen() for each key in turn, so a key repeated in keys is a duplicate after its first occurrence. Keys go
+        # into the exact set until it's over its half of the budget, and the rest of the batch into the filter.
+        digests = [_digest(key) for key in keys]
+        result = np.zeros(len(digests), dtype=bool)
+        exact = self._seen_exact(self._exact, digests, result) if self._exact is not None else 0
+        if exact < len(digests):
+            result[exact:] = self._filter.add_many(digests[exact:])  # type: ignore[union-attr]
+        self.duplicates += int(result.sum())
+        return result
+
+    def _seen_exact(self, exact: set[bytes], digests: list[bytes], result: npt.NDArray[np.bool_]) -> int:
+        # adds digests to the exact set, with whether each was seen in result, up to the one that takes the set over
+        # max_exact_keys and spills it, returning how many digests were added
+        for i, digest in enumerate(digests):
+            if digest in exact:
+                result[i] = True
+            else:
+                exact.add(digest)
+                if len(exact) > self.max_exact_keys:
+                    self._spill()
+                    return i + 1
+        return len(digests)
+
+    def _spill(self) -> None:
+        self._filter = BloomFilter.for_budget(self.memory_budget // 2, self.false_positive_rate)
+        # in batches, as add_many's arrays have a row of positions per digest
+        digests = iter(self._exact)  # type: ignore[arg-type]
+        while batch := list(islice(digests, _SPILL_BATCH)):
+            self._filter.add_many(batch)
+        self._exact = None
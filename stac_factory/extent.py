@@ -0,0 +1,167 @@
+import math
+
+from collections.abc import Iterable
+from datetime import datetime as Datetime  # noqa: N812
+from typing import Any, Protocol, Self
+
+from stac_factory.models import BBox2d, BBox3d, UtcDatetimeInterval, format_utc_datetime
+from stac_factory.projection import project
+
+# A Collection's extent from its Items in one pass, without keeping them, e.g. after each publish:
+#
+#   aggregator = ExtentAggregator().update(scan_ndjson(Path("items.ndjson.zst"), EXTENT_FIELDS))
+#   collection["extent"] = aggregator.extent()
+#
+# Records are Items, or projections with their bbox and datetimes. Aggregators of parts of the Items, e.g. one per
+# worker, are combined with merge(), and are picklable.
+#
+# Longitudes are on a circle, so the union of bboxes is kept in two frames: the usual one, with the seam at the
+# antimeridian, and one with longitudes in [0, 360), with the seam at the prime meridian. A bbox crossing a frame's
+# seam makes that frame cover the globe. The extent is the narrower of the two, so Items around the antimeridian give
+# a bbox crossing it (GJ 5.2) rather than one from -180 to 180. Items crossing both seams cover every longitude.
+# The temporal extent is from the earliest start_datetime, or datetime, to the latest end_datetime, or datetime.
+
+EXTENT_FIELDS = project("bbox", "datetime", "start_datetime", "end_datetime")
+
+
+class _ExtentFields(Protocol):
+    bbox: BBox2d | BBox3d | None
+    datetime: Datetime | None
+    start_datetime: Datetime | None
+    end_datetime: Datetime | None
+
+
+class _Frame:
+    # the western and eastern edges of a union of longitude intervals, or whether it covers the frame
+    __slots__ = ("east", "west", "whole")
+
+    def __init__(self) -> None:
+        self.west = math.inf
+        self.east = -math.inf
+        self.whole = False
+
+    def add(self, west: float, east: float) -> None:
+        self.west = min(self.west, west)
+        self.east = max(self.east, east)
+
+    def merge(self, other: "_Frame") -> None:
+        self.add(other.west, other.east)
+        self.whole |= other.whole
+
+    @property
+    def width(self) -> float:
+        return 360.0 if self.whole else self.east - self.west
+
+
+class ExtentAggregator:
+    # The spatial and temporal extent of the records added, in constant memory. The attributes are the running
+    # totals, with infinities before a bbox is added: the count of records, of bboxes, and of bboxes with elevations,
+    # their latitude and elevation ranges, the union of their longitudes in each frame, and the interval.
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bboxes = 0
+        self.bboxes_3d = 0
+        self.south = math.inf
+        self.north = -math.inf
+        self.bottom = math.inf
+        self.top = -math.inf
+        self.longitudes = _Frame()
+        # longitudes in [0, 360)
+        self.shifted_longitudes = _Frame()
+        self.start: Datetime | None = None
+        self.end: Datetime | None = None
+
+    def add(self, record: Any) -> None:  # noqa: ANN401
+        # an Item, or a record with its bbox, datetime, start_datetime, and end_datetime, e.g. EXTENT_FIELDS
+        fields: _ExtentFields = record
+        self.count += 1
+        if fields.bbox is not None:
+            self._add_bbox(fields.bbox)
+        self._add_interval(fields.start_datetime or fields.datetime, fields.end_datetime or fields.datetime)
+
+    def _add_bbox(self, bbox: BBox2d) -> None:
+        self.bboxes += 1
+        self.south = min(self.south, bbox.s_lat)
+        self.north = max(self.north, bbox.n_lat)
+        if isinstance(bbox, BBox3d):
+            self.bboxes_3d += 1
+            self.bottom = min(self.bottom, bbox.bottom_elevation)
+            self.top = max(self.top, bbox.top_elevation)
+
+        west, east = bbox.w_lon, bbox.e_lon
+        if bbox.crosses_antimeridian:
+            self.longitudes.whole = True
+            # continuous past 180 in [0, 360) if it doesn't cross the prime meridian too
+            if west >= 0.0 and east <= 0.0:
+                self.shifted_longitudes.add(west, east + 360.0)
+            else:
+                self.shifted_longitudes.whole = True
+            return
+        self.longitudes.add(west, east)
+        if west >= 0.0:
+            self.shifted_longitudes.add(west, east)
+        elif east <= 0.0:
+            self.shifted_longitudes.add(west + 360.0, east + 360.0)
+        else:
+            self.shifted_longitudes.whole = True
+
+    def _add_interval(self, start: Datetime | None, end: Datetime | None) -> None:
+        if start is not None and (self.start is None or start < self.start):
+            self.start = start
+        if end is not None and (self.end is None or end > self.end):
+            self.end = end
+
+    def update(self, records: Iterable[Any]) -> Self:
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: "ExtentAggregator") -> Self:
+        # the extent of both aggregators' records, as if they'd all been added to this one
+        self.count += other.count
+        self.bboxes += other.bboxes
+        self.bboxes_3d += other.bboxes_3d
+        self.south = min(self.south, other.south)
+        self.north = max(self.north, other.north)
+        self.bottom = min(self.bottom, other.bottom)
+        self.top = max(self.top, other.top)
+        self.longitudes.merge(other.longitudes)
+        self.shifted_longitudes.merge(other.shifted_longitudes)
+        self._add_interval(other.start, other.end)
+        return self
+
+    @property
+    def bbox(self) -> BBox2d | BBox3d | None:
+        # the union of the bboxes, with elevations if every bbox has them, or None without bboxes
+        if not self.bboxes:
+            return None
+        if self.longitudes.width <= self.shifted_longitudes.width:
+            west, east = (-180.0, 180.0) if self.longitudes.whole else (self.longitudes.west, self.longitudes.east)
+        else:
+            west, east = self.shifted_longitudes.west, self.shifted_longitudes.east
+            west, east = west - 360.0 if west >= 180.0 else west, east - 360.0 if east > 180.0 else east
+        if self.bboxes_3d == self.bboxes:
+            return BBox3d(
+                w_lon=west,
+                s_lat=self.south,
+                bottom_elevation=self.bottom,
+                e_lon=east,
+                n_lat=self.north,
+                top_elevation=self.top,
+            )
+        return BBox2d(w_lon=west, s_lat=self.south, e_lon=east, n_lat=self.north)
+
+    @property
+    def interval(self) -> UtcDatetimeInterval:
+        return self.start, self.end
+
+    def extent(self) -> dict[str, Any]:
+        # as a Collection's "extent", with an open interval if there are no records
+        bbox = self.bbox
+        return {
+            "spatial": {"bbox": [bbox.model_dump() if bbox is not None else [-180.0, -90.0, 180.0, 90.0]]},
+            "temporal": {
+                "interval": [[None if value is None else format_utc_datetime(value) for value in self.interval]]
+            },
+        }
@@ -0,0 +1,309 @@
+from collections.abc import Sequence
+from itertools import chain
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+
+from shapely.geometry import MultiPolygon as ShapelyMultiPolygon
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from stac_factory.models import BBox2d, BBox3d, Item, MultiPolygon, Polygon, Position
+
+# LinearRingCoordinates max_length
+MAX_RING_VERTICES = 512
+
+type Footprints = Sequence[ShapelyPolygon | ShapelyMultiPolygon] | npt.NDArray[np.object_]
+# the coordinates of a Polygon or MultiPolygon, and a bbox, as JSON values
+type QuantizedFootprint = tuple[list[Any], list[float]]
+
+
+def from_shapely(geometry: ShapelyPolygon | ShapelyMultiPolygon) -> Polygon | MultiPolygon:
+    # the exterior ring(s) only, as footprints don't have holes
+    include_z = bool(shapely.has_z(geometry))
+    if isinstance(geometry, ShapelyPolygon):
+        return Polygon.model_validate(
+            {
+                "type": "Polygon",
+                "coordinates": [shapely.get_coordinates(geometry.exterior, include_z=include_z).tolist()],
+            }
+        )
+    return MultiPolygon.model_validate(
+        {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [shapely.get_coordinates(part.exterior, include_z=include_z).tolist()] for part in geometry.geoms
+            ],
+        }
+    )
+
+
+def _parts(geometries: npt.NDArray[np.object_]) -> tuple[npt.NDArray[np.object_], npt.NDArray[np.intp]]:
+    # each Polygon, and each part of a MultiPolygon, with the index of the geometry it came from
+    return shapely.get_parts(geometries, return_index=True)
+
+
+def max_ring_vertices(geometries: Footprints) -> npt.NDArray[np.intp]:
+    # vertex count of the largest exterior ring in each geometry, including the closing vertex
+    geometries = np.asarray(geometries, dtype=object)
+    parts, index = _parts(geometries)
+    counts = np.zeros(len(geometries), dtype=np.intp)
+    np.maximum.at(counts, index, shapely.get_num_coordinates(shapely.get_exterior_ring(parts)))
+    return counts
+
+
+def _exteriors_ccw(geometries: npt.NDArray[np.object_]) -> npt.NDArray[np.object_]:
+    # rebuild each geometry from its exterior rings only, wound counter-clockwise (RFC 7946 3.1.6)
+    parts, index = _parts(geometries)
+    rings = shapely.get_exterior_ring(parts)
+    clockwise = ~shapely.is_ccw(rings)
+    rings[clockwise] = shapely.reverse(rings[clockwise])
+    polygons = shapely.polygons(rings)
+
+    result = np.empty(len(geometries), dtype=object)
+    multi = shapely.get_type_id(geometries) == shapely.GeometryType.MULTIPOLYGON
+    single = ~multi[index]
+    result[index[single]] = polygons[single]
+    if multi.any():
+        owners, dense = np.unique(index[~single], return_inverse=True)
+        result[owners] = shapely.multipolygons(polygons[~single], indices=dense)
+    return result
+
+
+def _simplify(geometries: npt.NDArray[np.object_], tolerance: npt.NDArray[np.float64]) -> npt.NDArray[np.object_]:
+    # Douglas-Peucker is an order of magnitude faster than GEOS' topology-preserving simplifier, but can collapse or
+    # split a footprint, so only those are simplified again preserving topology
+    simplified = shapely.simplify(geometries, tolerance, preserve_topology=False)
+    changed = (
+        ~shapely.is_valid(simplified)
+        | shapely.is_empty(simplified)
+        | (shapely.get_type_id(simplified) != shapely.get_type_id(geometries))
+        | (shapely.get_num_geometries(simplified) != shapely.get_num_geometries(geometries))
+    )
+    if changed.any():
+        simplified[changed] = shapely.simplify(geometries[changed], tolerance[changed], preserve_topology=True)
+    return simplified
+
+
+def simplify_footprints(
+    geometries: Footprints,
+    *,
+    max_vertices: int | None = MAX_RING_VERTICES,
+    tolerance: float = 0.0,
+    refine_steps: int = 6,
+) -> list[Polygon | MultiPolygon]:
+    # Simplify footprints in one vectorized pass so every ring fits in max_vertices, or to a fixed tolerance (in
+    # degrees) with max_vertices=None. Valid footprints stay valid.
+    #
+    # For footprints over the budget, the tolerance is doubled until they fit, then bisected refine_steps times
+    # between the last tolerance that didn't fit and the first that did, so footprints aren't simplified much more
+    # than needed.
+    if max_vertices is not None and max_vertices < 4:
+        raise ValueError("max_vertices must be at least 4, the minimum size of a linear ring")
+
+    originals = np.asarray(geometries, dtype=object)
+    tolerances = np.full(len(originals), float(tolerance))
+    simplified = _simplify(originals, tolerances) if tolerance else originals.copy()
+
+    if max_vertices is not None and (over := max_ring_vertices(simplified) > max_vertices).any():
+        # a ring with n vertices evenly spaced around a circle of radius r deviates from it by about r * (pi / n)^2 / 2
+        xmin, ymin, xmax, ymax = shapely.bounds(originals).T
+        estimate = np.hypot(xmax - xmin, ymax - ymin) / 2 * (np.pi / max_vertices) ** 2 / 2
+        fits = np.full(len(originals), np.nan)
+        misses = tolerances.copy()
+        trial = np.maximum(tolerances * 2, estimate)
+
+        while over.any():
+            rows = np.flatnonzero(over)
+            candidate = _simplify(originals[rows], trial[rows])
+            fit = max_ring_vertices(candidate) <= max_vertices
+            simplified[rows[fit]] = candidate[fit]
+            fits[rows[fit]] = trial[rows[fit]]
+            misses[rows[~fit]] = trial[rows[~fit]]
+            trial[rows[~fit]] *= 2
+            over[rows[fit]] = False
+
+        rows = np.flatnonzero(~np.isnan(fits))
+        for _ in range(refine_steps):
+            trial[rows] = (misses[rows] + fits[rows]) / 2
+            candidate = _simplify(originals[rows], trial[rows])
+            fit = max_ring_vertices(candidate) <= max_vertices
+            simplified[rows[fit]] = candidate[fit]
+            fits[rows[fit]] = trial[rows[fit]]
+            misses[rows[~fit]] = trial[rows[~fit]]
+
+    return [from_shapely(geometry) for geometry in _exteriors_ccw(simplified)]
+
+
+def simplify_footprint(
+    geometry: ShapelyPolygon | ShapelyMultiPolygon,
+    *,
+    max_vertices: int | None = MAX_RING_VERTICES,
+    tolerance: float = 0.0,
+) -> Polygon | MultiPolygon:
+    return simplify_footprints([geometry], max_vertices=max_vertices, tolerance=tolerance)[0]
+
+
+def _rings(geometries: Sequence[Polygon | MultiPolygon]) -> tuple[list[list[Position]], npt.NDArray[np.intp]]:
+    # the exterior ring of each Polygon and of each part of each MultiPolygon, with the geometry it came from
+    rings: list[list[Position]] = []
+    owners: list[int] = []
+    for i, geometry in enumerate(geometries):
+        polygons = geometry.coordinates if isinstance(geometry, MultiPolygon) else [geometry.coordinates]
+        rings.extend(polygon[0] for polygon in polygons)
+        owners.extend(i for _ in polygons)
+    return rings, np.asarray(owners, dtype=np.intp)
+
+
+def _positions(rings: list[list[Position]], count: int) -> npt.NDArray[np.float64]:
+    # one row per position, with a NaN elevation for 2D positions when 2D and 3D are mixed
+    values = np.fromiter(chain.from_iterable(chain.from_iterable(rings)), dtype=np.float64)
+    if len(values) in (2 * count, 3 * count):
+        return values.reshape(count, -1)
+    return np.array([(*p, np.nan)[:3] for p in chain.from_iterable(rings)], dtype=np.float64)
+
+
+def geometry_bounds(
+    geometries: Sequence[Polygon | MultiPolygon], *, include_elevation: bool = False
+) -> npt.NDArray[np.float64]:
+    # Rows of [w_lon, s_lat, e_lon, n_lat], or [w_lon, s_lat, bottom, e_lon, n_lat, top] with include_elevation, for
+    # each geometry, computed over all coordinates at once.
+    #
+    # A MultiPolygon split at the antimeridian (GJ 3.1.9) has a part ending at 180 and a part starting at -180, and
+    # gets a bbox with w_lon > e_lon (GJ 5.2): the western edge of its eastern part and the eastern edge of its
+    # western part.
+    if not geometries:
+        return np.empty((0, 6 if include_elevation else 4))
+    rings, owners = _rings(geometries)
+    sizes = np.fromiter(map(len, rings), dtype=np.intp, count=len(rings))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    positions = _positions(rings, int(sizes.sum()))
+    lon, lat = positions[:, 0], positions[:, 1]
+    part_w, part_e = np.minimum.reduceat(lon, starts), np.maximum.reduceat(lon, starts)
+    part_s, part_n = np.minimum.reduceat(lat, starts), np.maximum.reduceat(lat, starts)
+
+    count = len(geometries)
+    w, e = np.full(count, np.inf), np.full(count, -np.inf)
+    s, n = np.full(count, np.inf), np.full(count, -np.inf)
+    np.minimum.at(w, owners, part_w)
+    np.maximum.at(e, owners, part_e)
+    np.minimum.at(s, owners, part_s)
+    np.maximum.at(n, owners, part_n)
+
+    ends_east = (part_e == 180.0) & (part_w > -180.0)
+    starts_west = (part_w == -180.0) & (part_e < 180.0)
+    crossing = np.zeros(count, dtype=bool)
+    crossing[owners[ends_east]] = True
+    crossing &= np.isin(np.arange(count), owners[starts_west])
+    if crossing.any():
+        eastern = (part_w + part_e) / 2 > 0
+        crossing_w, crossing_e = np.full(count, np.inf), np.full(count, -np.inf)
+        np.minimum.at(crossing_w, owners[eastern], part_w[eastern])
+        np.maximum.at(crossing_e, owners[~eastern], part_e[~eastern])
+        w[crossing], e[crossing] = crossing_w[crossing], crossing_e[crossing]
+
+    if not include_elevation:
+        return np.column_stack([w, s, e, n])
+
+    z = positions[:, 2] if positions.shape[1] > 2 else np.full(len(positions), np.nan)
+    bottom, top = np.full(count, np.inf), np.full(count, -np.inf)
+    # 2D positions have NaN elevations, which fmin and fmax skip
+    np.fmin.at(bottom, owners, np.fmin.reduceat(z, starts))
+    np.fmax.at(top, owners, np.fmax.reduceat(z, starts))
+    return np.column_stack([w, s, bottom, e, n, top])
+
+
+def bboxes_from_geometries(
+    geometries: Sequence[Polygon | MultiPolygon], *, include_elevation: bool = False
+) -> list[BBox2d | BBox3d]:
+    bounds = geometry_bounds(geometries, include_elevation=include_elevation).tolist()
+    if include_elevation:
+        return [
+            BBox3d(w_lon=w, s_lat=s, bottom_elevation=bottom, e_lon=e, n_lat=n, top_elevation=top)
+            for w, s, bottom, e, n, top in bounds
+        ]
+    return [BBox2d(w_lon=w, s_lat=s, e_lon=e, n_lat=n) for w, s, e, n in bounds]
+
+
+def bbox_from_geometry(geometry: Polygon | MultiPolygon, *, include_elevation: bool = False) -> BBox2d | BBox3d:
+    return bboxes_from_geometries([geometry], include_elevation=include_elevation)[0]
+
+
+def bbox_mismatches(items: Sequence[Item], *, tolerance: float = 1e-6) -> npt.NDArray[np.bool_]:
+    # For each Item, whether its bbox differs from the bounds of its geometry by more than tolerance (in degrees) on
+    # any edge. Elevations aren't compared, as the geometry doesn't have to carry them.
+    bounds = geometry_bounds([item.geometry for item in items])
+    bboxes = np.array(
+        [(item.bbox.w_lon, item.bbox.s_lat, item.bbox.e_lon, item.bbox.n_lat) for item in items], dtype=np.float64
+    ).reshape(-1, 4)
+    return (np.abs(bboxes - bounds) > tolerance).any(axis=1)
+
+
+def quantize_footprints(
+    geometries: Sequence[Polygon | MultiPolygon], bboxes: Sequence[BBox2d | BBox3d], precision: int
+) -> list[QuantizedFootprint | None]:
+    # The coordinates and bbox of each footprint rounded to precision decimal places, rounding every coordinate of
+    # every footprint at once. Rounding can collapse or flip a small ring, so a footprint where it would make a ring
+    # invalid, change its winding, or make a 3D bbox empty is None, and is written as it is. The rounded bbox of a
+    # rounded geometry is still its bounds, as rounding preserves order.
+    if not geometries:
+        return []
+    rings, owners = _rings(geometries)
+    sizes = np.fromiter(map(len, rings), dtype=np.intp, count=len(rings))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+    positions = _positions(rings, int(sizes.sum()))
+    rounded = np.round(positions, precision)
+
+    ring_index = np.repeat(np.arange(len(rings)), sizes)
+    before = shapely.linearrings(positions[:, :2], indices=ring_index)
+    after = shapely.linearrings(rounded[:, :2], indices=ring_index)
+    changed = (shapely.is_valid(shapely.polygons(before)) & ~shapely.is_valid(shapely.polygons(after))) | (
+        shapely.is_ccw(before) != shapely.is_ccw(after)
+    )
+    failed = np.zeros(len(geometries), dtype=bool)
+    failed[owners[changed]] = True
+
+    dimensions = [len(ring[0]) for ring in rings]
+    if positions.shape[1] == 3:
+        # a ring mixing 2D and 3D positions can't be written back from one array
+        missing = np.add.reduceat(np.isnan(positions[:, 2]), starts)
+        mixed = (missing != 0) & (missing != sizes)
+        failed[owners[mixed]] = True
+
+    values = [bbox.ser_model() for bbox in bboxes]
+    flat = np.round(np.fromiter(chain.from_iterable(values), dtype=np.float64), precision).tolist()
+    rounded_bboxes: list[list[float]] = []
+    offset = 0
+    for i, bbox in enumerate(values):
+        rounded_bboxes.append(flat[offset : offset + len(bbox)])
+        offset += len(bbox)
+        if len(bbox) == 6 and rounded_bboxes[i][5] <= rounded_bboxes[i][2]:
+            failed[i] = True
+
+    ring_lists = [
+        rounded[start : start + size, :dimension].tolist()
+        for start, size, dimension in zip(starts.tolist(), sizes.tolist(), dimensions, strict=True)
+    ]
+    result: list[QuantizedFootprint | None] = []
+    ring = 0
+    for i, geometry in enumerate(geometries):
+        if isinstance(geometry, MultiPolygon):
+            parts = len(geometry.coordinates)
+            coordinates = [[exterior] for exterior in ring_lists[ring : ring + parts]]
+        else:
+            parts = 1
+            coordinates = [ring_lists[ring]]
+        ring += parts
+        result.append(None if failed[i] else (coordinates, rounded_bboxes[i]))
+    return result
+
+
+def quantized_json(items: Sequence[Item], precision: int) -> list[bytes]:
+    # each Item as JSON, with its coordinates and bbox rounded to precision decimal places as a batch
+    footprints = quantize_footprints([item.geometry for item in items], [item.bbox for item in items], precision)
+    return [
+        item.model_dump_json(context={"footprint": footprint}).encode()
+        for item, footprint in zip(items, footprints, strict=True)
+    ]
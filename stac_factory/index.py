@@ -0,0 +1,155 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import numpy.typing as npt
+import shapely
+
+from shapely import Geometry, STRtree
+
+from stac_factory.models import BBox2d, Item, MultiPolygon, Polygon
+
+# datetimes are indexed as integer microseconds since the epoch, so comparisons are exact and vectorized
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _bbox_geometries(bounds: npt.NDArray[np.float64]) -> npt.NDArray[np.object_]:
+    # vectorized BBox2d.to_shapely over rows of [w_lon, s_lat, e_lon, n_lat]
+    w_lon, s_lat, e_lon, n_lat = bounds.T
+    geometries = shapely.box(w_lon, s_lat, e_lon, n_lat)
+    if (crossing := w_lon > e_lon).any():
+        east = shapely.box(w_lon[crossing], s_lat[crossing], 180.0, n_lat[crossing])
+        west = shapely.box(-180.0, s_lat[crossing], e_lon[crossing], n_lat[crossing])
+        geometries[crossing] = shapely.multipolygons(np.stack([east, west], axis=1))
+    return geometries
+
+
+def _interval(item: Item) -> tuple[int, int]:
+    # an Item always has either a datetime or both start_datetime and end_datetime
+    start = item.start_datetime or item.datetime
+    end = item.end_datetime or item.datetime
+    return _to_micros(start), _to_micros(end)  # type: ignore[arg-type]
+
+
+class ItemIndex:
+    # A spatio-temporal index over Items for repeated "intersects this area during this time" queries.
+    #
+    # Spatially, Items are indexed by bbox (or by geometry with use_geometry=True) in a shapely STRtree. Temporally,
+    # each Item is the closed interval [start_datetime or datetime, end_datetime or datetime], indexed by its start in
+    # sorted order along with the longest interval, which bounds how far before a query window a match can start.
+    #
+    # STRtree is immutable, so inserted Items go to a pending segment that is scanned with vectorized predicates, and
+    # are merged into a rebuilt tree on the next query once there are more than rebuild_threshold of them.
+
+    def __init__(
+        self, items: Iterable[Item] = (), *, use_geometry: bool = False, rebuild_threshold: int = 10_000
+    ) -> None:
+        self.use_geometry = use_geometry
+        self.rebuild_threshold = rebuild_threshold
+
+        self._items: list[Item] = []
+        # geometries when use_geometry, otherwise bbox bounds that are turned into boxes in bulk
+        self._geometries: list[Geometry] = []
+        self._bounds: list[tuple[float, float, float, float]] = []
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+        # number of Items covered by the tree and the sorted temporal arrays; the rest are pending
+        self._indexed = 0
+        self._tree = STRtree([])
+        self._order: npt.NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._sorted_starts: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._all_ends: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._max_duration = 0
+        self._pending_shapes: npt.NDArray[np.object_] | None = None
+
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, item: Item) -> None:
+        start, end = _interval(item)
+        self._pending_shapes = None
+        self._items.append(item)
+        if self.use_geometry:
+            self._geometries.append(item.geometry.to_shapely())
+        else:
+            self._bounds.append((item.bbox.w_lon, item.bbox.s_lat, item.bbox.e_lon, item.bbox.n_lat))
+        self._starts.append(start)
+        self._ends.append(end)
+
+    def extend(self, items: Iterable[Item]) -> None:
+        for item in items:
+            self.insert(item)
+        if len(self._items) - self._indexed > self.rebuild_threshold:
+            self.build()
+
+    def _shapes(self, start: int) -> npt.NDArray[np.object_]:
+        if self.use_geometry:
+            return np.asarray(self._geometries[start:], dtype=object)
+        return _bbox_geometries(np.asarray(self._bounds[start:], dtype=np.float64).reshape(-1, 4))
+
+    def build(self) -> None:
+        self._tree = STRtree(self._shapes(0))
+        starts = np.asarray(self._starts, dtype=np.int64)
+        self._all_ends = np.asarray(self._ends, dtype=np.int64)
+        self._order = np.argsort(starts, kind="stable")
+        self._sorted_starts = starts[self._order]
+        self._max_duration = int((self._all_ends - starts).max(initial=0))
+        self._indexed = len(self._items)
+        self._pending_shapes = None
+
+    def query(
+        self,
+        area: BBox2d | Polygon | MultiPolygon | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Item]:
+        # Items intersecting area and overlapping [start, end], in insertion order; None is unbounded
+        return [self._items[i] for i in self.query_indices(area, start, end)]
+
+    def query_indices(
+        self,
+        area: BBox2d | Polygon | MultiPolygon | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> npt.NDArray[np.intp]:
+        if len(self._items) - self._indexed > self.rebuild_threshold:
+            self.build()
+
+        lo = _to_micros(start) if start is not None else np.iinfo(np.int64).min
+        hi = _to_micros(end) if end is not None else np.iinfo(np.int64).max
+
+        indexed = np.arange(self._indexed, dtype=np.intp)
+        pending = np.arange(self._indexed, len(self._items), dtype=np.intp)
+
+        if area is not None:
+            geometry = area.to_shapely()
+            indexed = np.sort(self._tree.query(geometry, predicate="intersects"))
+            if len(pending):
+                if self._pending_shapes is None:
+                    self._pending_shapes = self._shapes(self._indexed)
+                pending = pending[shapely.intersects(self._pending_shapes, geometry)]
+
+        if start is not None or end is not None:
+            indexed = np.intersect1d(indexed, self._temporal_candidates(lo, hi), assume_unique=True)
+            if len(pending):
+                offsets = pending - self._indexed
+                starts = np.asarray(self._starts[self._indexed :], dtype=np.int64)[offsets]
+                ends = np.asarray(self._ends[self._indexed :], dtype=np.int64)[offsets]
+                pending = pending[(starts <= hi) & (ends >= lo)]
+
+        return np.concatenate([indexed, pending])
+
+    def _temporal_candidates(self, lo: int, hi: int) -> npt.NDArray[np.intp]:
+        # an interval overlapping [lo, hi] starts no later than hi and no earlier than lo minus the longest interval
+        first = np.searchsorted(self._sorted_starts, max(lo - self._max_duration, np.iinfo(np.int64).min), side="left")
+        last = np.searchsorted(self._sorted_starts, hi, side="right")
+        candidates = self._order[first:last]
+        return np.sort(candidates[self._all_ends[candidates] >= lo])
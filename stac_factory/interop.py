@@ -0,0 +1,141 @@
+from datetime import datetime as Datetime  # noqa: N812
+from typing import TYPE_CHECKING, Any
+
+from stac_factory.constants import HttpMethod
+from stac_factory.models import Item, MultiPolygon, Polygon
+
+if TYPE_CHECKING:
+    import pystac
+
+# Direct conversions between Items and pystac Items. pystac is an optional dependency (the "pystac" extra), so it's
+# imported when a conversion is made.
+#
+# The alternative, pystac.Item.from_dict(item.model_dump(mode="json")), builds the whole JSON dict, which pystac deep
+# copies and migrates, and the reverse validates a dict built by to_dict(). These map each field directly: an Item is
+# already valid, so to_pystac() builds the pystac objects without the JSON dict or pystac's deep copy, copying only
+# the lists a pystac Item could change, and from_pystac() validates pystac's fields once.
+
+# the common metadata fields, which are properties in JSON, as Item groups them when serializing
+_PROPERTIES = tuple(
+    name
+    for name in Item.model_fields
+    if name not in Item._top_level | Item._exclude  # noqa: SLF001
+)
+_DATETIME_PROPERTIES = frozenset(Item._datetime_properties)  # noqa: SLF001
+# Link fields that pystac keeps as extra fields
+_LINK_FIELDS = {"description", "method", "headers", "body"}
+
+
+def _coordinates(geometry: Polygon | MultiPolygon) -> list[Any]:
+    # positions are NamedTuples, which pystac would write as they are
+    if isinstance(geometry, Polygon):
+        return [[list(position) for position in ring] for ring in geometry.coordinates]
+    return [[[list(position) for position in ring] for ring in polygon] for polygon in geometry.coordinates]
+
+
+def to_pystac(item: Item) -> "pystac.Item":
+    import pystac  # noqa: PLC0415 - optional dependency
+    import pystac.utils  # noqa: PLC0415 - optional dependency
+
+    properties: dict[str, Any] = {}
+    for name in _PROPERTIES:
+        if (value := getattr(item, name)) is None or name == "datetime":
+            continue
+        if name in _DATETIME_PROPERTIES:
+            properties[name] = pystac.utils.datetime_to_str(value)
+        elif name in {"providers", "bands"}:
+            properties[name] = [model.model_dump(mode="json") for model in value]
+        else:
+            # copied, as pystac Items are mutable and Items aren't
+            properties[name] = list(value) if isinstance(value, list) else value
+    for extension in item.extensions:
+        properties |= extension.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    result = pystac.Item(
+        id=item.id,
+        geometry={"type": item.geometry.type, "coordinates": _coordinates(item.geometry)},
+        bbox=item.bbox.ser_model(),
+        datetime=item.datetime,
+        properties=properties,
+        start_datetime=item.start_datetime,
+        end_datetime=item.end_datetime,
+        stac_extensions=list(item.stac_extensions) or [extension.id for extension in item.extensions],
+        collection=item.collection,
+        assets={
+            asset.name: pystac.Asset(
+                href=str(asset.href),
+                title=asset.title,
+                description=asset.description,
+                media_type=asset.type,
+                roles=None if asset.roles is None else list(asset.roles),
+            )
+            for asset in item.assets
+        },
+    )
+    for link in item.links:
+        extra_fields = link.model_dump(mode="json", include=_LINK_FIELDS, exclude_none=True)
+        result.add_link(
+            pystac.Link(
+                rel=link.rel,
+                target=str(link.href),
+                media_type=link.type,
+                title=link.title,
+                extra_fields=extra_fields or None,
+            )
+        )
+    return result
+
+
+def _datetime(value: Datetime | str | None) -> Datetime | None:
+    import pystac.utils  # noqa: PLC0415 - optional dependency
+
+    return pystac.utils.str_to_datetime(value) if isinstance(value, str) else value
+
+
+def _link(link: "pystac.Link") -> dict[str, Any]:
+    fields = {
+        **(link.extra_fields or {}),
+        "href": link.get_href(transform_href=False),
+        "rel": str(link.rel),
+        "type": link.media_type,
+        "title": link.title,
+    }
+    if (method := fields.get("method")) is not None:
+        # Link is strict, so it takes the enum that validating JSON would parse from the string
+        fields["method"] = HttpMethod(method)
+    return fields
+
+
+def from_pystac(item: "pystac.Item") -> Item:
+    # Validates the pystac Item's fields, including the common metadata in its properties, which Item.model_validate
+    # of its JSON would ignore. Other properties, such as extension fields, are ignored.
+    import pystac  # noqa: PLC0415 - optional dependency
+
+    properties = item.properties
+    return Item.model_validate(
+        {
+            "type": "Feature",
+            "stac_version": pystac.get_stac_version(),
+            "stac_extensions": list(item.stac_extensions),
+            "id": item.id,
+            "geometry": item.geometry,
+            "bbox": item.bbox,
+            "links": [_link(link) for link in item.links],
+            "assets": [
+                {
+                    "name": name,
+                    "href": asset.href,
+                    "title": asset.title,
+                    "description": asset.description,
+                    "type": asset.media_type,
+                    "roles": asset.roles,
+                }
+                for name, asset in item.assets.items()
+            ],
+            "collection": item.collection_id,
+            **{name: properties[name] for name in _PROPERTIES if name in properties},
+            "datetime": item.datetime,
+            "start_datetime": _datetime(properties.get("start_datetime")),
+            "end_datetime": _datetime(properties.get("end_datetime")),
+        }
+    )
@@ -0,0 +1,185 @@
+import json
+import re
+import time
+
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import batched, zip_longest
+from pathlib import Path
+from typing import IO, Any, Literal, NamedTuple
+
+from pydantic import ValidationError
+
+from stac_factory.compression import open_input
+from stac_factory.models import Item
+from stac_factory.pipeline import DeadLetters, error_details, map_bounded
+from stac_factory.projection import project
+
+# Migrating NDJSON files of STAC 1.0.0 Items to 1.1.0 in one pass, across worker processes:
+#
+# - stac_version: "1.0.0" becomes "1.1.0"
+# - bands: eo:bands and raster:bands, in properties and assets, are merged into the common bands, with the fields
+#   that aren't common prefixed, e.g. eo:common_name and raster:scale
+# - proj:code: proj:epsg becomes proj:code, e.g. 32601 is "EPSG:32601"
+# - extensions: the eo, raster, and projection schemas v1 become v2.0.0, the versions with those fields
+# - license: "various" and "proprietary", deprecated in 1.1.0, become "other"
+#
+# An Item is migrated as JSON, so the properties Item has no field for are kept, and the result is validated with
+# Item before it's written. Items that are already 1.1.0 are written as they were, after parsing only their
+# stac_version and without validating them, and Items that can't be migrated or don't validate go to the dead
+# letters, as in build.
+
+type Rule = Literal["stac_version", "bands", "proj:code", "extensions", "license"]
+RULES: tuple[Rule, ...] = ("stac_version", "bands", "proj:code", "extensions", "license")
+
+_VERSION = project("stac_version")
+_EO_BAND_FIELDS = frozenset({"common_name", "center_wavelength", "full_width_half_max", "solar_illumination"})
+# nodata, data_type, statistics, and unit are common band fields in 1.1.0
+_RASTER_BAND_FIELDS = frozenset({"sampling", "bits_per_sample", "scale", "offset", "spatial_resolution", "histogram"})
+_EXTENSION_SCHEMA = re.compile(
+    r"^https://stac-extensions\.github\.io/(eo|raster|projection)/v1\.\d+\.\d+/schema\.json$"
+)
+_DEPRECATED_LICENSES = frozenset({"various", "proprietary"})
+
+
+class MigrationResult(NamedTuple):
+    # where the Item came from, e.g. "items.ndjson:12", either its JSON line or why it failed, the time taken, and
+    # the rules applied, which are none for an Item that's already current
+    source: str
+    line: bytes | None
+    error: dict[str, Any] | None
+    seconds: float = 0.0
+    rules: tuple[Rule, ...] = ()
+
+
+class MigrationStats(NamedTuple):
+    items: int
+    # Items written as they were, as they're already 1.1.0
+    current: int
+    failures: int
+    # Items each rule changed
+    rules: Mapping[Rule, int]
+
+
+def _bands(fields: dict[str, Any]) -> bool:
+    # eo:bands and raster:bands of properties or an asset merged into bands, by position
+    eo, raster = fields.get("eo:bands"), fields.get("raster:bands")
+    if eo is None and raster is None:
+        return False
+    if "bands" in fields:
+        raise ValueError("bands is already set with eo:bands or raster:bands")
+    if eo is not None and raster is not None and len(eo) != len(raster):
+        raise ValueError(f"eo:bands has {len(eo)} bands and raster:bands {len(raster)}")
+    bands = []
+    eo_band: dict[str, Any]
+    raster_band: dict[str, Any]
+    for eo_band, raster_band in zip_longest(eo or (), raster or (), fillvalue={}):
+        band = {f"eo:{k}" if k in _EO_BAND_FIELDS else k: v for k, v in eo_band.items()}
+        band |= {f"raster:{k}" if k in _RASTER_BAND_FIELDS else k: v for k, v in raster_band.items()}
+        bands.append(band)
+    fields.pop("eo:bands", None)
+    fields.pop("raster:bands", None)
+    fields["bands"] = bands
+    return True
+
+
+def _proj_code(fields: dict[str, Any]) -> bool:
+    if "proj:epsg" not in fields:
+        return False
+    epsg = fields.pop("proj:epsg")
+    fields["proj:code"] = None if epsg is None else f"EPSG:{epsg}"
+    return True
+
+
+def migrate_item(item: dict[str, Any]) -> tuple[Rule, ...]:
+    # Migrate the JSON dict of a 1.0.0 Item to 1.1.0 in place, returning the rules that changed it
+    rules: list[Rule] = []
+    if item.get("stac_version") == "1.0.0":
+        item["stac_version"] = "1.1.0"
+        rules.append("stac_version")
+
+    properties = item.get("properties") or {}
+    assets = list((item.get("assets") or {}).values())
+    # each applied to every part, rather than stopping at the first it changes
+    if any([_bands(properties), *map(_bands, assets)]):
+        rules.append("bands")
+    if any([_proj_code(properties), *map(_proj_code, assets)]):
+        rules.append("proj:code")
+
+    extensions = item.get("stac_extensions") or []
+    migrated = [
+        _EXTENSION_SCHEMA.sub(r"https://stac-extensions.github.io/\1/v2.0.0/schema.json", x) for x in extensions
+    ]
+    if migrated != extensions:
+        item["stac_extensions"] = migrated
+        rules.append("extensions")
+
+    if properties.get("license") in _DEPRECATED_LICENSES:
+        properties["license"] = "other"
+        rules.append("license")
+    return tuple(rules)
+
+
+def migrate_line(source: str, line: bytes) -> MigrationResult:
+    start = time.perf_counter()
+    if not line.endswith(b"\n"):
+        line += b"\n"
+    try:
+        if _VERSION.model_validate_json(line).stac_version == "1.1.0":  # type: ignore[attr-defined]
+            return MigrationResult(source, line, None, time.perf_counter() - start)
+    except ValidationError:
+        pass  # reported by the validation of the whole Item
+    try:
+        item = json.loads(line)
+        rules = migrate_item(item)
+        migrated = json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+        Item.model_validate_json(migrated)
+    except Exception as e:  # noqa: BLE001 - any failure of an Item goes to the dead letters
+        return MigrationResult(source, None, error_details(e), time.perf_counter() - start)
+    return MigrationResult(source, migrated, None, time.perf_counter() - start, rules)
+
+
+def read_lines(inputs: Sequence[Path]) -> Iterator[tuple[str, bytes]]:
+    # the non-blank lines of NDJSON files, which may be compressed, with their source
+    for path in inputs:
+        with open_input(path) as stream:
+            for number, line in enumerate(stream, start=1):
+                if not line.isspace():
+                    yield f"{path}:{number}", line
+
+
+def _migrate_batch(batch: tuple[tuple[str, bytes], ...]) -> list[MigrationResult]:
+    return [migrate_line(source, line) for source, line in batch]
+
+
+def migrate_lines(
+    lines: Iterable[tuple[str, bytes]], *, workers: int = 1, batch_size: int = 1000
+) -> Iterator[MigrationResult]:
+    # migrate_line for each line, in order, in batches of batch_size across worker processes, with at most two
+    # batches per worker in flight
+    if workers <= 1:
+        for source, line in lines:
+            yield migrate_line(source, line)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in map_bounded(executor, _migrate_batch, batched(lines, batch_size), in_flight=2 * workers):
+            yield from results
+
+
+def write_migrated(results: Iterable[MigrationResult], output: IO[bytes], dead_letter: Path) -> MigrationStats:
+    # Items as NDJSON to output, and failures as NDJSON to dead_letter, which is only created if there are any, and
+    # replaces the dead_letter of an earlier run
+    items = current = 0
+    rules: Counter[Rule] = Counter()
+    with DeadLetters(dead_letter) as failed:
+        for result in results:
+            if result.line is not None:
+                output.write(result.line)
+                items += 1
+                current += not result.rules
+                rules.update(result.rules)
+            else:
+                failed.write(result.source, result.error)
+    return MigrationStats(items, current, failed.count, {rule: rules[rule] for rule in RULES})
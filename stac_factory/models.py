@@ -1,5 +1,10 @@
+import hashlib
+import json
+
+from collections.abc import Mapping
 from datetime import timezone
-from typing import Annotated, Any, Literal, NamedTuple, Self
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, NamedTuple, Self
 
 import antimeridian
 import shapely
@@ -18,6 +23,10 @@ from pydantic import (
     SerializerFunctionWrapHandler,
     Strict,
     StringConstraints,
+    ValidationError,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_serializer,
     model_validator,
@@ -27,6 +36,11 @@ from shapely.geometry import Polygon as ShapelyPolygon
 
 from stac_factory.constants import HttpMethod
 
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
+    import pystac
+
 # MD - STAC Item spec: https://github.com/radiantearth/stac-spec/blob/master/item-spec/item-spec.md
 # JS - JSON schema: https://github.com/radiantearth/stac-spec/tree/master/item-spec/json-schema
 # BP - Best Practices https://github.com/radiantearth/stac-spec/blob/master/best-practices.md
@@ -88,6 +102,57 @@ type PolygonCoordinates = Annotated[list[LinearRingCoordinates], Field(min_lengt
 type MultiPolygonCoordinates = Annotated[list[PolygonCoordinates], Field(min_length=1, max_length=2)]
 
 
+# The caches of validation outcomes below are lru_caches, which are thread-safe, and each process has its own.
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
+def _cache_info(cached: "_lru_cache_wrapper[Any]") -> CacheInfo:
+    info = cached.cache_info()
+    return CacheInfo(hits=info.hits, misses=info.misses, maxsize=info.maxsize or 0, size=info.currsize)
+
+
+# Validation outcomes of Polygon exteriors by their positions. Tile-grid products (MGRS, WRS-2, fixed L3 grids) reuse a
+# few thousand exact footprints across millions of Items, so the shapely checks run once per footprint. The key is the
+# tuple of positions, which hashes without copying the coordinates, and the outcome is the error message or None, as
+# lru_cache doesn't cache exceptions.
+GEOMETRY_CACHE_SIZE = 16_384
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _polygon_error(exterior: tuple[Position, ...]) -> str | None:
+    shapely_polygon = ShapelyPolygon([(pos.longitude, pos.latitude) for pos in exterior])
+
+    if not shapely.is_valid(shapely_polygon):
+        return f"Polygon is self-intersecting: {shapely.is_valid_reason(shapely_polygon)}"
+
+    if isinstance(antimeridian.fix_polygon(shapely_polygon, fix_winding=False), ShapelyMultiPolygon):
+        return "Polygon crosses the antimeridian; use MultiPolygon instead"
+
+    # check CCW after checking antimeridian, as they're not distinguishable other than by size
+    if not shapely.is_ccw(shapely_polygon.exterior):
+        return "Polygon exterior ring must be wound counter-clockwise (CCW) per RFC 7946"
+
+    return None
+
+
+def geometry_cache_info() -> CacheInfo:
+    return _cache_info(_polygon_error)
+
+
+def clear_geometry_cache() -> None:
+    _polygon_error.cache_clear()
+
+
 class Polygon(StacBaseModel):
     type: Literal["Polygon"]
     coordinates: PolygonCoordinates
@@ -95,26 +160,21 @@ class Polygon(StacBaseModel):
     @field_validator("coordinates")
     @classmethod
     def validate_coordinates(cls, coordinates: PolygonCoordinates) -> PolygonCoordinates:
-        exterior = [(pos.longitude, pos.latitude) for pos in coordinates[0]]
-        shapely_polygon = ShapelyPolygon(exterior)
-
-        if not shapely.is_valid(shapely_polygon):
-            raise ValueError(f"Polygon is self-intersecting: {shapely.is_valid_reason(shapely_polygon)}")
-
-        if isinstance(antimeridian.fix_polygon(shapely_polygon, fix_winding=False), ShapelyMultiPolygon):
-            raise ValueError("Polygon crosses the antimeridian; use MultiPolygon instead")
-
-        # check CCW after checking antimeridian, as they're not distinguishable other than by size
-        if not shapely.is_ccw(shapely_polygon.exterior):
-            raise ValueError("Polygon exterior ring must be wound counter-clockwise (CCW) per RFC 7946")
-
+        if (error := _polygon_error(tuple(coordinates[0]))) is not None:
+            raise ValueError(error)
         return coordinates
 
+    def to_shapely(self) -> ShapelyPolygon:
+        return ShapelyPolygon(self.coordinates[0])
+
 
 class MultiPolygon(StacBaseModel):
     type: Literal["MultiPolygon"]
     coordinates: MultiPolygonCoordinates
 
+    def to_shapely(self) -> ShapelyMultiPolygon:
+        return ShapelyMultiPolygon([ShapelyPolygon(polygon[0]) for polygon in self.coordinates])
+
     #     #     @field_validator("coordinates")
     #     #     def check_closure(cls, coordinates: List) -> List:
     #     #         """Validate that Polygon is closed (first and last coordinate are the same)."""
@@ -141,6 +201,21 @@ class BBox2d(StacBaseModel):
     def ser_model(self) -> list[float]:
         return [self.w_lon, self.s_lat, self.e_lon, self.n_lat]
 
+    @property
+    def crosses_antimeridian(self) -> bool:
+        # GJ 5.2 - a bbox crossing the antimeridian has a western edge greater than its eastern edge
+        return self.w_lon > self.e_lon
+
+    def to_shapely(self) -> ShapelyPolygon | ShapelyMultiPolygon:
+        if self.crosses_antimeridian:
+            return ShapelyMultiPolygon(
+                [
+                    shapely.box(self.w_lon, self.s_lat, 180.0, self.n_lat),
+                    shapely.box(-180.0, self.s_lat, self.e_lon, self.n_lat),
+                ]
+            )
+        return shapely.box(self.w_lon, self.s_lat, self.e_lon, self.n_lat)
+
     # TODO: loader for array
 
 
@@ -172,11 +247,44 @@ type UtcDatetime = Annotated[
     AfterValidator(lambda d: d.astimezone(timezone.utc)),
 ]
 
+
+def format_utc_datetime(value: AwareDatetime) -> str:
+    # fixed RFC 3339 form for canonical output: always UTC, always microseconds, always "Z"
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
 # todo: use for start/end?
 type UtcDatetimeInterval = tuple[UtcDatetime | None, UtcDatetime | None]
 
 
-type URI = AnyUrl
+# Validated URLs by their exact string. Hrefs repeat across Items (license and collection links, asset hrefs under one
+# bucket), and AnyUrl instances are immutable, so one can be shared by every occurrence.
+URL_CACHE_SIZE = 65_536
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse_url(value: str) -> AnyUrl:
+    return AnyUrl(value)
+
+
+def _cached_url(value: object, handler: ValidatorFunctionWrapHandler) -> AnyUrl:
+    if isinstance(value, str):
+        try:
+            return _parse_url(value)
+        except ValidationError:
+            pass  # invalid URLs aren't cached, and the handler raises the error at the right location
+    return handler(value)  # type: ignore[no-any-return]
+
+
+def url_cache_info() -> CacheInfo:
+    return _cache_info(_parse_url)
+
+
+def clear_url_cache() -> None:
+    _parse_url.cache_clear()
+
+
+type URI = Annotated[AnyUrl, WrapValidator(_cached_url)]
 
 
 # Media type regex based on RFC 6838 syntax
@@ -372,10 +480,42 @@ class ItemExtension(StacBaseModel):
         return self._id
 
 
+class ItemFingerprint(NamedTuple):
+    # hex digests of the canonical JSON of the whole Item and of each section, so callers can tell which part changed
+    content: str
+    geometry: str
+    links: str
+    assets: str
+    properties: str
+
+
+def _canonicalize(value: JSONValue) -> JSONValue:
+    # -0.0 and 0.0 are the same value, but json.dumps writes them differently
+    if isinstance(value, float):
+        return value + 0.0
+    if isinstance(value, dict):
+        return {k: _canonicalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_canonicalize(v) for v in value]
+    return value
+
+
+def canonical_dumps(value: JSONValue) -> bytes:
+    # sorted keys, no insignificant whitespace, shortest round-trip float repr, no NaN or Infinity
+    return json.dumps(
+        _canonicalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class Item(BaseModel):
     model_config = ConfigDict(extra="ignore", frozen=True)
 
-    _top_level: frozenset[str] = frozenset(
+    # ClassVars, as pydantic would otherwise make these private attributes and deep copy them into every Item
+    _top_level: ClassVar[frozenset[str]] = frozenset(
         {
             "type",
             "stac_version",
@@ -388,7 +528,18 @@ class Item(BaseModel):
         }
     )
 
-    _exclude: frozenset[str] = frozenset({"stac_extensions", "extensions"})
+    _exclude: ClassVar[frozenset[str]] = frozenset({"stac_extensions", "extensions"})
+
+    _datetime_properties: ClassVar[tuple[str, ...]] = (
+        "datetime",
+        "start_datetime",
+        "end_datetime",
+        "created",
+        "updated",
+    )
+
+    # cached_property values computed from the (frozen) fields, dropped when a copy is made with updated fields
+    _memoized: ClassVar[frozenset[str]] = frozenset({"fingerprint", "links_by_rel", "assets_by_name", "assets_by_role"})
 
     @classmethod
     def create(
@@ -452,15 +603,18 @@ class Item(BaseModel):
         )
 
     @model_serializer(mode="wrap", when_used="json")
-    def ser_model(self, nxt: SerializerFunctionWrapHandler, _info: SerializationInfo) -> dict[str, Any]:
+    def ser_model(self, nxt: SerializerFunctionWrapHandler, info: SerializationInfo) -> dict[str, Any]:
         base = nxt(self)
         item = {k: v for k, v in base.items() if k in self._top_level}
+        if info.context:
+            self._quantize(item, info.context)
         if self.stac_extensions:
             item |= {"stac_extensions": self.stac_extensions}
         else:
             item |= {"stac_extensions": [x.id for x in self.extensions]}
 
-        item["assets"] = {asset["name"]: NamelessAsset.from_an(asset) for asset in item["assets"]}
+        # the serialized assets keyed by name, rather than revalidated as NamelessAssets
+        item["assets"] = {asset.pop("name"): asset for asset in item["assets"]}
 
         properties = {k: v for k, v in base.items() if k not in self._top_level and k not in self._exclude}
         for ext in self.extensions:
@@ -469,6 +623,87 @@ class Item(BaseModel):
         item["properties"] = properties
         return item
 
+    def _quantize(self, item: dict[str, Any], context: dict[str, Any]) -> None:
+        # With a "precision" context, coordinates and bbox are rounded to that many decimal places, unless rounding
+        # would invalidate the geometry. Batch writers pass each Item's "footprint" from quantize_footprints instead.
+        if "footprint" in context:
+            footprint = context["footprint"]
+        elif (precision := context.get("precision")) is not None:
+            from stac_factory.geometry import quantize_footprints  # noqa: PLC0415 - circular
+
+            footprint = quantize_footprints([self.geometry], [self.bbox], precision)[0]
+        else:
+            return
+        if footprint is not None:
+            coordinates, bbox = footprint
+            item["geometry"] = {"type": self.geometry.type, "coordinates": coordinates}
+            item["bbox"] = bbox
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in self._memoized:
+                copy.__dict__.pop(name, None)
+        return copy
+
+    def to_pystac(self) -> "pystac.Item":
+        from stac_factory.interop import to_pystac  # noqa: PLC0415 - circular
+
+        return to_pystac(self)
+
+    @classmethod
+    def from_pystac(cls, item: "pystac.Item") -> "Item":
+        from stac_factory.interop import from_pystac  # noqa: PLC0415 - circular
+
+        return from_pystac(item)
+
+    # The canonical form, and so the fingerprint, is of the fields the Item holds, not of the JSON it was parsed from.
+    # Parsing keeps only the datetime, start_datetime, and end_datetime of the properties, so two Items that differ
+    # only in other properties, e.g. platform, updated, or eo:cloud_cover, have the same fingerprint.
+    def canonical_dict(self) -> dict[str, Any]:
+        item = self.model_dump(mode="json")
+        for name in self._datetime_properties:
+            if (value := getattr(self, name)) is not None:
+                item["properties"][name] = format_utc_datetime(value)
+        return item
+
+    def canonical_json(self) -> bytes:
+        return canonical_dumps(self.canonical_dict())
+
+    @cached_property
+    def fingerprint(self) -> ItemFingerprint:
+        item = self.canonical_dict()
+        return ItemFingerprint(
+            content=_digest(canonical_dumps(item)),
+            geometry=_digest(canonical_dumps(item["geometry"])),
+            links=_digest(canonical_dumps(item["links"])),
+            assets=_digest(canonical_dumps(item["assets"])),
+            properties=_digest(canonical_dumps(item["properties"])),
+        )
+
+    # Lookups over links and assets, built on first use, and read-only like the Item. Links and assets with the same
+    # rel or role are in the order they're in the Item. Roles can be looked up with AssetRole values, e.g.
+    # assets_by_role[AssetRole.data]. Plain dicts, so Items can still be pickled and deep copied.
+
+    @cached_property
+    def links_by_rel(self) -> Mapping[str, tuple[Link, ...]]:
+        links: dict[str, list[Link]] = {}
+        for link in self.links:
+            links.setdefault(link.rel, []).append(link)
+        return {rel: tuple(group) for rel, group in links.items()}
+
+    @cached_property
+    def assets_by_name(self) -> Mapping[str, Asset]:
+        return {asset.name: asset for asset in self.assets}
+
+    @cached_property
+    def assets_by_role(self) -> Mapping[str, tuple[Asset, ...]]:
+        assets: dict[str, list[Asset]] = {}
+        for asset in self.assets:
+            for role in asset.roles or ():
+                assets.setdefault(role, []).append(asset)
+        return {role: tuple(group) for role, group in assets.items()}
+
     extensions: list[ItemExtension] = Field(default_factory=list)
 
     # REQUIRED. Type of the GeoJSON Object. MUST be set to Feature.
@@ -522,6 +757,18 @@ class Item(BaseModel):
                     raise ValueError("BBox requires exactly 4 or 6 coordinates")
         return v
 
+    @model_validator(mode="after")
+    def validate_bbox_matches_geometry(self, info: ValidationInfo) -> Self:
+        # opt-in, as producers' bboxes are often computed differently from the geometry, e.g. before simplification:
+        # Item.model_validate(..., context={"bbox_tolerance": 1e-6}), in degrees
+        if info.context and (tolerance := info.context.get("bbox_tolerance")) is not None:
+            from stac_factory.geometry import bbox_mismatches, geometry_bounds  # noqa: PLC0415 - circular
+
+            if bbox_mismatches([self], tolerance=tolerance)[0]:
+                bounds = geometry_bounds([self.geometry])[0].tolist()
+                raise ValueError(f"bbox does not match the geometry bounds {bounds} within {tolerance}")
+        return self
+
     # REQUIRED. List of link objects to resources and related URLs. See the best practices
     # https://github.com/radiantearth/stac-spec/blob/master/best-practices.md#use-of-links
     # for details on when the use self links is strongly recommended.
@@ -537,9 +784,8 @@ class Item(BaseModel):
         if isinstance(v, list):
             return v
         if isinstance(v, dict):
-            for asset_name, asset in v.items():
-                asset["name"] = asset_name
-            return list(v.values())
+            # new dicts, leaving the caller's as they were
+            return [{**asset, "name": asset_name} for asset_name, asset in v.items()]
         return v
 
     # The id of the STAC Collection this Item references to. This field is required if a
@@ -565,9 +811,12 @@ class Item(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def validate_datetimes(cls, data: dict[str, Any]) -> dict[str, Any]:
-        for x in ["datetime", "start_datetime", "end_datetime"]:
-            if isinstance(data, dict) and (p := data.get("properties")):
-                data[x] = p.pop(x, None)
+        # moved out of a copy of properties, as the caller's dict may be validated again, or on another thread
+        if isinstance(data, dict) and isinstance(p := data.get("properties"), dict) and p:
+            properties = dict(p)
+            data = {**data, "properties": properties}
+            for x in ["datetime", "start_datetime", "end_datetime"]:
+                data[x] = properties.pop(x, None)
 
         dt = data.get("datetime")
         sdt = data.get("start_datetime")
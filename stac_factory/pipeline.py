@@ -0,0 +1,71 @@
+import json
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self
+
+from pydantic import ValidationError
+
+# The parts shared by the commands that process many records on a pool of workers, e.g. build and migrate: the
+# failure of a record as JSON, a bounded queue of batches in flight, and the dead-letter file of failures.
+
+
+def error_details(exception: Exception) -> dict[str, Any]:
+    # why a record failed, as JSON: the errors of a ValidationError, or the type and message of another exception
+    if isinstance(exception, ValidationError):
+        return {"type": "ValidationError", "errors": exception.errors(include_url=False, include_input=False)}
+    return {"type": type(exception).__name__, "message": str(exception)}
+
+
+def map_bounded[T, R](
+    executor: Executor, fn: Callable[[T], R], batches: Iterable[T], *, in_flight: int, ordered: bool = True
+) -> Iterator[R]:
+    # fn of each batch on executor, with at most in_flight batches submitted and not yet yielded, so a slow consumer
+    # doesn't buffer every result. Results are in the order of the batches, or with ordered=False, as they complete.
+    pending: deque[Future[R]] = deque()
+    for batch in batches:
+        pending.append(executor.submit(fn, batch))
+        if len(pending) < in_flight:
+            continue
+        if ordered:
+            yield pending.popleft().result()
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class DeadLetters:
+    # Failures as NDJSON lines of {"source": ..., "error": ...} to path, which is only created if there are any. The
+    # file of an earlier run is removed, so a clean run doesn't leave its failures behind.
+
+    def __init__(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        self.path = path
+        self.count = 0
+        self._file: IO[str] | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def write(self, source: str, error: dict[str, Any] | None) -> None:
+        if self._file is None:
+            self._file = self.path.open("w")
+        self._file.write(json.dumps({"source": source, "error": error}, default=str) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,102 @@
+import threading
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, AliasPath, BaseModel, BeforeValidator, ConfigDict, Field, create_model
+from pydantic.fields import FieldInfo
+
+from stac_factory.compression import open_input
+from stac_factory.models import Item, ItemExtension
+
+# Parsing only some of the fields of Item JSON, for jobs such as inventories that need each Item's id, collection,
+# bbox, and datetime, but not its geometry, links, or assets:
+#
+#   Inventory = project("id", "collection", "bbox", "datetime", "eo:cloud_cover")
+#   for record in scan_ndjson(Path("items.ndjson.zst"), Inventory):
+#       record.id, record.bbox, record.eo_cloud_cover
+#
+# A projection is a model of just the named fields, each found where it is in the JSON (at the top level, or in
+# properties) and validated as Item validates it. The JSON is parsed by pydantic-core, and the members that aren't
+# named are skipped without creating Python objects or running their validators, which is most of the cost of
+# Item.model_validate_json. Rules across fields, such as datetime being null only with start_datetime and
+# end_datetime, aren't checked, as a projection may not have the other fields.
+#
+# Fields are named as in the JSON. Extension fields, e.g. "eo:cloud_cover", are record attributes with the ":"
+# replaced by "_". Other properties need their type: project("id", properties={"s2:mgrs_tile": str}).
+
+_NOT_PROPERTIES = Item._top_level | Item._exclude  # noqa: SLF001
+# lru_cache doesn't hold its lock while a model is built, so two threads could each build one for the same fields
+_project_lock = threading.Lock()
+
+
+class ItemProjection(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+def _item_field(name: str) -> tuple[Any, FieldInfo]:
+    info = Item.model_fields[name]
+    # Item's field validators, e.g. for bbox arrays, as they're not part of the field's annotation
+    validators = [
+        BeforeValidator(decorator.func) if decorator.info.mode == "before" else AfterValidator(decorator.func)
+        for decorator in Item.__pydantic_decorators__.field_validators.values()
+        if name in decorator.info.fields
+    ]
+    annotation = Annotated[info.rebuild_annotation(), *validators] if validators else info.rebuild_annotation()
+    alias = name if name in _NOT_PROPERTIES else AliasPath("properties", name)
+    if info.default_factory is not None:
+        return annotation, Field(default_factory=info.default_factory, validation_alias=alias)  # type: ignore[arg-type]
+    return annotation, Field(info.default, validation_alias=alias)
+
+
+def _extension_fields() -> dict[str, tuple[Any, FieldInfo]]:
+    # the fields of every extension by their property name, e.g. "eo:cloud_cover"
+    fields = {}
+    for extension in ItemExtension.__subclasses__():
+        for info in extension.model_fields.values():
+            if info.alias is not None:
+                fields[info.alias] = (
+                    info.rebuild_annotation(),
+                    Field(info.default, validation_alias=AliasPath("properties", info.alias)),
+                )
+    return fields
+
+
+def _attribute(name: str) -> str:
+    return name.replace(":", "_")
+
+
+@lru_cache(maxsize=64)
+def _project(fields: tuple[str, ...], properties: tuple[tuple[str, Any], ...]) -> type[ItemProjection]:
+    extension_fields = _extension_fields()
+    definitions: dict[str, Any] = {}
+    for name in fields:
+        if name in Item.model_fields and name != "extensions":
+            definitions[name] = _item_field(name)
+        elif name in extension_fields:
+            definitions[_attribute(name)] = extension_fields[name]
+        else:
+            raise ValueError(f"{name} isn't an Item field; give its type in properties")
+    for name, annotation in properties:
+        definitions[_attribute(name)] = (annotation | None, Field(None, validation_alias=AliasPath("properties", name)))
+    return create_model("ItemProjection", __base__=ItemProjection, **definitions)
+
+
+def project(*fields: str, properties: Mapping[str, Any] | None = None) -> type[ItemProjection]:
+    # The model of the named fields, and of the properties given with their types, which are optional. The same
+    # fields give the same model.
+    if not fields and not properties:
+        raise ValueError("a projection needs at least one field")
+    with _project_lock:
+        return _project(tuple(dict.fromkeys(fields)), tuple((properties or {}).items()))
+
+
+def scan_ndjson[T: ItemProjection](path: Path, projection: type[T]) -> Iterator[T]:
+    # Each line of an NDJSON file of Items, which may be compressed, parsed as projection, in order. Blank lines are
+    # skipped, and a line that doesn't validate raises its ValidationError.
+    with open_input(path) as stream:
+        for line in stream:
+            if not line.isspace():
+                yield projection.model_validate_json(line)
@@ -0,0 +1,209 @@
+import io
+import mmap
+import re
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import batched
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from pydantic import ValidationError
+
+from stac_factory.compression import detect_compression, open_input
+from stac_factory.models import Item
+from stac_factory.pipeline import map_bounded
+
+# a JSON string (skipped whole, so brackets inside strings don't count) or a bracket
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_COLON = re.compile(rb"\s*:")
+
+_QUOTE, _BACKSLASH, _LBRACE, _RBRACE, _LBRACKET, _RBRACKET = b'"\\{}[]'
+
+# change in nesting depth for each byte
+_DEPTH = np.zeros(256, dtype=np.int8)
+_DEPTH[[_LBRACE, _LBRACKET]] = 1
+_DEPTH[[_RBRACE, _RBRACKET]] = -1
+
+_CHUNK_SIZE = 1 << 24
+
+type Span = tuple[int, int]
+# the Items of a chunk of features validated in a worker, up to the first invalid one, and its error
+type Chunk = tuple[list[Item], ValidationError | None]
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[mmap.mmap]:
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+
+def _features_offset(buffer: bytes | bytearray | mmap.mmap) -> int | None:
+    # offset just past the "[" opening the top-level "features" array, from tokens of the members before it
+    depth = 0
+    features_key = False
+    for match in _TOKEN.finditer(buffer):
+        token = buffer[match.start()]
+        if token == _QUOTE:
+            features_key = (
+                depth == 1 and match.group() == b'"features"' and _COLON.match(buffer, match.end()) is not None
+            )
+            continue
+        if features_key and token == _LBRACKET:
+            return match.end()
+        depth += _DEPTH[token]
+        features_key = False
+    return None
+
+
+def _escaped(chunk: npt.NDArray[np.uint8], *, escape_first: bool) -> tuple[npt.NDArray[np.bool_], bool]:
+    # which bytes follow an unescaped backslash, and whether the byte after the chunk does
+    escaped = np.zeros(len(chunk), dtype=bool)
+    escaped[0] = escape_first
+    skip = 0 if escape_first else -1
+    for i in np.flatnonzero(chunk == _BACKSLASH).tolist():
+        if i == skip:
+            continue
+        if i + 1 == len(chunk):
+            return escaped, True
+        escaped[i + 1] = True
+        skip = i + 1
+    return escaped, False
+
+
+def _scan(chunks: Iterable[tuple[int, bytes]]) -> Iterator[Span]:
+    # the spans of the features in chunks of the "features" array, each with its offset, starting just past the "["
+    depth, in_string, escape_first = 0, 0, False
+    start = -1
+    for offset, data in chunks:
+        chunk = np.frombuffer(data, dtype=np.uint8)
+        escaped, next_escaped = _escaped(chunk, escape_first=escape_first)
+        quotes = np.cumsum((chunk == _QUOTE) & ~escaped, dtype=np.uint8) + in_string
+
+        brackets = np.flatnonzero(_DEPTH[chunk].astype(bool) & (quotes & 1 == 0))
+        depths = np.cumsum(_DEPTH[chunk[brackets]], dtype=np.int64) + depth
+        if (closed := np.flatnonzero(depths < 0)).size:
+            brackets, depths = brackets[: closed[0]], depths[: closed[0]]
+
+        opened = brackets[(depths == 1) & (chunk[brackets] == _LBRACE)] + offset
+        ended = brackets[(depths == 0) & (chunk[brackets] == _RBRACE)] + offset + 1
+        if start >= 0:
+            opened = np.concatenate([[start], opened])
+        yield from zip(opened.tolist(), ended.tolist(), strict=False)
+        if closed.size:
+            return
+
+        start = int(opened[-1]) if len(opened) > len(ended) else -1
+        depth = int(depths[-1]) if len(depths) else depth
+        in_string, escape_first = int(quotes[-1]) & 1, next_escaped
+
+
+def feature_spans(buffer: bytes | mmap.mmap) -> Iterator[Span]:
+    # Byte offsets [start, end) of each object in the top-level "features" array of a FeatureCollection.
+    #
+    # After the array is found, the rest of the buffer is scanned in fixed-size chunks with numpy: the parity of
+    # unescaped quotes so far tells which brackets are inside strings, and the running sum of the others is the
+    # nesting depth, where each feature opens at 0 and closes back at 0. Nothing is decoded, and only one chunk is
+    # copied out of the buffer at a time.
+    if (offset := _features_offset(buffer)) is None:
+        return
+    yield from _scan((start, buffer[start : start + _CHUNK_SIZE]) for start in range(offset, len(buffer), _CHUNK_SIZE))
+
+
+def stream_features(stream: io.BufferedIOBase) -> Iterator[bytes]:
+    # The bytes of each feature of a FeatureCollection read from a stream, e.g. of decompressed input, scanned as
+    # feature_spans does. Only the chunk being scanned, and the start of a feature continuing past it, are kept.
+    buffer = bytearray()
+    while (offset := _features_offset(buffer)) is None:
+        if not (data := stream.read(_CHUNK_SIZE)):
+            return
+        buffer += data
+    # the stream offset of buffer[0], and the end of the last feature, before which the buffer can be dropped
+    base = consumed = 0
+
+    def chunks() -> Iterator[tuple[int, bytes]]:
+        nonlocal buffer, base
+        if offset < len(buffer):
+            yield offset, bytes(buffer[offset:])
+        while data := stream.read(_CHUNK_SIZE):
+            del buffer[: consumed - base]
+            base = consumed
+            buffer += data
+            yield base + len(buffer) - len(data), data
+
+    for start, end in _scan(chunks()):
+        yield bytes(buffer[start - base : end - base])
+        consumed = end
+
+
+def _validate_chunk(features: Iterable[bytes]) -> Chunk:
+    # the Items before the first invalid feature aren't lost with it
+    items: list[Item] = []
+    try:
+        # extend keeps what it appended before the error
+        items.extend(map(Item.model_validate_json, features))
+    except ValidationError as e:
+        return items, e
+    return items, None
+
+
+def _validate_spans(path: Path, spans: tuple[Span, ...]) -> Chunk:
+    with mapped(path) as mm:
+        return _validate_chunk(mm[start:end] for start, end in spans)
+
+
+def _validate_features(features: tuple[bytes, ...]) -> Chunk:
+    return _validate_chunk(features)
+
+
+def _chunk_items(chunk: Chunk) -> Iterator[Item]:
+    # the valid Items of a chunk, and then its error, so it's raised after the features before it, as without workers
+    items, error = chunk
+    yield from items
+    if error is not None:
+        raise error
+
+
+def _read_compressed(path: Path, *, workers: int, chunk_size: int) -> Iterator[Item]:
+    # features are streamed out of the decompressor, and with workers > 1, chunks of them are sent to the workers
+    if workers <= 1:
+        with open_input(path) as stream:
+            for feature in stream_features(stream):
+                yield Item.model_validate_json(feature)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # start the workers before the decompressing threads, as forking a process with threads can deadlock
+        executor.submit(int).result()
+        with open_input(path, workers=workers) as stream:
+            chunks = batched(stream_features(stream), chunk_size)
+            for chunk in map_bounded(executor, _validate_features, chunks, in_flight=2 * workers):
+                yield from _chunk_items(chunk)
+
+
+def read_feature_collection(path: Path, *, workers: int = 1, chunk_size: int = 1_000) -> Iterator[Item]:
+    # Validate each feature of a FeatureCollection file as an Item, in order, from a memory map of the file, so
+    # only one feature's bytes are copied at a time. A compressed file is decompressed as a stream, see
+    # stac_factory.compression, with its features sent to the workers rather than read from the file by them.
+    #
+    # With workers > 1, feature boundaries are still found in this process, but the contiguous byte ranges of
+    # chunk_size features are validated in worker processes that each map the file themselves. At most two chunks
+    # per worker are in flight, so a slow consumer doesn't buffer the whole collection.
+    if detect_compression(path) is not None:
+        yield from _read_compressed(path, workers=workers, chunk_size=chunk_size)
+        return
+
+    if workers <= 1:
+        with mapped(path) as mm:
+            for start, end in feature_spans(mm):
+                yield Item.model_validate_json(mm[start:end])
+        return
+
+    with mapped(path) as mm, ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = batched(feature_spans(mm), chunk_size)
+        for chunk in map_bounded(executor, partial(_validate_spans, path), chunks, in_flight=2 * workers):
+            yield from _chunk_items(chunk)
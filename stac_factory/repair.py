@@ -0,0 +1,136 @@
+from collections.abc import Sequence
+from typing import Any, Literal, NamedTuple
+
+import antimeridian
+import numpy as np
+import numpy.typing as npt
+import shapely
+
+from shapely.geometry import Polygon as ShapelyPolygon
+
+# Repairing the two geometry errors that are most often a producer's convention rather than a wrong footprint, before
+# the Items are validated, so an Item that needs it isn't validated, fixed, and validated again:
+#
+# - exterior rings wound clockwise, which are reversed (RFC 7946 3.1.6)
+# - Polygons crossing the antimeridian, which are split into a MultiPolygon (GJ 3.1.9) with antimeridian.fix_polygon
+#
+# Both are found for every ring of a batch at once. A ring crosses the antimeridian where consecutive longitudes are
+# more than 180 degrees apart, as antimeridian.fix_polygon decides, and its winding is that of the ring with its
+# longitudes unwrapped across the antimeridian, so an eastward crossing isn't mistaken for a clockwise ring. A crossing
+# ring that's clockwise is taken to be wound the wrong way, as antimeridian.fix_polygon does by default, rather than
+# to be the rest of the globe. Only the crossing Polygons, usually a small fraction, are split one at a time.
+#
+# Geometries that aren't well-formed GeoJSON Polygons or MultiPolygons, and 3D Polygons crossing the antimeridian,
+# which antimeridian.fix_polygon can't split, are left as they are for validation to report.
+
+type Repair = Literal["winding", "antimeridian"]
+
+
+class RepairReport(NamedTuple):
+    # where a repaired Item is in its batch, its id, and what was repaired
+    position: int
+    id: Any
+    repairs: tuple[Repair, ...]
+
+
+def _exteriors(geometry: Any) -> list[npt.NDArray[np.float64]] | None:  # noqa: ANN401
+    # the exterior ring of a Polygon, or of each part of a MultiPolygon, or None if it isn't one
+    if not isinstance(geometry, dict) or not isinstance(coordinates := geometry.get("coordinates"), list):
+        return None
+    polygons = [coordinates] if geometry.get("type") == "Polygon" else coordinates
+    if geometry.get("type") not in {"Polygon", "MultiPolygon"} or not polygons:
+        return None
+    rings = []
+    for polygon in polygons:
+        try:
+            ring = np.asarray(polygon[0], dtype=np.float64)
+        except (TypeError, ValueError, IndexError, KeyError):
+            return None
+        if ring.ndim != 2 or ring.shape[1] not in {2, 3} or len(ring) < 4:
+            return None
+        rings.append(ring)
+    return rings
+
+
+def _reversed(geometry: dict[str, Any], clockwise: Sequence[bool]) -> dict[str, Any]:
+    # a copy with the clockwise exteriors reversed, leaving the caller's lists as they were
+    if geometry["type"] == "Polygon":
+        return {**geometry, "coordinates": [geometry["coordinates"][0][::-1], *geometry["coordinates"][1:]]}
+    return {
+        **geometry,
+        "coordinates": [
+            [polygon[0][::-1], *polygon[1:]] if reverse else polygon
+            for polygon, reverse in zip(geometry["coordinates"], clockwise, strict=True)
+        ],
+    }
+
+
+def _split(geometry: dict[str, Any], exterior: npt.NDArray[np.float64], *, clockwise: bool) -> dict[str, Any]:
+    # winding is fixed here rather than by fix_polygon, which decides it by the wrapped coordinates and warns
+    fixed = antimeridian.fix_polygon(ShapelyPolygon(exterior[::-1] if clockwise else exterior), fix_winding=False)
+    if isinstance(fixed, ShapelyPolygon):
+        # e.g. a polygon around a pole, closed along the antimeridian
+        return {**geometry, "coordinates": [shapely.get_coordinates(fixed.exterior).tolist()]}
+    return {
+        **geometry,
+        "type": "MultiPolygon",
+        "coordinates": [[shapely.get_coordinates(part.exterior).tolist()] for part in fixed.geoms],
+    }
+
+
+def repair_geometries(geometries: Sequence[Any]) -> tuple[list[Any], list[tuple[Repair, ...]]]:
+    # Each geometry, as GeoJSON, repaired as above, and what was repaired in it. Repaired geometries are new dicts,
+    # and the others are returned as they are.
+    exteriors = [_exteriors(geometry) for geometry in geometries]
+    rings = [ring for geometry_rings in exteriors if geometry_rings is not None for ring in geometry_rings]
+    result = list(geometries)
+    repairs: list[tuple[Repair, ...]] = [()] * len(geometries)
+    if not rings:
+        return result, repairs
+
+    sizes = np.fromiter(map(len, rings), dtype=np.intp, count=len(rings))
+    ring_index = np.repeat(np.arange(len(rings)), sizes)
+    xy = np.concatenate([ring[:, :2] for ring in rings])
+
+    # +-360 at each crossing, summed along each ring, so the ring is continuous across the antimeridian
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    steps = np.diff(xy[:, 0], prepend=np.nan)
+    steps[starts] = 0.0
+    jumps = np.where(steps > 180.0, -360.0, np.where(steps < -180.0, 360.0, 0.0))
+    crossings = np.add.reduceat(jumps != 0.0, starts) > 0
+    offsets = np.cumsum(jumps)
+    offsets -= np.repeat(offsets[starts], sizes)
+    unwrapped = xy + np.column_stack([offsets, np.zeros(len(xy))])
+    clockwise = ~shapely.is_ccw(shapely.linearrings(unwrapped, indices=ring_index))
+    # a ring around a pole crosses once, or an odd number of times, and ends 360 degrees from where it started
+    # unwrapped, so it has no winding of its own: eastward, it's around the north pole, and westward the south
+    clockwise &= np.add.reduceat(jumps, starts) == 0.0
+
+    ring = 0
+    for i, geometry_rings in enumerate(exteriors):
+        if geometry_rings is None:
+            continue
+        count = len(geometry_rings)
+        geometry_clockwise = clockwise[ring : ring + count].tolist()
+        crossing = bool(crossings[ring]) and geometries[i]["type"] == "Polygon"
+        ring += count
+        if crossing and geometry_rings[0].shape[1] == 2:
+            result[i] = _split(geometries[i], geometry_rings[0], clockwise=geometry_clockwise[0])
+            repairs[i] = ("winding", "antimeridian") if geometry_clockwise[0] else ("antimeridian",)
+        elif any(geometry_clockwise) and not crossing:
+            result[i] = _reversed(geometries[i], geometry_clockwise)
+            repairs[i] = ("winding",)
+    return result, repairs
+
+
+def repair_items(items: Sequence[dict[str, Any]]) -> list[RepairReport]:
+    # Repair the geometries of Items as JSON, e.g. parsed from NDJSON or Item.create arguments, replacing each
+    # repaired "geometry" in place, and report the Items that were repaired. Geometries that are already models are
+    # valid, and left alone.
+    geometries, repairs = repair_geometries([item.get("geometry") for item in items])
+    reports = []
+    for position, (item, geometry, repaired) in enumerate(zip(items, geometries, repairs, strict=True)):
+        if repaired:
+            item["geometry"] = geometry
+            reports.append(RepairReport(position, item.get("id"), repaired))
+    return reports
@@ -0,0 +1,181 @@
+import json
+import select
+import socket
+import socketserver
+import stat
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from pydantic import ValidationError
+
+from stac_factory.client import DEFAULT_ADDRESS, parse_address
+from stac_factory.models import Item
+
+# A long-running validation service, so each validation doesn't pay for interpreter startup and building the
+# validators. Requests are HTTP over localhost TCP or a Unix socket:
+#
+#   GET  /health          {"status": "ok"}
+#   POST /validate        an Item as JSON, answered with a result: {"valid": true, "id": ...} or
+#                         {"valid": false, "errors": [...]}
+#   POST /validate/batch  Items as JSON lines, answered with a result per line, in order
+#
+# See stac_factory.client for the client.
+
+# how often idle connections check for a shutdown
+_POLL_INTERVAL = 0.5
+
+
+def _validate_document(document: bytes) -> dict[str, Any]:
+    try:
+        item = Item.model_validate_json(document)
+    except ValidationError as e:
+        # the context is in the message, and may hold the exception a validator raised, which isn't JSON
+        return {"valid": False, "errors": e.errors(include_url=False, include_input=False, include_context=False)}
+    return {"valid": True, "id": item.id}
+
+
+def validate_documents(documents: Sequence[bytes]) -> list[dict[str, Any]]:
+    return [_validate_document(document) for document in documents]
+
+
+def _dumps(result: dict[str, Any]) -> bytes:
+    return json.dumps(result).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive, so a client sends many requests over one connection
+    protocol_version = "HTTP/1.1"
+    server: "_TCPServer | _UnixServer"
+
+    def handle_one_request(self) -> None:
+        # wait for the next request without blocking, so a shutdown closes idle connections; requests aren't
+        # pipelined, so there's nothing buffered to miss
+        while not select.select([self.connection], [], [], _POLL_INTERVAL)[0]:
+            if self.server.service.closing:
+                self.close_connection = True
+                return
+        super().handle_one_request()
+        if self.server.service.closing:
+            self.close_connection = True
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, b'{"status":"ok"}')
+        else:
+            self._send(404, b'{"error":"not found"}')
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/validate":
+            self._send(200, _dumps(self.server.service.validate([body])[0]))
+        elif self.path == "/validate/batch":
+            results = self.server.service.validate([line for line in body.splitlines() if line.strip()])
+            self._send(200, b"".join(_dumps(result) + b"\n" for result in results), "application/x-ndjson")
+        else:
+            self._send(404, b'{"error":"not found"}')
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+        pass
+
+
+class _TCPHandler(_Handler):
+    # the headers and body are separate writes, which would wait on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+
+class _TCPServer(ThreadingHTTPServer):
+    # wait for requests in progress when closing
+    daemon_threads = False
+    block_on_close = True
+    service: "ValidationServer"
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = False
+    block_on_close = True
+    service: "ValidationServer"
+
+
+def _remove_stale_socket(path: Path) -> None:
+    # a socket file left by a server that didn't shut down, which no one is listening on
+    if not path.exists():
+        return
+    if not stat.S_ISSOCK(path.stat().st_mode):
+        raise ValueError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    raise ValueError(f"a server is already listening on {path}")
+
+
+class ValidationServer:
+    # Serves validation requests on a thread per connection, with batches split into chunks of batch_size across a
+    # pool of worker processes that are started, and have the validators built, before the first request. With one
+    # worker, requests are validated on their connection's thread.
+    #
+    # serve_forever() runs until shutdown() is called from another thread, e.g. a signal handler; shutdown stops
+    # accepting connections, waits for the requests in progress, and then stops the workers.
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, *, workers: int = 1, batch_size: int = 100) -> None:
+        self.address = parse_address(address)
+        self.batch_size = batch_size
+        self.closing = False
+        self._executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        if self._executor is not None:
+            # start every worker now, rather than as requests arrive
+            list(self._executor.map(validate_documents, [[]] * workers))
+        if isinstance(self.address, Path):
+            _remove_stale_socket(self.address)
+            self._server: _TCPServer | _UnixServer = _UnixServer(str(self.address), _Handler)
+        else:
+            self._server = _TCPServer(self.address, _TCPHandler)
+            # the bound port, if the given one was 0
+            self.address = self.address[0], self._server.server_address[1]
+        self._server.service = self
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        return str(self.address) if isinstance(self.address, Path) else f"{self.address[0]}:{self.address[1]}"
+
+    def validate(self, documents: Sequence[bytes]) -> list[dict[str, Any]]:
+        if self._executor is None or len(documents) <= 1:
+            return validate_documents(documents)
+        chunks = [documents[i : i + self.batch_size] for i in range(0, len(documents), self.batch_size)]
+        return [result for results in self._executor.map(validate_documents, chunks) for result in results]
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        self.closing = True
+        self._server.shutdown()
+
+    def close(self) -> None:
+        self._server.server_close()
+        if self._executor is not None:
+            self._executor.shutdown()
+        if isinstance(self.address, Path):
+            self.address.unlink(missing_ok=True)
@@ -0,0 +1,170 @@
+import heapq
+import json
+import tempfile
+
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from datetime import datetime as Datetime  # noqa: N812
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Any, NamedTuple, Protocol, cast
+
+from pydantic import ValidationError
+
+from stac_factory.compression import open_input
+from stac_factory.models import format_utc_datetime
+from stac_factory.projection import project
+
+# Sorting NDJSON files of Items by (collection, datetime, id), for reproducible output, with memory bounded however
+# large the files are. Lines are read with their sort keys, which come from a projection of the few fields they need
+# rather than validating each Item, and kept in memory until they're over the budget. Each full batch is sorted and
+# written to a run file of "<key as JSON>\t<line>" rows in a temporary directory, and the runs are merged with a
+# k-way merge, at most _FAN_IN at a time. Items with a null datetime sort by their start_datetime.
+#
+# With latest, the files are snapshots and then updates of the same Items: of the lines with the same
+# (collection, id), only the one with the latest updated is kept, and of those with the same updated (or none), the
+# last one, from the last file. That's an external sort by (collection, id, updated, position) first, so each
+# Item's lines are together, and then the survivors are sorted as without latest.
+
+_KEYS = project("id", "collection", "datetime", "start_datetime", "updated")
+
+# memory of a line's key, bytes object, and place in the batch, in addition to its bytes: about 280 measured, and
+# 370 with latest
+_RECORD_OVERHEAD = 384
+# runs merged at once, as each is an open file
+_FAN_IN = 128
+
+type Key = tuple[Any, ...]
+type Record = tuple[Key, bytes]
+
+
+class _SortFields(Protocol):
+    id: str
+    collection: str | None
+    datetime: Datetime | None
+    start_datetime: Datetime | None
+    updated: Datetime | None
+
+
+class SortStats(NamedTuple):
+    items: int
+    # lines replaced by a later update of the same Item, with latest
+    superseded: int
+
+
+def _records(paths: Sequence[Path], *, latest: bool) -> Iterator[Record]:
+    # each line with its key, by (collection, datetime, id), or with latest, by (collection, id, updated, position)
+    # followed by datetime, for sorting the survivors
+    for index, path in enumerate(paths):
+        with open_input(path) as stream:
+            for number, line in enumerate(stream, 1):
+                if line.isspace():
+                    continue
+                try:
+                    keys = cast("_SortFields", _KEYS.model_validate_json(line))
+                except ValidationError as e:
+                    raise ValueError(f"{path}:{number} isn't an Item: {e}") from e
+                if (when := keys.datetime or keys.start_datetime) is None:
+                    raise ValueError(f"{path}:{number} has neither a datetime nor a start_datetime")
+                collection, datetime = keys.collection or "", format_utc_datetime(when)
+                if not line.endswith(b"\n"):
+                    line += b"\n"  # noqa: PLW2901
+                if latest:
+                    updated = "" if keys.updated is None else format_utc_datetime(keys.updated)
+                    yield (collection, keys.id, updated, index, number, datetime), line
+                else:
+                    yield (collection, datetime, keys.id), line
+
+
+def _write_run(records: Iterable[Record], directory: Path) -> Path:
+    # keys are JSON without tabs, which are escaped in strings
+    with tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".run", delete=False) as f:
+        for key, line in records:
+            f.write(json.dumps(key).encode() + b"\t" + line)
+    return Path(f.name)
+
+
+def _read_run(f: IO[bytes]) -> Iterator[Record]:
+    for row in f:
+        key, _, line = row.partition(b"\t")
+        yield tuple(json.loads(key)), line
+
+
+def _merge(runs: Sequence[Path]) -> Iterator[Record]:
+    # stable, so records with the same key stay in the order of the runs
+    with ExitStack() as stack:
+        files = [stack.enter_context(path.open("rb")) for path in runs]
+        yield from heapq.merge(*(_read_run(f) for f in files), key=itemgetter(0))
+    for path in runs:
+        path.unlink()
+
+
+def _external_sort(records: Iterable[Record], memory: int, directory: Path) -> Iterator[Record]:
+    runs: list[Path] = []
+    batch: list[Record] = []
+    size = 0
+    for record in records:
+        batch.append(record)
+        size += len(record[1]) + _RECORD_OVERHEAD
+        if size >= memory:
+            batch.sort(key=itemgetter(0))
+            runs.append(_write_run(batch, directory))
+            batch, size = [], 0
+    batch.sort(key=itemgetter(0))
+    if not runs:
+        # released as they're consumed, e.g. by the sort of the survivors
+        batch.reverse()
+        while batch:
+            yield batch.pop()
+        return
+    if batch:
+        runs.append(_write_run(batch, directory))
+        batch = []
+    while len(runs) > _FAN_IN:
+        runs = [_write_run(_merge(runs[i : i + _FAN_IN]), directory) for i in range(0, len(runs), _FAN_IN)]
+    yield from _merge(runs)
+
+
+def _latest(records: Iterable[Record]) -> Iterator[Record]:
+    # the last of each run of records with the same (collection, id), keyed as without latest
+    previous: Record | None = None
+    for record in records:
+        if previous is not None and previous[0][:2] != record[0][:2]:
+            yield _order_key(previous)
+        previous = record
+    if previous is not None:
+        yield _order_key(previous)
+
+
+def _order_key(record: Record) -> Record:
+    (collection, item_id, _updated, _index, _number, datetime), line = record
+    return (collection, datetime, item_id), line
+
+
+def sort_items(
+    inputs: Sequence[Path],
+    output: IO[bytes],
+    *,
+    latest: bool = False,
+    memory: int = 256 << 20,
+    temp_dir: Path | None = None,
+) -> SortStats:
+    # The lines of the NDJSON files in inputs, which may be compressed, written to output sorted by
+    # (collection, datetime, id), buffering about memory bytes of them at a time, with run files in a temporary
+    # directory in temp_dir, by default the system's. With latest, only the latest line of each Item is written.
+    lines = items = 0
+
+    def counted(records: Iterable[Record]) -> Iterator[Record]:
+        nonlocal lines
+        for record in records:
+            lines += 1
+            yield record
+
+    with tempfile.TemporaryDirectory(dir=temp_dir, prefix="stac-factory-sort-") as directory:
+        records = _external_sort(counted(_records(inputs, latest=latest)), memory, Path(directory))
+        if latest:
+            records = _external_sort(_latest(records), memory, Path(directory))
+        for _, line in records:
+            output.write(line)
+            items += 1
+    return SortStats(items, lines - items)
@@ -0,0 +1,317 @@
+import hashlib
+import math
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Self
+
+import numpy as np
+
+from stac_factory.models import Item, ItemExtension, ViewExtension
+from stac_factory.projection import ItemProjection, project
+
+# A Collection's summaries from its Items in one pass, in memory that doesn't grow with the number of Items:
+#
+#   builder = SummaryBuilder()
+#   builder.update(scan_ndjson(Path("items.ndjson.zst"), builder.projection))
+#   collection["summaries"] = builder.summaries()
+#
+# Fields with distinct values, e.g. platform, are kept exactly up to a cap of distinct values, and past it only
+# counted, with a HyperLogLog. Numeric fields, e.g. gsd, are kept in a quantile sketch with their exact minimum and
+# maximum. Records are Items, or projections of the fields, and builders of parts of the Items, e.g. one per worker,
+# are combined with merge(), and are picklable, as are the sketches.
+
+DISTINCT_FIELDS = ("platform", "instruments", "constellation")
+NUMERIC_FIELDS = (
+    "gsd",
+    "eo:cloud_cover",
+    *(info.alias for info in ViewExtension.model_fields.values() if info.alias is not None),
+)
+
+_UINT64_BITS = 64
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+class HyperLogLog:
+    # The number of distinct strings added, within about 1.04 / sqrt(2 ** precision) (0.8% with the default), in
+    # 2 ** precision bytes. Each string's 64-bit hash picks a register by its first precision bits, which keeps the
+    # longest run of leading zeros of the rest, plus one. Merging takes the maximum of each register.
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self._allocate(precision, bytearray(1 << precision))
+
+    def _allocate(self, precision: int, registers: bytearray) -> None:
+        self.precision = precision
+        self._bytes = registers
+        # the same memory, for merge and cardinality
+        self.registers = np.frombuffer(self._bytes, dtype=np.uint8)
+        self._rest_bits = _UINT64_BITS - precision
+        self._rest_mask = (1 << self._rest_bits) - 1
+
+    def __getstate__(self) -> tuple[int, bytes]:
+        # the registers once, rather than the bytes and a view of them that wouldn't share memory when unpickled
+        return self.precision, bytes(self._bytes)
+
+    def __setstate__(self, state: tuple[int, bytes]) -> None:
+        precision, registers = state
+        self._allocate(precision, bytearray(registers))
+
+    def add(self, value: str) -> None:
+        h = _hash(value)
+        index = h >> self._rest_bits
+        rank = self._rest_bits - (h & self._rest_mask).bit_length() + 1
+        self._bytes[index] = max(self._bytes[index], rank)
+
+    def merge(self, other: "HyperLogLog") -> Self:
+        if other.precision != self.precision:
+            raise ValueError("HyperLogLogs with different precisions can't be merged")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def cardinality(self) -> float:
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / float(np.ldexp(1.0, -self.registers.astype(np.int32)).sum())
+        # linear counting of the empty registers for small cardinalities
+        if estimate <= 2.5 * m and (zeros := int((self.registers == 0).sum())):
+            return m * math.log(m / zeros)
+        return estimate
+
+
+class DistinctValues:
+    # The distinct strings added, exactly while there are at most cap of them, and then only their approximate
+    # count, in a HyperLogLog.
+
+    def __init__(self, cap: int = 1024, precision: int = 14) -> None:
+        self.cap = cap
+        self.precision = precision
+        self._values: set[str] | None = set()
+        # past the cap
+        self.sketch: HyperLogLog | None = None
+
+    @property
+    def exact(self) -> bool:
+        return self._values is not None
+
+    @property
+    def values(self) -> list[str] | None:
+        # sorted, or None past the cap
+        return None if self._values is None else sorted(self._values)
+
+    def cardinality(self) -> float:
+        return len(self._values) if self._values is not None else self.sketch.cardinality()  # type: ignore[union-attr]
+
+    def add(self, value: str) -> None:
+        if self._values is None:
+            self.sketch.add(value)  # type: ignore[union-attr]
+        elif value not in self._values:
+            self._values.add(value)
+            if len(self._values) > self.cap:
+                self._spill()
+
+    def merge(self, other: "DistinctValues") -> Self:
+        if other.sketch is not None:
+            if self._values is not None:
+                self._spill()
+            self.sketch.merge(other.sketch)  # type: ignore[union-attr]
+        else:
+            for value in other.values or ():
+                self.add(value)
+        return self
+
+    def _spill(self) -> None:
+        self.sketch = HyperLogLog(self.precision)
+        for value in self._values:  # type: ignore[union-attr]
+            self.sketch.add(value)
+        self._values = None
+
+
+class QuantileSketch:
+    # Quantiles of the numbers added, within relative_accuracy of the true value (a DDSketch), with the exact count,
+    # minimum, and maximum. Positive and negative numbers are counted in logarithmic buckets of their magnitude, as
+    # LatencyHistogram does, so memory grows with the range of magnitudes rather than the count, and numbers closer
+    # to 0 than 1e-9 together. Numbers are bucketed in numpy batches of _BATCH. Merging adds the counts of each
+    # bucket.
+
+    _MIN = 1e-9
+    _BATCH = 4096
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+        self.zeros = 0
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+        self._pending: list[float] = []
+
+    @property
+    def count(self) -> int:
+        return self._count + len(self._pending)
+
+    @property
+    def min(self) -> float:
+        self._flush()
+        return self._min
+
+    @property
+    def max(self) -> float:
+        self._flush()
+        return self._max
+
+    def add(self, value: float) -> None:
+        self._pending.append(value)
+        if len(self._pending) >= self._BATCH:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        values = np.array(self._pending, dtype=np.float64)
+        self._pending.clear()
+        self._count += len(values)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+        self.zeros += int((np.abs(values) < self._MIN).sum())
+        for buckets, magnitudes in [
+            (self.positive, values[values >= self._MIN]),
+            (self.negative, -values[values <= -self._MIN]),
+        ]:
+            keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64), return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist(), strict=True):
+                buckets[key] = buckets.get(key, 0) + count
+
+    def merge(self, other: "QuantileSketch") -> Self:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("QuantileSketches with different accuracies can't be merged")
+        self._flush()
+        other._flush()  # noqa: SLF001
+        for buckets, other_buckets in [(self.positive, other.positive), (self.negative, other.negative)]:
+            for key, count in other_buckets.items():
+                buckets[key] = buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self._count += other.count
+        self._min = min(self._min, other.min)
+        self._max = max(self._max, other.max)
+        return self
+
+    def _value(self, key: int) -> float:
+        # the middle of the bucket, within relative_accuracy of every number in it
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float | None:
+        # the q-th quantile, 0 <= q <= 1, or None if there are no numbers
+        self._flush()
+        if not self._count:
+            return None
+        rank = q * (self._count - 1)
+        seen = 0
+        # the negative numbers from the largest magnitude
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return max(-self._value(key), self._min)
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return min(self._value(key), self._max)
+        return self._max  # pragma: no cover - the counts add up to more than any rank
+
+
+def _extension_attributes() -> dict[type[ItemExtension], dict[str, str]]:
+    # each extension's attributes by their property name, e.g. "eo:cloud_cover"
+    return {
+        extension: {info.alias: name for name, info in extension.model_fields.items() if info.alias is not None}
+        for extension in ItemExtension.__subclasses__()
+    }
+
+
+class SummaryBuilder:
+    # Summaries of the distinct fields, whose values are strings or lists of them, e.g. instruments, and of the
+    # numeric fields. Fields are named as in the JSON, and may be any property.
+
+    def __init__(
+        self,
+        *,
+        distinct: Sequence[str] = DISTINCT_FIELDS,
+        numeric: Sequence[str] = NUMERIC_FIELDS,
+        cap: int = 1024,
+        precision: int = 14,
+        relative_accuracy: float = 0.01,
+    ) -> None:
+        self.count = 0
+        self.distinct = {name: DistinctValues(cap, precision) for name in distinct}
+        self.numeric = {name: QuantileSketch(relative_accuracy) for name in numeric}
+        self._extensions = _extension_attributes()
+        # with the attribute names of projections, e.g. eo_cloud_cover
+        self._distinct = [(name, name.replace(":", "_"), values) for name, values in self.distinct.items()]
+        self._numeric = [(name, name.replace(":", "_"), sketch) for name, sketch in self.numeric.items()]
+
+    @property
+    def projection(self) -> type[ItemProjection]:
+        # the model of the fields, for scan_ndjson, with the ones Item doesn't have as properties of their type
+        known = {*Item.model_fields, *(name for fields in self._extensions.values() for name in fields)}
+        properties: dict[str, Any] = {name: str | list[str] for name in self.distinct if name not in known}
+        properties |= {name: float for name in self.numeric if name not in known}
+        return project(*(name for name in [*self.distinct, *self.numeric] if name in known), properties=properties)
+
+    def _get(self, record: Any, name: str, attribute: str) -> Any:  # noqa: ANN401
+        # a projection's attribute, or an Item's field or extension field
+        if (value := getattr(record, attribute, None)) is not None or not isinstance(record, Item):
+            return value
+        for extension in record.extensions:
+            if (extension_attribute := self._extensions.get(type(extension), {}).get(name)) is not None:
+                return getattr(extension, extension_attribute)
+        return None
+
+    def add(self, record: Any) -> None:  # noqa: ANN401
+        self.count += 1
+        for name, attribute, values in self._distinct:
+            value = self._get(record, name, attribute)
+            if isinstance(value, str):
+                values.add(value)
+            elif isinstance(value, list):
+                for element in value:
+                    values.add(element)
+        for name, attribute, sketch in self._numeric:
+            if (value := self._get(record, name, attribute)) is not None:
+                sketch.add(value)
+
+    def update(self, records: Iterable[Any]) -> Self:
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: "SummaryBuilder") -> Self:
+        # the summaries of both builders' records, as if they'd all been added to this one
+        if self.distinct.keys() != other.distinct.keys() or self.numeric.keys() != other.numeric.keys():
+            raise ValueError("SummaryBuilders of different fields can't be merged")
+        self.count += other.count
+        for name, values in self.distinct.items():
+            values.merge(other.distinct[name])
+        for name, sketch in self.numeric.items():
+            sketch.merge(other.numeric[name])
+        return self
+
+    def summaries(self) -> dict[str, Any]:
+        # as a Collection's "summaries": the distinct values of each distinct field, and the range of each numeric
+        # field. Fields without values, and distinct fields past the cap, are left out.
+        summaries: dict[str, Any] = {}
+        for name, values in self.distinct.items():
+            if values.values:
+                summaries[name] = values.values
+        for name, sketch in self.numeric.items():
+            if sketch.count:
+                summaries[name] = {"minimum": sketch.min, "maximum": sketch.max}
+        return summaries
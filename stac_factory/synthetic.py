@@ -0,0 +1,219 @@
+import json
+
+from collections.abc import Iterator, Mapping
+from datetime import datetime as Datetime  # noqa: N812
+from datetime import timezone
+
+import numpy as np
+import numpy.typing as npt
+
+from stac_factory.geometry import MAX_RING_VERTICES
+from stac_factory.models import Item
+
+# the extensions a synthetic Item may have, with the property each sets and its range, of integers if the bounds are
+EXTENSIONS = {
+    "eo": ("https://stac-extensions.github.io/eo/v2.0.0/schema.json", "eo:cloud_cover", 0.0, 100.0),
+    "view": ("https://stac-extensions.github.io/view/v1.0.0/schema.json", "view:off_nadir", 0.0, 30.0),
+    "sat": ("https://stac-extensions.github.io/sat/v1.0.0/schema.json", "sat:relative_orbit", 1, 233),
+}
+# names and media types of assets, in the order they're added to an Item
+_ASSETS = [
+    ("thumbnail", "image/png", "thumbnail"),
+    ("metadata", "application/xml", "metadata"),
+    *(
+        (f"band-{band:02d}", "image/tiff; application=geotiff; profile=cloud-optimized", "data")
+        for band in range(1, 63)
+    ),
+]
+_RELS = ["self", "parent", "root", "collection", "alternate", "license", "via", "related"]
+# replaced by the Item id in the pre-rendered links and assets
+_ID = "\x00"
+# in a range valid for every footprint size, so a footprint never reaches a pole
+_MAX_CENTER_LAT = 80.0
+_BATCH_SIZE = 10_000
+
+
+def _iso(seconds: npt.NDArray[np.int64]) -> list[str]:
+    return [f"{value}Z" for value in np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")]
+
+
+class SyntheticItems:
+    # Seeded generator of valid synthetic Items, as models or as raw JSON, for load tests and benchmarks.
+    #
+    # Footprints are random star-shaped polygons, wound counter-clockwise, with a log-normal number of vertices
+    # (median_vertices, up to max_vertices including the closing vertex) and a fraction of MultiPolygons split at the
+    # antimeridian. The number of assets and of links are Poisson-distributed, a fraction of Items have a
+    # start_datetime/end_datetime interval instead of a datetime, and each of the EXTENSIONS is present with its own
+    # probability.
+    #
+    # A pool of footprints is rendered to JSON up front and each Item uses one of them, so raw JSON is only string
+    # formatting, with every other field drawn in numpy batches. The same seed gives the same Items.
+
+    def __init__(
+        self,
+        seed: int = 0,
+        *,
+        collection: str = "synthetic",
+        median_vertices: float = 16,
+        max_vertices: int = MAX_RING_VERTICES,
+        antimeridian_fraction: float = 0.01,
+        mean_assets: float = 8.0,
+        max_assets: int = len(_ASSETS),
+        mean_links: float = 4.0,
+        max_links: int = len(_RELS),
+        interval_fraction: float = 0.1,
+        max_interval_days: float = 30.0,
+        extension_probability: Mapping[str, float] | None = None,
+        start: Datetime = Datetime(2015, 1, 1, tzinfo=timezone.utc),
+        end: Datetime = Datetime(2025, 1, 1, tzinfo=timezone.utc),
+        footprints: int = 4_096,
+    ) -> None:
+        if not 4 <= max_vertices <= MAX_RING_VERTICES:
+            raise ValueError(f"max_vertices must be from 4 to {MAX_RING_VERTICES}")
+        if not 0 <= max_assets <= len(_ASSETS):
+            raise ValueError(f"max_assets must be from 0 to {len(_ASSETS)}")
+        if not 0 <= max_links <= len(_RELS):
+            raise ValueError(f"max_links must be from 0 to {len(_RELS)}")
+        extension_probability = {"eo": 0.8, "view": 0.5} if extension_probability is None else extension_probability
+        if unknown := set(extension_probability) - set(EXTENSIONS):
+            raise ValueError(f"unknown extensions {sorted(unknown)}, must be in {sorted(EXTENSIONS)}")
+        if start >= end:
+            raise ValueError("start must be before end")
+
+        self.collection = collection
+        self.mean_assets = mean_assets
+        self.max_assets = max_assets
+        self.mean_links = mean_links
+        self.max_links = max_links
+        self.interval_fraction = interval_fraction
+        self.max_interval_seconds = int(max_interval_days * 86_400)
+        self.extension_probability = dict(extension_probability)
+        self.start = int(start.timestamp())
+        self.end = int(end.timestamp())
+        self._rng = np.random.default_rng(seed)
+        self._count = 0
+
+        self._footprints = [
+            self._footprint(vertices, crosses_antimeridian=crosses)
+            for vertices, crosses in zip(
+                np.clip(np.rint(self._rng.lognormal(np.log(median_vertices), 1.0, footprints)), 4, max_vertices)
+                .astype(int)
+                .tolist(),
+                (self._rng.random(footprints) < antimeridian_fraction).tolist(),
+                strict=True,
+            )
+        ]
+        base = f"https://example.com/{collection}/{_ID}"
+        self._links = [
+            "".join(
+                f',{{"href":"{base}/{rel}.json","rel":"{rel}","type":"application/json"}}' for rel in _RELS[:count]
+            )[1:]
+            for count in range(max_links + 1)
+        ]
+        self._assets = [
+            "".join(
+                f',"{name}":{{"href":"{base}/{name}","type":"{media_type}","roles":["{role}"]}}'
+                for name, media_type, role in _ASSETS[:count]
+            )[1:]
+            for count in range(max_assets + 1)
+        ]
+        self._extensions = list(self.extension_probability)
+        # the stac_extensions list for each combination of extensions, by bitmask
+        self._extension_lists = [
+            ",".join(
+                f'"{EXTENSIONS[name][0]}"' for bit, name in enumerate(self._extensions) if combination & (1 << bit)
+            )
+            for combination in range(1 << len(self._extensions))
+        ]
+
+    def _footprint(self, vertices: int, *, crosses_antimeridian: bool) -> tuple[str, str]:
+        # a footprint's geometry and bbox as JSON
+        rng = self._rng
+        size = rng.uniform(0.05, 1.0)
+        lat = rng.uniform(-_MAX_CENTER_LAT, _MAX_CENTER_LAT)
+        if crosses_antimeridian:
+            # two parts, each bounded by the antimeridian and wavy top and bottom edges that are monotonic in longitude
+            edge = max((vertices - 1) // 4, 2)
+            west, east = 180.0 - rng.uniform(0.01, size), -180.0 + rng.uniform(0.01, size)
+            bottom = lat - size / 2 - rng.uniform(0, size / 20, (2, edge))
+            top = lat + size / 2 + rng.uniform(0, size / 20, (2, edge))
+            east_lons, west_lons = np.linspace(west, 180.0, edge), np.linspace(-180.0, east, edge)
+            parts = [
+                np.column_stack((np.r_[lons, lons[::-1], lons[0]], np.r_[bottom[i], top[i][::-1], bottom[i][0]]))
+                for i, lons in enumerate((east_lons, west_lons))
+            ]
+            geometry = {"type": "MultiPolygon", "coordinates": [[np.round(part, 6).tolist()] for part in parts]}
+            lats = np.r_[bottom.ravel(), top.ravel()].round(6)
+            bbox = [round(west, 6), lats.min(), round(east, 6), lats.max()]
+        else:
+            # vertices at increasing angles around the center, so the ring is simple and counter-clockwise
+            count = vertices - 1
+            angles = (np.arange(count) + rng.uniform(0, 0.9, count)) * (2 * np.pi / count)
+            radii = size / 2 * rng.uniform(0.6, 1.0, count)
+            lon = rng.uniform(-180.0 + size, 180.0 - size)
+            ring = np.round(np.column_stack((lon + radii * np.cos(angles), lat + radii * np.sin(angles))), 6)
+            ring = np.vstack((ring, ring[:1]))
+            geometry = {"type": "Polygon", "coordinates": [ring.tolist()]}
+            bbox = [*ring.min(axis=0).tolist(), *ring.max(axis=0).tolist()]
+        return json.dumps(geometry, separators=(",", ":")), json.dumps(bbox, separators=(",", ":"))
+
+    def json(self, count: int) -> Iterator[str]:
+        # count Items as JSON strings
+        while count > 0:
+            size = min(count, _BATCH_SIZE)
+            yield from self._batch(size)
+            count -= size
+
+    def items(self, count: int) -> Iterator[Item]:
+        for raw in self.json(count):
+            yield Item.model_validate_json(raw)
+
+    def _batch(self, size: int) -> list[str]:
+        rng = self._rng
+        first, self._count = self._count, self._count + size
+        footprints = rng.integers(len(self._footprints), size=size).tolist()
+        assets = np.minimum(rng.poisson(self.mean_assets, size), self.max_assets).tolist()
+        links = np.minimum(rng.poisson(self.mean_links, size), self.max_links).tolist()
+
+        starts = rng.integers(self.start, self.end, size)
+        interval = rng.random(size) < self.interval_fraction
+        datetimes = [f'"datetime":"{value}"' for value in _iso(starts)]
+        if interval.any():
+            ends = np.minimum(
+                starts[interval] + rng.integers(0, self.max_interval_seconds + 1, interval.sum()), self.end
+            )
+            for index, start, end in zip(
+                np.flatnonzero(interval).tolist(), _iso(starts[interval]), _iso(ends), strict=True
+            ):
+                datetimes[index] = f'"datetime":null,"start_datetime":"{start}","end_datetime":"{end}"'
+
+        combinations = np.zeros(size, dtype=np.intp)
+        properties = datetimes
+        for bit, name in enumerate(self._extensions):
+            present = rng.random(size) < self.extension_probability[name]
+            combinations[present] |= 1 << bit
+            _, field, low, high = EXTENSIONS[name]
+            values = (
+                rng.integers(low, int(high), present.sum(), endpoint=True)
+                if isinstance(low, int)
+                else rng.uniform(low, high, present.sum()).round(2)
+            )
+            for index, value in zip(np.flatnonzero(present).tolist(), values.tolist(), strict=True):
+                properties[index] += f',"{field}":{value}'
+
+        collection = self.collection
+        extension_lists = self._extension_lists
+        footprint_json = self._footprints
+        link_blocks = self._links
+        asset_blocks = self._assets
+        return [
+            f'{{"type":"Feature","stac_version":"1.1.0","stac_extensions":[{extension_lists[combination]}],'
+            f'"id":"{collection}-{first + i}","collection":"{collection}",'
+            f'"geometry":{footprint_json[footprint][0]},"bbox":{footprint_json[footprint][1]},'
+            f'"links":[{link_blocks[link].replace(_ID, f"{collection}-{first + i}")}],'
+            f'"assets":{{{asset_blocks[asset].replace(_ID, f"{collection}-{first + i}")}}},'
+            f'"properties":{{{properties[i]}}}}}'
+            for i, (footprint, asset, link, combination) in enumerate(
+                zip(footprints, assets, links, combinations.tolist(), strict=True)
+            )
+        ]
@@ -0,0 +1,189 @@
+import json
+import math
+import sys
+import threading
+import time
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from stac_factory.models import geometry_cache_info, url_cache_info
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+# ru_maxrss is in bytes on macOS and kilobytes elsewhere
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def peak_rss() -> tuple[int | None, int | None]:
+    # peak resident set size in bytes of this process and of its largest terminated child, e.g. a pool worker
+    if resource is None:  # pragma: no cover - Windows
+        return None, None
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * _RSS_UNIT,
+    )
+
+
+def caches() -> dict[str, dict[str, Any]]:
+    # hits and misses of the validation caches of this process, not of worker processes, which have their own
+    url, geometry = url_cache_info(), geometry_cache_info()
+    return {
+        "url": {**url._asdict(), "hit_rate": url.hit_rate},
+        "geometry": {**geometry._asdict(), "hit_rate": geometry.hit_rate},
+    }
+
+
+class LatencyHistogram:
+    # Latencies counted in log-spaced buckets 2% wide from 1 us, so memory doesn't grow with the number of items and
+    # percentiles are within 2%.
+    _MIN = 1e-6
+    _LOG_GROWTH = math.log(1.02)
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, seconds: float, count: int = 1) -> None:
+        bucket = math.ceil(math.log(seconds / self._MIN) / self._LOG_GROWTH) if seconds > self._MIN else 0
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += count
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        # the upper bound of the bucket holding the q-th percentile, no more than the largest latency seen
+        rank = q / 100 * self.total
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._MIN * math.exp(bucket * self._LOG_GROWTH), self.max)
+        return self.max
+
+
+@dataclass
+class _Stage:
+    workers: int = 1
+    items: int = 0
+    failures: int = 0
+    busy: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # items at the start of the current interval, and items per second in each finished one
+    interval_items: int = 0
+    timeline: list[dict[str, float]] = field(default_factory=list)
+
+
+class Telemetry:
+    # Opt-in throughput and resource report for a run, written as JSON lines to output: one every interval seconds
+    # while items are recorded, if an interval is given, and a final one on close().
+    #
+    # Each stage (e.g. "validate", "build", "serialize") counts items and failures, the time spent on them, and their
+    # latency distribution. The busy time over the elapsed time and the stage's workers is its worker utilization.
+    # Callers hold an optional Telemetry and skip recording when it's None, so there's no cost when it's off.
+
+    def __init__(self, output: IO[str], *, interval: float | None = None) -> None:
+        self.output = output
+        self.interval = interval
+        self._stages: dict[str, _Stage] = {}
+        self._lock = threading.Lock()
+        self._output_lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._next_emit = self._start + interval if interval else math.inf
+        self._last_emit = self._start
+
+    def set_workers(self, stage: str, workers: int) -> None:
+        with self._lock:
+            self._stages.setdefault(stage, _Stage()).workers = workers
+
+    def record(self, stage: str, seconds: float, *, items: int = 1, failures: int = 0) -> None:
+        # items (and failures among them) that took seconds in total
+        with self._lock:
+            state = self._stages.setdefault(stage, _Stage())
+            state.items += items
+            state.failures += failures
+            state.busy += seconds
+            if items:
+                state.latency.add(seconds / items, items)
+            # the first caller past the deadline emits
+            if due := time.perf_counter() >= self._next_emit:
+                self._next_emit = math.inf
+        if due:
+            self.emit()
+
+    @contextmanager
+    def measure(self, stage: str, *, items: int = 1) -> Iterator[None]:
+        # records the time spent in the block, as a failure if it raises
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(stage, time.perf_counter() - start, items=items, failures=items)
+            raise
+        self.record(stage, time.perf_counter() - start, items=items)
+
+    def report(self, *, final: bool = False) -> dict[str, Any]:
+        now = time.perf_counter()
+        elapsed = now - self._start
+        rss, child_rss = peak_rss()
+        with self._lock:
+            stages: dict[str, dict[str, Any]] = {
+                name: {
+                    "items": stage.items,
+                    "failures": stage.failures,
+                    "items_per_second": stage.items / elapsed if elapsed else 0.0,
+                    "busy_seconds": stage.busy,
+                    "workers": stage.workers,
+                    "worker_utilization": stage.busy / (elapsed * stage.workers) if elapsed else 0.0,
+                    "latency_seconds": {
+                        "p50": stage.latency.percentile(50),
+                        "p90": stage.latency.percentile(90),
+                        "p99": stage.latency.percentile(99),
+                        "max": stage.latency.max,
+                    },
+                }
+                for name, stage in self._stages.items()
+            }
+            # periodic reports carry the latest interval's rate, and the final one all of them
+            for name, stage in self._stages.items():
+                if final:
+                    stages[name]["timeline"] = list(stage.timeline)
+                elif stage.timeline:
+                    stages[name]["interval_items_per_second"] = stage.timeline[-1]["items_per_second"]
+        return {
+            "final": final,
+            "elapsed_seconds": elapsed,
+            "peak_rss_bytes": rss,
+            "peak_worker_rss_bytes": child_rss,
+            "stages": stages,
+            "caches": caches(),
+        }
+
+    def emit(self, *, final: bool = False) -> None:
+        # close the current interval of each stage's timeline, and write a report
+        with self._lock:
+            now = time.perf_counter()
+            if now > self._last_emit:
+                for stage in self._stages.values():
+                    stage.timeline.append(
+                        {
+                            "elapsed_seconds": now - self._start,
+                            "items_per_second": (stage.items - stage.interval_items) / (now - self._last_emit),
+                        }
+                    )
+                    stage.interval_items = stage.items
+            self._last_emit = now
+            if self.interval:
+                self._next_emit = now + self.interval
+        report = json.dumps(self.report(final=final))
+        with self._output_lock:
+            self.output.write(report + "\n")
+            self.output.flush()
+
+    def close(self) -> None:
+        self.emit(final=True)
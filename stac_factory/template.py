@@ -0,0 +1,165 @@
+from collections.abc import Mapping, Sequence
+from datetime import datetime as Datetime  # noqa: N812
+from datetime import timezone
+from typing import Any, TypedDict
+
+from pydantic import PositiveFloat
+
+from stac_factory.geometry import bbox_from_geometry
+from stac_factory.models import (
+    URI,
+    Asset,
+    AssetName,
+    AssetRole,
+    Band,
+    BBox2d,
+    BBox3d,
+    CollectionIdentifier,
+    Description,
+    Item,
+    ItemExtension,
+    ItemIdentifier,
+    LicenseStr,
+    Link,
+    MediaType,
+    MultiPolygon,
+    Polygon,
+    Provider,
+    ShortStr,
+    Title,
+    UtcDatetime,
+)
+
+
+class AssetDefaults(TypedDict, total=False):
+    title: Title
+    description: Description
+    type: MediaType
+    roles: list[AssetRole]
+
+
+# stands in for the per-Item fields while the shared ones are validated
+_PLACEHOLDER_GEOMETRY = Polygon.model_validate(
+    {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]}
+)
+_PLACEHOLDER_HREF = "https://example.com/placeholder"
+
+
+class ItemTemplate:
+    # The fields shared by the Items of a collection, validated once and then shared by every Item created from the
+    # template, so create() only validates the per-Item fields. Validated models aren't validated again when passed to
+    # Item.model_validate, so the shared links, providers, and bands cost no more than a reference.
+    #
+    # asset_defaults are the title, description, type, and roles of each asset by name, so an asset is created from
+    # just its href: template.create(..., assets={"red": "s3://bucket/red.tif"}).
+
+    def __init__(
+        self,
+        *,
+        collection: CollectionIdentifier | None,
+        links: Sequence[Link] = (),
+        asset_defaults: Mapping[AssetName, AssetDefaults] | None = None,
+        license: LicenseStr | None = None,
+        providers: Sequence[Provider] | None = None,
+        platform: ShortStr | None = None,
+        instruments: Sequence[ShortStr] | None = None,
+        constellation: ShortStr | None = None,
+        mission: ShortStr | None = None,
+        gsd: PositiveFloat | None = None,
+        keywords: Sequence[ShortStr] | None = None,
+        roles: Sequence[ShortStr] | None = None,
+        bands: Sequence[Band] | None = None,
+    ) -> None:
+        # validating an Item with placeholder per-Item fields validates the shared fields with Item's own rules
+        template = Item.create(
+            extensions=[],
+            id="template",
+            geometry=_PLACEHOLDER_GEOMETRY,
+            bbox=BBox2d(w_lon=0, s_lat=0, e_lon=1, n_lat=1),
+            links=list(links),
+            assets=[
+                Asset.model_validate({**defaults, "name": name, "href": _PLACEHOLDER_HREF})
+                for name, defaults in (asset_defaults or {}).items()
+            ],
+            collection=collection,
+            datetime=Datetime(1970, 1, 1, tzinfo=timezone.utc),
+            license=license,
+            providers=None if providers is None else list(providers),
+            platform=platform,
+            instruments=None if instruments is None else list(instruments),
+            constellation=constellation,
+            mission=mission,
+            gsd=gsd,
+            keywords=None if keywords is None else list(keywords),
+            roles=None if roles is None else list(roles),
+            bands=None if bands is None else list(bands),
+        )
+        self.links: tuple[Link, ...] = tuple(template.links)
+        self.assets: dict[AssetName, Asset] = {asset.name: asset for asset in template.assets}
+        # the validated defaults as fields, since validating an asset's few short strings along with the Item is
+        # faster than copying a model
+        self._asset_fields: dict[AssetName, dict[str, Any]] = {
+            name: asset.model_dump(exclude={"name", "href"}, exclude_none=True) for name, asset in self.assets.items()
+        }
+        self.fields: dict[str, Any] = {
+            name: getattr(template, name)
+            for name in (
+                "collection",
+                "license",
+                "providers",
+                "platform",
+                "instruments",
+                "constellation",
+                "mission",
+                "gsd",
+                "keywords",
+                "roles",
+                "bands",
+            )
+        }
+
+    def create(
+        self,
+        *,
+        id: ItemIdentifier,
+        geometry: Polygon | MultiPolygon,
+        datetime: UtcDatetime | None,
+        assets: Mapping[AssetName, URI | str | Asset],
+        bbox: BBox2d | BBox3d | None = None,
+        links: Sequence[Link] = (),
+        extensions: Sequence[ItemExtension] = (),
+        start_datetime: UtcDatetime | None = None,
+        end_datetime: UtcDatetime | None = None,
+        created: UtcDatetime | None = None,
+        updated: UtcDatetime | None = None,
+        title: Title | None = None,
+        description: Description | None = None,
+    ) -> Item:
+        # an Item with the template's fields; assets are hrefs for the template's asset defaults or complete Assets,
+        # and the bbox is derived from the geometry if not given
+        return Item.model_validate(
+            {
+                "type": "Feature",
+                "stac_version": "1.1.0",
+                "stac_extensions": [],
+                "id": id,
+                "geometry": geometry,
+                "bbox": bbox_from_geometry(geometry) if bbox is None else bbox,
+                "links": [*self.links, *links],
+                "assets": [
+                    value
+                    if isinstance(value, Asset)
+                    else {**self._asset_fields.get(name, {}), "name": name, "href": value}
+                    for name, value in assets.items()
+                ],
+                "datetime": datetime,
+                "start_datetime": start_datetime,
+                "end_datetime": end_datetime,
+                "created": created,
+                "updated": updated,
+                "title": title,
+                "description": description,
+                "extensions": list(extensions),
+                **self.fields,
+            },
+        )
@@ -0,0 +1,229 @@
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timezone
+from math import floor
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Literal, Self
+
+from stac_factory.geometry import quantized_json
+from stac_factory.models import Item
+from stac_factory.telemetry import Telemetry
+
+# a partition key maps an Item to a relative path, which may have several segments, e.g. "2021/01/02"
+type PartitionKey = Callable[[Item], str]
+type Format = Literal["ndjson", "json"]
+
+_DATETIME_FORMATS = {"year": "%Y", "month": "%Y/%m", "day": "%Y/%m/%d"}
+_FEATURE_COLLECTION_START = b'{"type":"FeatureCollection","features":['
+_FEATURE_COLLECTION_END = b"]}"
+
+
+def collection_key(item: Item) -> str:
+    return item.collection or "no-collection"
+
+
+def datetime_key(resolution: Literal["year", "month", "day"] = "day") -> PartitionKey:
+    # UTC date of the datetime, or of the start_datetime for a range
+    date_format = _DATETIME_FORMATS[resolution]
+
+    def key(item: Item) -> str:
+        value = item.start_datetime or item.datetime
+        return value.astimezone(timezone.utc).strftime(date_format)  # type: ignore[union-attr]
+
+    return key
+
+
+def spatial_key(cell: float = 10.0) -> PartitionKey:
+    # the cell of a cell x cell degree grid containing the bbox center, named by its south-west corner
+    def key(item: Item) -> str:
+        bbox = item.bbox
+        lon = (bbox.w_lon + bbox.e_lon) / 2 + (180.0 if bbox.crosses_antimeridian else 0.0)
+        lon = (lon + 180.0) % 360.0 - 180.0
+        lat = (bbox.s_lat + bbox.n_lat) / 2
+        return f"{floor(lon / cell) * cell:g}_{floor(lat / cell) * cell:g}"
+
+    return key
+
+
+def _part(path: Path) -> Path:
+    return path.with_name(path.name + ".part")
+
+
+@dataclass
+class _Partition:
+    path: Path
+    buffer: list[Item] = field(default_factory=list)
+    count: int = 0
+    # the last write submitted for this partition, which the next one waits on, so writes are applied in order
+    pending: Future[None] | None = None
+
+
+class PartitionedWriter:
+    # Write a stream of Items to one NDJSON or FeatureCollection JSON file per partition, at
+    # directory/<key 1>/.../<key n>.<format>, e.g. sentinel-2-l2a/2021/01/02.ndjson for the default keys.
+    #
+    # Items are buffered per partition and each full buffer is serialized and appended by a thread pool, with writes
+    # to the same partition applied in order. At most max_open_files handles are open at once; the least recently
+    # used idle handle is closed to open another, and reopened for appending if needed.
+    #
+    # Files are written as <name>.part and renamed into place on close, so a partition is either complete or absent.
+    # Leaving the context manager with an exception removes the .part files instead.
+
+    def __init__(
+        self,
+        directory: Path,
+        keys: Sequence[PartitionKey] = (collection_key, datetime_key()),
+        *,
+        format: Format = "ndjson",
+        buffer_size: int = 1_000,
+        max_open_files: int = 64,
+        workers: int = 4,
+        precision: int | None = None,
+        telemetry: Telemetry | None = None,
+    ) -> None:
+        if max_open_files < workers:
+            raise ValueError("max_open_files must be at least workers, as each worker writes with its own handle")
+        self.directory = directory
+        self.keys = tuple(keys)
+        self.format = format
+        self.buffer_size = buffer_size
+        self.max_open_files = max_open_files
+        # decimal places to round coordinates and bboxes to, or None to write them as they are
+        self.precision = precision
+        # records each Item's share of the time to serialize and write its batch as the "serialize" stage
+        self.telemetry = telemetry
+        if telemetry is not None:
+            telemetry.set_workers("serialize", workers)
+
+        self._partitions: dict[tuple[str, ...], _Partition] = {}
+        # idle open handles, least recently used first; handles being written to are checked out of it
+        self._handles: OrderedDict[Path, IO[bytes]] = OrderedDict()
+        self._open = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def path(self, item: Item) -> Path:
+        segments = [segment for key in self.keys for segment in key(item).split("/")]
+        if any(segment in {"", ".", ".."} for segment in segments):
+            raise ValueError(f"invalid partition path {'/'.join(segments)!r} for item {item.id}")
+        return self.directory.joinpath(*segments[:-1], f"{segments[-1]}.{self.format}")
+
+    def write(self, item: Item) -> None:
+        key = tuple(key(item) for key in self.keys)
+        if (partition := self._partitions.get(key)) is None:
+            partition = self._partitions[key] = _Partition(self.path(item))
+        partition.buffer.append(item)
+        if len(partition.buffer) >= self.buffer_size:
+            self._flush(partition)
+
+    def write_all(self, items: Iterable[Item]) -> None:
+        for item in items:
+            self.write(item)
+
+    def close(self) -> dict[Path, int]:
+        # flush and finalize every partition, returning the number of Items written to each file
+        try:
+            for partition in self._partitions.values():
+                if partition.buffer:
+                    self._flush(partition)
+                partition.pending = self._executor.submit(self._finalize, partition.path, partition.pending)
+            for partition in self._partitions.values():
+                partition.pending.result()  # type: ignore[union-attr]
+        except BaseException:
+            self.abort()
+            raise
+        self._executor.shutdown()
+        return {partition.path: partition.count for partition in self._partitions.values()}
+
+    def abort(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+        for partition in self._partitions.values():
+            if (part := _part(partition.path)).exists():
+                part.unlink()
+
+    def _flush(self, partition: _Partition) -> None:
+        items, partition.buffer = partition.buffer, []
+        first = partition.count == 0
+        partition.count += len(items)
+        partition.pending = self._executor.submit(self._append, partition.path, items, partition.pending, first=first)
+
+    def _serialize(self, items: list[Item], *, first: bool) -> bytes:
+        if self.precision is None:
+            lines = [item.model_dump_json().encode() for item in items]
+        else:
+            lines = quantized_json(items, self.precision)
+        if self.format == "ndjson":
+            return b"".join(line + b"\n" for line in lines)
+        features = b",".join(lines)
+        return (_FEATURE_COLLECTION_START if first else b",") + features
+
+    def _append(self, path: Path, items: list[Item], previous: Future[None] | None, *, first: bool) -> None:
+        start = time.perf_counter()
+        data = self._serialize(items, first=first)
+        serialized = time.perf_counter()
+        if previous is not None:
+            previous.result()
+        resumed = time.perf_counter()
+        handle = self._checkout(path, "wb" if first else "ab")
+        try:
+            handle.write(data)
+        finally:
+            self._checkin(path, handle)
+        if self.telemetry is not None:
+            # not counting the wait for the partition's previous write
+            self.telemetry.record("serialize", serialized - start + time.perf_counter() - resumed, items=len(items))
+
+    def _finalize(self, path: Path, previous: Future[None] | None) -> None:
+        if previous is not None:
+            previous.result()
+        handle = self._checkout(path, "ab")
+        try:
+            if self.format == "json":
+                handle.write(_FEATURE_COLLECTION_END)
+        finally:
+            handle.close()
+            with self._lock:
+                self._open -= 1
+        _part(path).replace(path)
+
+    def _checkout(self, path: Path, mode: Literal["wb", "ab"]) -> IO[bytes]:
+        with self._lock:
+            if (handle := self._handles.pop(path, None)) is not None:
+                return handle
+            if self._open >= self.max_open_files:
+                _, idle = self._handles.popitem(last=False)
+                idle.close()
+                self._open -= 1
+            self._open += 1
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return _part(path).open(mode)
+        except BaseException:
+            with self._lock:
+                self._open -= 1
+            raise
+
+    def _checkin(self, path: Path, handle: IO[bytes]) -> None:
+        with self._lock:
+            self._handles[path] = handle
@@ -0,0 +1,61 @@
+import copy
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from stac_factory.batch import validate_many
+from stac_factory.projection import project
+from stac_factory.synthetic import SyntheticItems
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+VALID = (fixture_dir / "minimal.json").read_bytes()
+INVALID = (fixture_dir / "invalid.json").read_bytes()
+
+
+def test_validate_many() -> None:
+    item_dict = json.loads(VALID)
+    original = copy.deepcopy(item_dict)
+    documents = [VALID, INVALID, VALID.decode(), item_dict, item_dict]
+
+    results = validate_many(documents)
+    assert [result.valid for result in results] == [True, False, True, True, True]
+    assert results[0].item is not None
+    assert results[0].item.id == "S2B_T38XNF_20250422T091553_L2A"
+    assert results[1].item is None
+    assert results[1].error is not None
+    assert results[1].error.errors()[0]["type"] == "value_error"
+    assert results[3].item == results[0].item
+    # the dict can be validated again, as it isn't modified
+    assert item_dict == original
+
+    assert validate_many([]) == []
+    with pytest.raises(ValueError, match="chunk_size"):
+        validate_many(documents, chunk_size=0)
+
+
+def test_validate_many_leaves_assets() -> None:
+    # an Item with assets, which are named from their keys in new dicts
+    item_dict = json.loads((fixture_dir / "S2B_T01WCR_20250427T000611_L2A.json").read_text())
+    original = copy.deepcopy(item_dict)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = validate_many([item_dict] * 16, executor, chunk_size=1)
+    assert all(result.valid for result in results)
+    assert results[0].item is not None
+    assert results[0].item.assets[0].name == next(iter(item_dict["assets"]))
+    assert item_dict == original
+
+
+def test_validate_many_threads() -> None:
+    documents: list[bytes | str] = [*SyntheticItems(seed=3).json(200)]
+    documents[17] = INVALID
+    expected = [result.item for result in validate_many(documents)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = validate_many(documents, executor, chunk_size=8)
+        # the same model for the same fields, however many threads ask at once
+        models = list(executor.map(lambda _: project("id", "bbox"), range(16)))
+    assert [result.item for result in results] == expected
+    assert [i for i, result in enumerate(results) if not result.valid] == [17]
+    assert len(set(models)) == 1
@@ -0,0 +1,262 @@
+import csv
+import gzip
+import json
+import lzma
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+from unittest.mock import ANY
+
+import pytest
+
+from stac_factory.build import (
+    Record,
+    RecordError,
+    _build_batch,
+    _init_worker,
+    build_items,
+    load_mapper,
+    read_records,
+    write_results,
+)
+from stac_factory.cli.__main__ import app
+from stac_factory.dedupe import DuplicateDetector
+from stac_factory.models import Item
+
+from .test_index import make_item
+
+MAPPER = "tests.test_build:map_record"
+
+
+def map_record(record: Record) -> dict[str, Any] | Item:
+    if isinstance(record, Path):
+        return map_record(json.loads(record.read_text()))
+    lon, lat = float(record["lon"]), float(record["lat"])
+    if record.get("template"):
+        return make_item(record["id"], lon, lat, lon + 1, lat + 1)
+    ring = [[lon, lat], [lon + 1, lat], [lon + 1, lat + 1], [lon, lat + 1], [lon, lat]]
+    return {
+        "extensions": [],
+        "id": record["id"],
+        "geometry": {"type": "Polygon", "coordinates": [ring[::-1] if record.get("clockwise") else ring]},
+        "bbox": [lon, lat, lon + 1, lat + 1],
+        "links": [],
+        "assets": [],
+        "collection": None,
+        "datetime": record["datetime"],
+    }
+
+
+RECORDS = [
+    {"id": "a", "lon": 0, "lat": 0, "datetime": "2021-01-01T00:00:00Z"},
+    {"id": "b", "lon": 10, "lat": 10, "datetime": "2021-01-02T00:00:00Z"},
+    {"id": "bad", "lon": 500, "lat": 0, "datetime": "2021-01-02T00:00:00Z"},
+    {"id": "c", "lon": 20, "lat": 20, "template": True},
+    {"id": "d", "lon": 30, "lat": 30},
+]
+
+
+@pytest.fixture
+def jsonl(tmp_path: Path) -> Path:
+    path = tmp_path / "records.jsonl"
+    path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n")
+    return path
+
+
+def ids(output: bytes) -> list[str]:
+    return [Item.model_validate_json(line).id for line in output.splitlines()]
+
+
+def test_read_records(tmp_path: Path, jsonl: Path) -> None:
+    assert [source for source, _ in read_records(jsonl)] == [f"{jsonl}:{n}" for n in range(1, 6)]
+
+    csv_path = tmp_path / "records.csv"
+    csv_path.write_text("id,lon,lat,datetime\na,0,0,2021-01-01T00:00:00Z\nb,1,1,2021-01-01T00:00:00Z\n")
+    assert list(read_records(csv_path)) == [
+        (f"{csv_path}:2", {"id": "a", "lon": "0", "lat": "0", "datetime": "2021-01-01T00:00:00Z"}),
+        (f"{csv_path}:3", {"id": "b", "lon": "1", "lat": "1", "datetime": "2021-01-01T00:00:00Z"}),
+    ]
+    # compressed, with the format from the extension before the compression's
+    gzipped = tmp_path / "records.csv.gz"
+    gzipped.write_bytes(gzip.compress(csv_path.read_bytes()))
+    assert [record for _, record in read_records(gzipped)] == [record for _, record in read_records(csv_path)]
+    compressed = tmp_path / "records.jsonl.xz"
+    compressed.write_bytes(lzma.compress(jsonl.read_bytes()))
+    assert list(read_records(compressed)) == [
+        (f"{compressed}:{n}", record) for n, (_, record) in enumerate(read_records(jsonl), start=1)
+    ]
+
+    sidecars = tmp_path / "sidecars"
+    (sidecars / "nested").mkdir(parents=True)
+    (sidecars / "nested" / "b.json").write_text(json.dumps(RECORDS[1]))
+    (sidecars / "a.json").write_text(json.dumps(RECORDS[0]))
+    (sidecars / "a.tif").write_text("")
+    assert [record for _, record in read_records(sidecars, pattern="*.json")] == [
+        sidecars / "a.json",
+        sidecars / "nested" / "b.json",
+    ]
+
+
+def test_read_records_unreadable(tmp_path: Path) -> None:
+    # each line or row that can't be read is a failure, with the rest read as usual
+    jsonl = tmp_path / "records.jsonl"
+    jsonl.write_bytes(b'{"id": "a"}\n{"id": \n\xff\n{"id": "b"}\n')
+    records = list(read_records(jsonl))
+    assert [source for source, _ in records] == [f"{jsonl}:{n}" for n in range(1, 5)]
+    assert [record for _, record in records[::3]] == [{"id": "a"}, {"id": "b"}]
+    assert records[1][1] == RecordError({"type": "JSONDecodeError", "message": ANY})
+    assert records[2][1] == RecordError({"type": "UnicodeDecodeError", "message": ANY})
+
+    csv_path = tmp_path / "records.csv"
+    # the third over csv.field_size_limit()
+    csv_path.write_bytes(b"id,lon\na,0\nb\xff,1\n" + b"c" * (csv.field_size_limit() + 1) + b",2\nd,3\n")
+    records = list(read_records(csv_path))
+    assert [source for source, _ in records] == [f"{csv_path}:{n}" for n in range(2, 6)]
+    assert [record for _, record in records[::3]] == [{"id": "a", "lon": "0"}, {"id": "d", "lon": "3"}]
+    assert records[1][1] == RecordError({"type": "UnicodeDecodeError", "message": ANY})
+    assert records[2][1] == RecordError({"type": "Error", "message": ANY})
+
+    # without a header, the file fails as a whole
+    csv_path.write_bytes(b"\xff\na\n")
+    with pytest.raises(UnicodeDecodeError):
+        list(read_records(csv_path))
+
+
+@pytest.mark.parametrize("repair", [False, True])
+def test_build_items_unreadable(tmp_path: Path, jsonl: Path, repair: bool) -> None:  # noqa: FBT001
+    jsonl.write_text(jsonl.read_text().replace("\n\n", '\n{"id": \n'))
+    output, dead_letter = BytesIO(), tmp_path / "dead-letter.ndjson"
+    stats = write_results(build_items(MAPPER, read_records(jsonl), repair=repair), output, dead_letter)
+    assert stats == (3, 3, 0)
+    failures = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert failures[2]["source"] == f"{jsonl}:6"
+    assert failures[2]["error"]["type"] == "JSONDecodeError"
+
+
+def test_load_mapper(tmp_path: Path) -> None:
+    assert load_mapper(MAPPER) is map_record
+
+    plugin = tmp_path / "plugin.py"
+    plugin.write_text("def mapper(record):\n    return record\n\nNOT_CALLABLE = 1\n")
+    assert load_mapper(f"{plugin}:mapper")({"x": 1}) == {"x": 1}
+
+    with pytest.raises(ValueError, match="mapper must be"):
+        load_mapper("tests.test_build")
+    with pytest.raises(ValueError, match="is not a callable"):
+        load_mapper(f"{plugin}:NOT_CALLABLE")
+    with pytest.raises(FileNotFoundError):
+        load_mapper(f"{tmp_path / 'missing.py'}:mapper")
+
+
+@pytest.mark.parametrize(("workers", "ordered"), [(1, True), (2, True), (2, False)])
+def test_build_items(tmp_path: Path, jsonl: Path, workers: int, ordered: bool) -> None:  # noqa: FBT001
+    output = BytesIO()
+    dead_letter = tmp_path / "dead-letter.ndjson"
+    results = build_items(MAPPER, read_records(jsonl), workers=workers, batch_size=1, ordered=ordered)
+    assert write_results(results, output, dead_letter) == (3, 2, 0)
+
+    built = ids(output.getvalue())
+    assert built == ["a", "b", "c"] if ordered else sorted(built) == ["a", "b", "c"]
+    failures = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    if not ordered:
+        # failures are written as they finish, too
+        failures.sort(key=lambda failure: failure["source"])
+    assert [failure["source"] for failure in failures] == [f"{jsonl}:3", f"{jsonl}:5"]
+    assert failures[0]["error"]["type"] == "ValidationError"
+    assert failures[1]["error"] == {"type": "KeyError", "message": "'datetime'"}
+
+
+def test_build_batch_in_worker(jsonl: Path) -> None:
+    _init_worker(MAPPER, None)
+    results = _build_batch(tuple(read_records(jsonl)))
+    assert [result.error is None for result in results] == [True, True, False, True, False]
+
+    _init_worker(MAPPER, None, True)  # noqa: FBT003
+    assert [result.line for result in _build_batch(tuple(read_records(jsonl)))] == [result.line for result in results]
+    _init_worker(MAPPER, None)
+
+
+def test_write_results_without_failures(tmp_path: Path, jsonl: Path) -> None:
+    output = BytesIO()
+    write_results(build_items(MAPPER, list(read_records(jsonl))[:2]), output, tmp_path / "dead-letter.ndjson")
+    assert ids(output.getvalue()) == ["a", "b"]
+    assert not (tmp_path / "dead-letter.ndjson").exists()
+
+
+def test_write_results_rerun(tmp_path: Path, jsonl: Path) -> None:
+    # a clean rerun doesn't leave the dead letters of the failing run before it
+    dead_letter = tmp_path / "dead-letter.ndjson"
+    assert write_results(build_items(MAPPER, read_records(jsonl)), BytesIO(), dead_letter).failures == 2
+    assert dead_letter.exists()
+    assert write_results(build_items(MAPPER, list(read_records(jsonl))[:2]), BytesIO(), dead_letter).failures == 0
+    assert not dead_letter.exists()
+
+
+def test_write_results_duplicates(tmp_path: Path, jsonl: Path) -> None:
+    output, dead_letter = BytesIO(), tmp_path / "dead-letter.ndjson"
+    records = list(read_records(jsonl))
+    duplicates = DuplicateDetector()
+    stats = write_results(build_items(MAPPER, records + records[:2]), output, dead_letter, duplicates=duplicates)
+    assert stats == (3, 4, 0)
+    assert ids(output.getvalue()) == ["a", "b", "c"]
+    failures = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert [failure["source"] for failure in failures[2:]] == [f"{jsonl}:1", f"{jsonl}:2"]
+    assert failures[2]["error"] == {"type": "DuplicateItem", "message": "id 'a' is already in collection None"}
+
+    # past the exact set, a duplicate may be a false positive
+    duplicates = DuplicateDetector(memory_budget=100, false_positive_rate=0.01)
+    write_results(build_items(MAPPER, records[:1] * 2), BytesIO(), dead_letter, duplicates=duplicates)
+    assert not duplicates.exact
+    error = json.loads(dead_letter.read_text())["error"]
+    assert error["message"] == "id 'a' is already in collection None, or is a false positive at a rate of about 0.01"
+
+
+def test_cli_build(tmp_path: Path, jsonl: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output, dead_letter = tmp_path / "items.ndjson", tmp_path / "failed.ndjson"
+    app(["build", str(jsonl), MAPPER, "--output", str(output), "--dead-letter", str(dead_letter), "--workers", "1"])
+    assert ids(output.read_bytes()) == ["a", "b", "c"]
+    assert "3 items" in capsys.readouterr().err
+
+    app(["build", str(jsonl), MAPPER, "--dead-letter", str(dead_letter), "--workers", "1", "--record-format", "jsonl"])
+    captured = capsys.readouterr()
+    assert "2 failures" in captured.err
+    assert len(captured.out.splitlines()) == 3
+
+    jsonl.write_text(jsonl.read_text() * 2)
+    app(["build", str(jsonl), MAPPER, "--dead-letter", str(dead_letter), "--workers", "1", "--unique"])
+    captured = capsys.readouterr()
+    assert "7 failures" in captured.err
+    assert ids(captured.out.encode()) == ["a", "b", "c"]
+
+    jsonl.write_text(json.dumps({**RECORDS[0], "clockwise": True}) + "\n")
+    app(["build", str(jsonl), MAPPER, "--dead-letter", str(dead_letter), "--workers", "1", "--repair"])
+    captured = capsys.readouterr()
+    assert "1 items" in captured.err
+    assert "1 repaired" in captured.err
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_items_repair(tmp_path: Path, workers: int) -> None:
+    records = [
+        ("records.jsonl:1", {"id": "a", "lon": 0, "lat": 0, "datetime": "2021-01-01T00:00:00Z", "clockwise": True}),
+        ("records.jsonl:2", {"id": "b", "lon": 0, "lat": 0, "datetime": "2021-01-01T00:00:00Z"}),
+        ("records.jsonl:3", {"id": "c", "lon": 0, "lat": 0}),
+        ("records.jsonl:4", {"id": "d", "lon": 0, "lat": 0, "template": True}),
+        ("records.jsonl:5", {"id": "e", "lon": 500, "lat": 0, "datetime": "2021-01-01T00:00:00Z", "clockwise": True}),
+    ]
+    results = list(build_items(MAPPER, records, workers=workers, batch_size=2, repair=True))
+    assert [result.repairs for result in results] == [("winding",), (), (), (), ()]
+    assert [result.error is None for result in results] == [True, True, False, True, False]
+    assert all(result.seconds > 0 for result in results)
+    assert write_results(results, BytesIO(), tmp_path / "dead-letter.ndjson") == (3, 2, 1)
+
+    # without repair, the clockwise ring is a failure
+    assert [result.error is None for result in build_items(MAPPER, records[:1], workers=workers)] == [False]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_items_precision(workers: int) -> None:
+    records = [("records.jsonl:1", {"id": "a", "lon": 0.123456, "lat": 0.5, "datetime": "2021-01-01T00:00:00Z"})]
+    (result,) = build_items(MAPPER, records, workers=workers, precision=3)
+    assert json.loads(result.line)["bbox"] == [0.123, 0.5, 1.123, 1.5]  # type: ignore[arg-type]
@@ -1,8 +1,10 @@
+import gzip
 import json
 
 from pathlib import Path
 
 import pytest
+import zstandard
 
 from stac_factory.cli.__main__ import app
 
@@ -23,3 +25,84 @@ def test_cli_json_schema(capsys: pytest.CaptureFixture[str]) -> None:
     app(["json-schema"])
     schema = json.loads(capsys.readouterr().out)
     assert schema["title"] == "Item"
+
+
+def test_cli_validate_feature_collection(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    features = [json.loads((fixture_dir / name).read_text()) for name in ["minimal.json", "invalid.json"]]
+    path = tmp_path / "collection.json"
+
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features[:1] * 3}))
+    app(["validate", str(path), "--feature-collection"])
+    assert "Success! 3 items" in capsys.readouterr().out
+
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    app(["validate", str(path), "--feature-collection"])
+    assert "Failure: feature 1" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_cli_validate_feature_collection_failure_index(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], workers: str
+) -> None:
+    features = [json.loads((fixture_dir / name).read_text()) for name in ["minimal.json", "invalid.json"]]
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features * 3}))
+    app(["validate", str(path), "--feature-collection", "--workers", workers])
+    assert "Failure: feature 1\n" in capsys.readouterr().out
+
+
+def test_cli_validate_unique(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    feature = json.loads((fixture_dir / "minimal.json").read_text())
+    other = dict(feature, id="other")
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": [feature, other, feature]}))
+
+    app(["validate", str(path), "--feature-collection"])
+    assert "Success! 3 items" in capsys.readouterr().out
+    app(["validate", str(path), "--feature-collection", "--unique", "--unique-memory", "1"])
+    out = capsys.readouterr().out
+    assert "Duplicate: feature 2, id 'S2B_T38XNF_20250422T091553_L2A' in 'sentinel-2-c1-l2a'" in out
+    assert "Failure: 1 duplicates in 3 items" in out
+
+
+def test_cli_validate_unique_single_item(capsys: pytest.CaptureFixture[str]) -> None:
+    app(["validate", str(fixture_dir / "minimal.json"), "--unique"])
+    assert "--unique requires --feature-collection" in capsys.readouterr().out
+
+
+def test_cli_validate_unreadable(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "minimal.json.gz"
+    path.write_bytes((fixture_dir / "minimal.json").read_bytes())
+    app(["validate", str(path)])
+    assert "has a .gz extension but isn't gzip compressed" in capsys.readouterr().out
+    app(["validate", str(path), "--feature-collection", "--telemetry", str(tmp_path / "telemetry.jsonl")])
+    assert "isn't gzip compressed" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".zst"])
+def test_cli_validate_truncated(tmp_path: Path, capsys: pytest.CaptureFixture[str], suffix: str) -> None:
+    item = (fixture_dir / "minimal.json").read_bytes()
+    compressed = gzip.compress(item) if suffix == ".gz" else zstandard.ZstdCompressor().compress(item)
+    path = tmp_path / f"minimal.json{suffix}"
+    path.write_bytes(compressed[:-20])
+    app(["validate", str(path)])
+    assert capsys.readouterr().out.startswith("Failure:\n")
+
+    collection = json.dumps({"type": "FeatureCollection", "features": [json.loads(item)]}).encode()
+    compressed = gzip.compress(collection) if suffix == ".gz" else zstandard.ZstdCompressor().compress(collection)
+    path.write_bytes(compressed[:-20])
+    app(["validate", str(path), "--feature-collection"])
+    assert capsys.readouterr().out.startswith("Failure:\n")
+
+
+def test_cli_validate_compressed(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "minimal.json.gz"
+    path.write_bytes(gzip.compress((fixture_dir / "minimal.json").read_bytes()))
+    app(["validate", str(path)])
+    assert "Success" in capsys.readouterr().out
+
+    features = [json.loads((fixture_dir / "minimal.json").read_text())] * 3
+    path = tmp_path / "collection.json.gz"
+    path.write_bytes(gzip.compress(json.dumps({"type": "FeatureCollection", "features": features}).encode()))
+    app(["validate", str(path), "--feature-collection"])
+    assert "Success! 3 items" in capsys.readouterr().out
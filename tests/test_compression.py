@@ -0,0 +1,127 @@
+import bz2
+import gzip
+import io
+import lzma
+import sys
+import zlib
+
+from pathlib import Path
+
+import pytest
+import zstandard
+
+from stac_factory.compression import _ParallelReader, content_suffix, detect_compression, open_input, read_input
+
+DATA = b"".join(b'{"id": "item-%d"}\n' % i for i in range(20_000))
+PARTS = [DATA[i : i + 50_000] for i in range(0, len(DATA), 50_000)]
+
+
+def bgzf(data: bytes) -> bytes:
+    # a BGZF member, as bgzip writes: a gzip member with its size in a "BC" extra subfield
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+    size = 18 + len(deflated) + 8
+    header = b"\x1f\x8b\x08\x04" + bytes(6) + (6).to_bytes(2, "little") + b"BC" + (2).to_bytes(2, "little")
+    trailer = zlib.crc32(data).to_bytes(4, "little") + len(data).to_bytes(4, "little")
+    return header + (size - 1).to_bytes(2, "little") + deflated + trailer
+
+
+COMPRESSED = {
+    "items.ndjson.gz": b"".join(gzip.compress(part) for part in PARTS),
+    "items.ndjson.bgz": b"".join(bgzf(part) for part in PARTS),
+    "items.ndjson.bz2": bz2.compress(DATA),
+    "items.ndjson.xz": lzma.compress(DATA),
+    "items.ndjson.zst": b"".join(zstandard.ZstdCompressor().compress(part) for part in PARTS),
+    # streamed, so the frame doesn't record its content size, with checksums and a skippable frame
+    "streamed.zst": b"".join(
+        zstandard.ZstdCompressor(write_checksum=True, write_content_size=False).compress(part) for part in PARTS
+    )
+    + b"\x50\x2a\x4d\x18"
+    + (3).to_bytes(4, "little")
+    + b"abc",
+    "items.ndjson": DATA,
+}
+
+
+@pytest.mark.parametrize("name", COMPRESSED)
+@pytest.mark.parametrize("workers", [1, 4])
+def test_open_input(tmp_path: Path, name: str, workers: int) -> None:
+    path = tmp_path / name
+    path.write_bytes(COMPRESSED[name])
+    with open_input(path, workers=workers) as f:
+        assert f.readline() == b'{"id": "item-0"}\n'
+        assert f.read() == DATA[len(b'{"id": "item-0"}\n') :]
+    parallel = workers > 1 and name in {"items.ndjson.bgz", "items.ndjson.zst", "streamed.zst"}
+    with open_input(path, workers=workers) as f:
+        assert isinstance(getattr(f, "raw", None), _ParallelReader) == parallel
+
+
+def test_open_input_malformed_parts(tmp_path: Path) -> None:
+    # parts that can't be found from the headers are decompressed sequentially, which reports any corruption
+    path = tmp_path / "items.ndjson.zst"
+    frames = COMPRESSED["items.ndjson.zst"]
+    path.write_bytes(frames[:-10])
+    with pytest.raises(EOFError, match="zstd stream ended before the end of a frame"):
+        read_input(path, workers=4)
+
+    path.write_bytes(frames + b"not zstd")
+    with pytest.raises(ValueError, match="invalid zstd data"):
+        read_input(path, workers=4)
+    for truncated in [b"\x28\xb5\x2f\xfd", b"\x28\xb5\x2f\xfd\x20\x00\x07\x00"]:
+        path.write_bytes(frames + truncated)
+        with pytest.raises(EOFError):
+            read_input(path, workers=4)
+    # a reserved block type
+    path.write_bytes(frames + b"\x28\xb5\x2f\xfd\x20\x00\x07\x00\x00")
+    with pytest.raises(ValueError, match="invalid zstd data"):
+        read_input(path, workers=4)
+    # a checksum that doesn't match, found decompressing the frames in parallel too
+    corrupt = bytearray(COMPRESSED["streamed.zst"])
+    corrupt[len(zstandard.ZstdCompressor(write_checksum=True, write_content_size=False).compress(PARTS[0])) - 1] ^= 0xFF
+    path.write_bytes(bytes(corrupt))
+    for workers in [1, 4]:
+        with pytest.raises(ValueError, match="invalid zstd data"):
+            read_input(path, workers=workers)
+
+    path = tmp_path / "items.ndjson.gz"
+    path.write_bytes(bgzf(DATA) + gzip.compress(DATA))
+    assert read_input(path, workers=4) == DATA * 2
+    path.write_bytes(bgzf(DATA)[:-100])
+    with pytest.raises(EOFError):
+        read_input(path, workers=4)
+
+    path = tmp_path / "empty.ndjson.gz"
+    path.write_bytes(b"")
+    assert read_input(path, workers=4) == b""
+
+
+def test_detect_compression(tmp_path: Path) -> None:
+    path = tmp_path / "item.json.gz"
+    path.write_bytes(b'{"id": "item"}')
+    with pytest.raises(ValueError, match=r"has a \.gz extension but isn't gzip compressed"):
+        detect_compression(path)
+    # by content, not name
+    path.write_bytes(lzma.compress(b"{}"))
+    assert detect_compression(path) == "xz"
+
+    assert content_suffix(Path("records.csv.gz")) == ".csv"
+    assert content_suffix(Path("records.csv")) == ".csv"
+
+
+def test_zstandard_missing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "items.ndjson.zst"
+    path.write_bytes(COMPRESSED["items.ndjson.zst"])
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    with pytest.raises(ImportError, match=r"install stac-factory\[zstd\]"):
+        open_input(path)
+
+
+def test_parallel_reader_close(tmp_path: Path) -> None:
+    path = tmp_path / "items.ndjson.zst"
+    path.write_bytes(COMPRESSED["items.ndjson.zst"])
+    f = open_input(path, workers=2)
+    assert isinstance(f, io.BufferedReader)
+    f.read(10)
+    f.close()
+    f.raw.close()
+    assert f.closed
@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from stac_factory.dedupe import BloomFilter, DuplicateDetector
+
+from .test_index import make_item
+
+
+def test_duplicate_detector_exact() -> None:
+    duplicates = DuplicateDetector()
+    assert not duplicates.seen("landsat", "a")
+    assert not duplicates.seen("sentinel", "a")
+    assert not duplicates.seen(None, "a")
+    assert duplicates.seen("landsat", "a")
+    # the separator isn't confused with the id
+    assert not duplicates.seen("landsat/a", "b")
+    assert not duplicates.seen("landsat", "a/b")
+    assert not duplicates.check(make_item("b", 0, 0, 1, 1))
+    assert duplicates.check(make_item("b", 0, 0, 1, 1))
+
+    assert duplicates.seen_many([("landsat", "c"), ("landsat", "a"), ("landsat", "c")]).tolist() == [False, True, True]
+    assert duplicates.exact
+    assert duplicates.duplicates == 4
+    assert len(duplicates) == 7
+
+
+def test_duplicate_detector_spills_to_bloom_filter() -> None:
+    # a 100 KB budget keeps 390 keys exactly, then has a 50 KB filter
+    duplicates = DuplicateDetector(memory_budget=100_000, false_positive_rate=1e-3)
+    assert duplicates.capacity == 27_725
+    assert not duplicates.seen_many(("c", str(i)) for i in range(300)).any()
+    assert duplicates.exact
+    assert not any(duplicates.seen("c", str(i)) for i in range(300, 10_000))
+    assert not duplicates.exact
+    assert len(duplicates) == 10_000
+    assert duplicates.capacity == 27_725
+
+    # seen before, whether exactly or in the filter
+    assert duplicates.seen("c", "0")
+    assert duplicates.seen("c", "9999")
+    assert duplicates.seen_many([("c", "1"), ("c", "new"), ("c", "new")]).tolist() == [True, False, True]
+
+    # new keys are false positives at about the configured rate, which is lower below capacity
+    false_positives = duplicates.seen_many(("d", str(i)) for i in range(20_000)).mean()
+    assert false_positives < 1e-3
+    assert duplicates.duplicates == 4 + round(false_positives * 20_000)
+
+
+def test_duplicate_detector_spills_within_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a batch spills as soon as the exact set is over its half of the budget, with the rest of it in the filter
+    duplicates = DuplicateDetector(memory_budget=100_000, false_positive_rate=1e-3)
+    spill, sizes = DuplicateDetector._spill, []  # noqa: SLF001
+    monkeypatch.setattr(DuplicateDetector, "_spill", lambda self: (sizes.append(len(self._exact)), spill(self))[1])
+    keys = [("c", str(i)) for i in range(1_000)]
+    assert duplicates.seen_many(keys + keys[:1] + keys[500:501]).tolist() == [False] * 1_000 + [True, True]
+    assert sizes == [duplicates.max_exact_keys + 1]
+    assert not duplicates.exact
+    assert len(duplicates) == 1_000
+
+
+def test_duplicate_detector_invalid() -> None:
+    with pytest.raises(ValueError, match="false_positive_rate must be between 0 and 1"):
+        DuplicateDetector(false_positive_rate=0)
+
+
+def test_bloom_filter() -> None:
+    digests = [os.urandom(16) for _ in range(5_000)]
+    one_at_a_time, batched = BloomFilter(8_000_000, 7), BloomFilter(8_000_000, 7)
+    # the same bits and results either way, including for repeats within a batch
+    assert [one_at_a_time.add(digest) for digest in digests + digests[:10]] == batched.add_many(
+        digests + digests[:10]
+    ).tolist()
+    assert one_at_a_time._bytes == batched._bytes  # noqa: SLF001
+    assert one_at_a_time.count == batched.count == 5_000
+    assert batched.add_many([]).tolist() == []
+
+    small = BloomFilter(80_000, 7)
+    small.add_many(digests)
+    expected = small.false_positive_rate()
+    assert small.add_many(os.urandom(16) for _ in range(10_000)).mean() == pytest.approx(expected, abs=0.01)
@@ -0,0 +1,90 @@
+import copy
+import json
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from stac_factory.extent import EXTENT_FIELDS, ExtentAggregator
+from stac_factory.models import BBox2d, BBox3d, Item
+from stac_factory.projection import ItemProjection, scan_ndjson
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+
+
+def record(bbox: list[float], **properties: str | None) -> ItemProjection:
+    return EXTENT_FIELDS.model_validate({"bbox": bbox, "properties": {"datetime": None} | properties})
+
+
+def extent(*bboxes: list[float]) -> list[float] | None:
+    bbox = ExtentAggregator().update(record(bbox, datetime="2025-01-01T00:00:00Z") for bbox in bboxes).bbox
+    return None if bbox is None else bbox.model_dump()
+
+
+def test_extent(tmp_path: Path) -> None:
+    documents = [
+        json.dumps(json.loads((fixture_dir / name).read_text()))
+        for name in ["minimal.json", "S2B_T01WCR_20250427T000611_L2A.json"]
+    ]
+    items = ExtentAggregator().update(Item.model_validate_json(document) for document in documents)
+    ndjson = tmp_path / "items.ndjson"
+    ndjson.write_text("\n".join(documents))
+    records = ExtentAggregator().update(scan_ndjson(ndjson, EXTENT_FIELDS))
+
+    assert items.count == records.count == 2
+    assert items.bbox == records.bbox
+    assert items.interval == records.interval
+    assert items.interval[0] == datetime(2025, 4, 22, 9, 19, 42, 556000, tzinfo=UTC)
+    assert items.extent()["temporal"] == {"interval": [["2025-04-22T09:19:42.556000Z", "2025-04-27T00:07:21.580000Z"]]}
+
+
+def test_extent_intervals() -> None:
+    aggregator = ExtentAggregator().update(
+        [
+            record([0, 0, 1, 1], datetime="2025-01-02T00:00:00Z"),
+            record([0, 0, 1, 1], start_datetime="2024-12-31T00:00:00Z", end_datetime="2025-01-01T00:00:00Z"),
+            record([0, 0, 1, 1], datetime="2025-01-03T00:00:00+02:00"),
+        ]
+    )
+    assert aggregator.interval == (datetime(2024, 12, 31, tzinfo=UTC), datetime(2025, 1, 2, 22, tzinfo=UTC))
+
+
+def test_extent_antimeridian() -> None:
+    assert extent([10, -5, 20, 5], [-30, -10, -20, 0]) == [-30, -10, 20, 5]
+    # the narrower union is the one across the antimeridian
+    assert extent([170, 0, 175, 1], [-175, -1, -170, 0]) == [170, -1, -170, 1]
+    assert extent([170, 0, -170, 1], [160, -1, 165, 0]) == [160, -1, -170, 1]
+    assert extent([170, 0, -170, 1], [-180, 0, -160, 1]) == [170, 0, -160, 1]
+    assert extent([-180, 0, -170, 1], [-160, 0, -150, 1]) == [-180, 0, -150, 1]
+    # crossing both seams covers every longitude
+    assert extent([170, 0, -170, 1], [-1, 0, 1, 1]) == [-180, 0, 180, 1]
+    assert extent([10, 0, 5, 1]) == [-180, 0, 180, 1]
+
+
+def test_extent_merge() -> None:
+    records = [
+        record([170, 0, -170, 1], datetime="2025-01-02T00:00:00Z"),
+        record([160, 0, 10, 165, 1, 20], datetime="2025-01-01T00:00:00Z"),
+        record([-175, 0, -160, 1], start_datetime="2025-01-01T00:00:00Z", end_datetime="2025-01-05T00:00:00Z"),
+    ]
+    whole = ExtentAggregator().update(records)
+    parts = [ExtentAggregator().update(records[:1]), ExtentAggregator(), ExtentAggregator().update(records[1:])]
+    merged = ExtentAggregator()
+    for part in parts:
+        merged.merge(copy.deepcopy(part))
+    assert merged.count == 3
+    assert merged.bbox == whole.bbox == BBox2d(w_lon=160, s_lat=0, e_lon=-160, n_lat=1)
+    assert merged.interval == whole.interval == (datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 1, 5, tzinfo=UTC))
+
+
+def test_extent_elevation_and_empty() -> None:
+    aggregator = ExtentAggregator().update(
+        [
+            record([0, 0, -5, 1, 1, 10], datetime="2025-01-01T00:00:00Z"),
+            record([2, -1, 0, 3, 0, 2], datetime="2025-01-01T00:00:00Z"),
+        ]
+    )
+    assert aggregator.bbox == BBox3d(w_lon=0, s_lat=-1, bottom_elevation=-5, e_lon=3, n_lat=1, top_elevation=10)
+
+    empty = ExtentAggregator()
+    assert empty.bbox is None
+    assert empty.extent() == {"spatial": {"bbox": [[-180, -90, 180, 90]]}, "temporal": {"interval": [[None, None]]}}
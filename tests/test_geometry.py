@@ -0,0 +1,248 @@
+import json
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import shapely
+
+from pydantic import ValidationError
+
+from stac_factory.geometry import (
+    MAX_RING_VERTICES,
+    bbox_from_geometry,
+    bbox_mismatches,
+    bboxes_from_geometries,
+    geometry_bounds,
+    max_ring_vertices,
+    quantize_footprints,
+    quantized_json,
+    simplify_footprint,
+    simplify_footprints,
+)
+from stac_factory.models import Item, MultiPolygon, Polygon
+
+
+def circle(
+    vertices: int, lon: float = 0.0, lat: float = 0.0, radius: float = 1.0, *, clockwise: bool = False
+) -> shapely.Polygon:
+    angles = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+    if clockwise:
+        angles = -angles
+    return shapely.Polygon(np.c_[lon + radius * np.cos(angles), lat + radius * np.sin(angles)])
+
+
+def ring_sizes(geometry: Polygon | MultiPolygon) -> list[int]:
+    if isinstance(geometry, Polygon):
+        return [len(geometry.coordinates[0])]
+    return [len(polygon[0]) for polygon in geometry.coordinates]
+
+
+def test_simplify_footprints_to_vertex_budget() -> None:
+    footprints = [
+        circle(5000),
+        circle(300, clockwise=True),
+        shapely.MultiPolygon([circle(2000, lon=5), circle(100, lon=10)]),
+    ]
+    assert max_ring_vertices(footprints).tolist() == [5001, 301, 2001]
+
+    polygon, clockwise, multipolygon = simplify_footprints(footprints)
+
+    assert isinstance(polygon, Polygon)
+    assert 256 < ring_sizes(polygon)[0] <= MAX_RING_VERTICES
+    assert ring_sizes(clockwise) == [301]
+    assert shapely.is_ccw(clockwise.to_shapely().exterior)
+    assert isinstance(multipolygon, MultiPolygon)
+    assert ring_sizes(multipolygon)[0] <= MAX_RING_VERTICES
+    assert ring_sizes(multipolygon)[1] == 101
+
+
+def test_simplify_footprints_to_tolerance() -> None:
+    (footprint,) = simplify_footprints([circle(1000)], max_vertices=None, tolerance=0.01)
+    assert ring_sizes(footprint) == [33]
+    assert shapely.is_valid(footprint.to_shapely())
+
+
+def test_simplify_footprint_small_budget() -> None:
+    footprint = simplify_footprint(circle(1000), max_vertices=8)
+    assert ring_sizes(footprint)[0] <= 8
+    assert shapely.is_valid(footprint.to_shapely())
+
+
+def test_simplify_footprint_sliver_does_not_collapse() -> None:
+    sliver = shapely.Polygon([(0, 0), (1, 0), (0.5, 0.001), (0, 0)])
+    assert shapely.simplify(sliver, 0.01, preserve_topology=False).is_empty
+
+    footprint = simplify_footprint(sliver, max_vertices=None, tolerance=0.01)
+    assert ring_sizes(footprint) == [4]
+
+
+def test_simplify_footprint_drops_holes() -> None:
+    with_hole = shapely.Polygon(circle(600, radius=2).exterior, [circle(20, radius=0.5).exterior.coords[::-1]])
+    footprint = simplify_footprint(with_hole)
+    assert isinstance(footprint, Polygon)
+    assert len(footprint.coordinates) == 1
+
+
+def test_simplify_footprint_invalid_budget() -> None:
+    with pytest.raises(ValueError, match="max_vertices must be at least 4"):
+        simplify_footprint(circle(10), max_vertices=3)
+
+
+def test_simplify_footprint_for_item_create() -> None:
+    footprint = simplify_footprint(circle(4000, lon=10, lat=10))
+    Item.create(
+        extensions=[],
+        id="dense-footprint",
+        geometry=footprint,
+        bbox=[9, 9, 11, 11],
+        assets=[],
+        links=[],
+        datetime="2021-01-01T00:00:00Z",
+        collection=None,
+    )
+
+
+ANTIMERIDIAN_MULTIPOLYGON = {
+    "type": "MultiPolygon",
+    "coordinates": [
+        [
+            [
+                [180, 68.4858038539966],
+                [178.11849452315352, 68.44150171742469],
+                [178.32076050993456, 67.46099994484686],
+                [180, 67.50167854411256],
+                [180, 68.4858038539966],
+            ]
+        ],
+        [
+            [
+                [-179.20556042231803, 68.49813373282021],
+                [-180, 68.4858038540324],
+                [-180, 67.50167854415058],
+                [-179.31735654435366, 67.51320396474968],
+                [-179.12603876314654, 67.65097850440162],
+                [-179.20556042231803, 68.49813373282021],
+            ]
+        ],
+    ],
+}
+
+
+def test_bboxes_from_geometries() -> None:
+    square = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[100.0, 0.0], [101.0, 0.0], [101.0, 1.0], [100.0, 1.0], [100.0, 0.0]]]}
+    )
+    split = MultiPolygon.model_validate(ANTIMERIDIAN_MULTIPOLYGON)
+    apart = MultiPolygon.model_validate(
+        {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[[10, 10], [11, 10], [11, 11], [10, 11], [10, 10]]],
+                [[[-20, -5], [-19, -5], [-19, -4], [-20, -4], [-20, -5]]],
+            ],
+        }
+    )
+
+    assert [bbox.model_dump() for bbox in bboxes_from_geometries([square, split, apart])] == [
+        [100.0, 0.0, 101.0, 1.0],
+        [178.11849452315352, 67.46099994484686, -179.12603876314654, 68.49813373282021],
+        [-20.0, -5.0, 11.0, 11.0],
+    ]
+    assert bboxes_from_geometries([]) == []
+    assert bboxes_from_geometries([], include_elevation=True) == []
+    assert geometry_bounds([]).shape == (0, 4)
+    assert geometry_bounds([], include_elevation=True).shape == (0, 6)
+
+
+def test_bbox_from_geometry_with_elevation() -> None:
+    tent = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[0, 0, 10], [1, 0, 20], [1, 1, 30], [0, 1, 20], [0, 0, 10]]]}
+    )
+    assert bbox_from_geometry(tent, include_elevation=True).model_dump() == [0, 0, 10, 1, 1, 30]
+    assert bbox_from_geometry(tent).model_dump() == [0, 0, 1, 1]
+
+    mixed = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0, 20], [1, 1, 30], [0, 1], [0, 0]]]}
+    )
+    assert bbox_from_geometry(mixed, include_elevation=True).model_dump() == [0, 0, 20, 1, 1, 30]
+
+
+def test_bbox_mismatches() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item_dict = json.loads(Path(fixture_dir / "S2B_T01WCR_20250427T000611_L2A.json").read_text())
+    matching = Item.model_validate(item_dict)
+
+    item_dict = json.loads(Path(fixture_dir / "minimal.json").read_text())
+    item_dict["bbox"] = [47.0, 72.7, 48.4, 73.0]
+    rounded = Item.model_validate(item_dict)
+
+    assert bbox_mismatches([matching, rounded]).tolist() == [False, True]
+    assert bbox_mismatches([matching, rounded], tolerance=0.1).tolist() == [False, False]
+    assert bbox_mismatches([]).tolist() == []
+
+
+def test_item_bbox_tolerance_context() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item_dict = json.loads(Path(fixture_dir / "minimal.json").read_text())
+    Item.model_validate(dict(item_dict, properties=dict(item_dict["properties"])), context={"bbox_tolerance": 1e-6})
+
+    item_dict["bbox"] = [47.0, 72.7, 48.4, 73.0]
+    Item.model_validate(dict(item_dict, properties=dict(item_dict["properties"])))
+    with pytest.raises(ValidationError, match="bbox does not match the geometry bounds"):
+        Item.model_validate(item_dict, context={"bbox_tolerance": 1e-6})
+
+
+def test_quantize_footprints() -> None:
+    square = Polygon.model_validate(
+        {
+            "type": "Polygon",
+            "coordinates": [[[100.00049, 0.0], [101.0, 0.00051], [101.0, 1.0], [100.0, 1.0], [100.00049, 0.0]]],
+        }
+    )
+    split = MultiPolygon.model_validate(ANTIMERIDIAN_MULTIPOLYGON)
+    speck = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[10.0, 10.0], [10.0001, 10.0], [10.0001, 10.0001], [10.0, 10.0]]]}
+    )
+    tent = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[0, 0, 10.0001], [1, 0, 10.0002], [1, 1, 10.0002], [0, 0, 10.0001]]]}
+    )
+    mixed = Polygon.model_validate(
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0, 20], [1, 1, 30], [0, 1], [0, 0]]]}
+    )
+    geometries = [square, split, speck, tent, mixed]
+    bboxes = bboxes_from_geometries(geometries[:3]) + bboxes_from_geometries(geometries[3:], include_elevation=True)
+    quantized = quantize_footprints(geometries, bboxes, 3)
+
+    assert quantized[0] == (
+        [[[100.0, 0.0], [101.0, 0.001], [101.0, 1.0], [100.0, 1.0], [100.0, 0.0]]],
+        [100.0, 0.0, 101.0, 1.0],
+    )
+    coordinates, bbox = quantized[1]  # type: ignore[misc]
+    rounded = MultiPolygon.model_validate({"type": "MultiPolygon", "coordinates": coordinates})
+    assert {position.longitude for polygon in rounded.coordinates for position in polygon[0]} >= {180.0, -180.0}
+    assert all(shapely.is_ccw(polygon.exterior) for polygon in rounded.to_shapely().geoms)
+    assert bbox == [178.118, 67.461, -179.126, 68.498]
+    # the speck collapses to a point, so is written as it is
+    assert quantized[2] is None
+    assert quantize_footprints([speck], bboxes[2:3], 4)[0] is not None
+    # rounding the elevations would make the bbox empty
+    assert quantized[3] is None
+    assert quantized[4] is None
+    assert quantize_footprints([], [], 3) == []
+
+
+def test_quantized_json() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item = Item.model_validate_json((fixture_dir / "S2B_T01WCR_20250427T000611_L2A.json").read_text())
+    full = item.model_dump_json()
+    (batch,) = quantized_json([item], 5)
+    single = item.model_dump_json(context={"precision": 5})
+    assert batch.decode() == single
+    assert len(single) < len(full)
+
+    # the fixture's bbox was rounded to 6 decimal places, so rounding it again can differ by a unit
+    rounded = Item.model_validate_json(single, context={"bbox_tolerance": 1e-4})
+    assert rounded.geometry.type == item.geometry.type
+    assert json.loads(single)["bbox"] == np.round(item.bbox.model_dump(), 5).tolist()
+    assert item.model_dump_json(context={"precision": None}) == full
@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from stac_factory.index import ItemIndex
+from stac_factory.models import BBox2d, Item, MultiPolygon, Polygon
+
+
+def make_item(
+    id: str,
+    w_lon: float,
+    s_lat: float,
+    e_lon: float,
+    n_lat: float,
+    *,
+    day: int = 1,
+    end_day: int | None = None,
+) -> Item:
+    return Item.create(
+        extensions=[],
+        id=id,
+        geometry={
+            "type": "Polygon",
+            "coordinates": [[[w_lon, s_lat], [e_lon, s_lat], [e_lon, n_lat], [w_lon, n_lat], [w_lon, s_lat]]],
+        },
+        bbox=[w_lon, s_lat, e_lon, n_lat],
+        assets=[],
+        links=[],
+        datetime=None if end_day else datetime(2021, 1, day, tzinfo=timezone.utc),
+        start_datetime=datetime(2021, 1, day, tzinfo=timezone.utc) if end_day else None,
+        end_datetime=datetime(2021, 1, end_day, tzinfo=timezone.utc) if end_day else None,
+        collection=None,
+    )
+
+
+@pytest.fixture
+def items() -> list[Item]:
+    return [
+        make_item("a", 0, 0, 1, 1, day=1),
+        make_item("b", 10, 10, 11, 11, day=2),
+        make_item("c", 0.5, 0.5, 2, 2, day=3),
+        make_item("d", 0, 0, 1, 1, day=1, end_day=20),
+    ]
+
+
+def ids(items: list[Item]) -> list[str]:
+    return [item.id for item in items]
+
+
+@pytest.mark.parametrize("rebuild_threshold", [0, 100], ids=["indexed", "pending"])
+def test_item_index_query(items: list[Item], rebuild_threshold: int) -> None:
+    index = ItemIndex(items, rebuild_threshold=rebuild_threshold)
+    assert len(index) == 4
+
+    area = BBox2d(w_lon=0.8, s_lat=0.8, e_lon=1.5, n_lat=1.5)
+    assert ids(index.query(area)) == ["a", "c", "d"]
+    assert ids(index.query(start=datetime(2021, 1, 2, tzinfo=timezone.utc))) == ["b", "c", "d"]
+    assert ids(index.query(end=datetime(2021, 1, 1, tzinfo=timezone.utc))) == ["a", "d"]
+    assert ids(
+        index.query(
+            area,
+            start=datetime(2021, 1, 10, tzinfo=timezone.utc),
+            end=datetime(2021, 1, 11, tzinfo=timezone.utc),
+        )
+    ) == ["d"]
+    assert ids(index.query()) == ["a", "b", "c", "d"]
+
+
+def test_item_index_insert_after_build(items: list[Item]) -> None:
+    index = ItemIndex(items[:2], rebuild_threshold=1)
+    index.build()
+    index.insert(items[2])
+    assert ids(index.query(BBox2d(w_lon=1.5, s_lat=1.5, e_lon=3, n_lat=3))) == ["c"]
+
+    index.insert(items[3])
+    assert ids(index.query(start=datetime(2021, 1, 5, tzinfo=timezone.utc))) == ["d"]
+    assert ids(index.query(BBox2d(w_lon=0, s_lat=0, e_lon=0.1, n_lat=0.1))) == ["a", "d"]
+
+
+def test_item_index_antimeridian_bbox() -> None:
+    index = ItemIndex([make_item("east", 179, 0, 179.5, 1), make_item("west", -179.5, 0, -179, 1)])
+    assert ids(index.query(BBox2d(w_lon=178, s_lat=0, e_lon=-178, n_lat=1))) == ["east", "west"]
+    assert ids(index.query(BBox2d(w_lon=-170, s_lat=0, e_lon=170, n_lat=1))) == []
+
+
+def test_item_index_antimeridian_crossing_item() -> None:
+    crossing = Item.model_validate(
+        make_item("crossing", 179, 0, 179.5, 1).model_dump(mode="json") | {"bbox": [179, 0, -179, 1]}
+    )
+    index = ItemIndex([crossing, make_item("middle", 0, 0, 1, 1)])
+    assert ids(index.query(BBox2d(w_lon=-179.5, s_lat=0, e_lon=-179.2, n_lat=1))) == ["crossing"]
+    assert ids(index.query(BBox2d(w_lon=179.5, s_lat=0, e_lon=179.9, n_lat=1))) == ["crossing"]
+    assert ids(index.query(BBox2d(w_lon=-10, s_lat=0, e_lon=10, n_lat=1))) == ["middle"]
+
+
+def test_item_index_use_geometry() -> None:
+    triangle = Item.create(
+        extensions=[],
+        id="triangle",
+        geometry={"type": "Polygon", "coordinates": [[[0, 0], [4, 0], [0, 4], [0, 0]]]},
+        bbox=[0, 0, 4, 4],
+        assets=[],
+        links=[],
+        datetime=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        collection=None,
+    )
+    corner = Polygon.model_validate({"type": "Polygon", "coordinates": [[[3, 3], [4, 3], [4, 4], [3, 4], [3, 3]]]})
+
+    assert ids(ItemIndex([triangle]).query(corner)) == ["triangle"]
+    assert ids(ItemIndex([triangle], use_geometry=True).query(corner)) == []
+
+    both = MultiPolygon.model_validate(
+        {
+            "type": "MultiPolygon",
+            "coordinates": [corner.model_dump()["coordinates"], [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]],
+        }
+    )
+    assert ids(ItemIndex([triangle], use_geometry=True).query(both)) == ["triangle"]
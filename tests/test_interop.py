@@ -0,0 +1,99 @@
+import json
+
+from pathlib import Path
+from typing import Any
+
+import pystac
+import pytest
+
+from stac_factory.constants import HttpMethod
+from stac_factory.interop import from_pystac, to_pystac
+from stac_factory.models import EOExtension, Item, ViewExtension
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _without_nulls(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        return {k: _without_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_without_nulls(v) for v in value]
+    return value
+
+
+@pytest.fixture
+def item() -> Item:
+    return Item.create(
+        extensions=[EOExtension.create(cloud_cover=3.14), ViewExtension.create(off_nadir=10.5)],
+        id="item-1",
+        geometry={
+            "type": "Polygon",
+            "coordinates": [[[100.0, 0.0], [101.0, 0.0], [101.0, 1.0], [100.0, 1.0], [100.0, 0.0]]],
+        },
+        bbox=[100, 0, 101, 1],
+        assets=[
+            {"name": "data", "href": "https://example.com/data.tif", "type": "image/tiff", "roles": ["data"]},
+            {"name": "thumbnail", "href": "https://example.com/thumbnail.png", "title": "Thumbnail"},
+        ],
+        links=[
+            {"href": "https://example.com/item-1.json", "rel": "self", "type": "application/json"},
+            {
+                "href": "https://example.com/search",
+                "rel": "related",
+                "method": HttpMethod.POST,
+                "body": {"ids": ["item-1"]},
+            },
+        ],
+        collection="collection-1",
+        datetime=None,
+        start_datetime="2021-01-01T00:00:00Z",
+        end_datetime="2021-01-03T00:00:00.5Z",
+        created="2021-01-04T00:00:00Z",
+        title="Item 1",
+        keywords=["a", "b"],
+        license="CC-BY-4.0",
+        providers=[{"name": "ESA", "description": "the ESA", "roles": ["producer"], "url": "https://esa.int"}],
+        bands=[{"name": "red", "description": "Red"}],
+        gsd=10.0,
+    )
+
+
+def test_to_pystac_matches_from_dict(item: Item) -> None:
+    direct = to_pystac(item)
+    via_dict = pystac.Item.from_dict(_without_nulls(item.model_dump(mode="json")), migrate=False)
+    assert direct.to_dict(transform_hrefs=False) == via_dict.to_dict(transform_hrefs=False)
+    assert direct.properties["eo:cloud_cover"] == 3.14
+    assert direct.assets["data"].owner is direct
+    assert direct.get_self_href() == "https://example.com/item-1.json"
+
+
+def test_to_pystac_copies_mutable_fields(item: Item) -> None:
+    converted = item.to_pystac()
+    converted.properties["keywords"].append("c")
+    converted.geometry["coordinates"][0][0][0] = 0.0
+    assert item.keywords == ["a", "b"]
+    assert item.geometry.coordinates[0][0].longitude == 100.0
+
+
+def test_from_pystac_round_trip(item: Item) -> None:
+    # extension models aren't populated from properties, as with any other validation
+    converted = from_pystac(to_pystac(item))
+    assert converted.stac_extensions == [extension.id for extension in item.extensions]
+    assert converted == item.model_copy(update={"extensions": [], "stac_extensions": converted.stac_extensions})
+
+
+@pytest.mark.parametrize("fixture", ["S2B_T01WCR_20250427T000611_L2A.json", "S2B_T38XNF_20250422T091553_L2A.json"])
+def test_from_pystac_matches_model_validate(fixture: str) -> None:
+    raw = (FIXTURES / fixture).read_text()
+    item = Item.model_validate_json(raw)
+    converted = Item.from_pystac(pystac.Item.from_dict(json.loads(raw), migrate=False))
+    # the common metadata in properties, which validating the JSON ignores
+    common = {"created", "updated", "platform", "instruments", "constellation"}
+    assert converted.platform == "sentinel-2b"
+    assert converted.instruments == ["msi"]
+    # pystac writes the version it implements
+    assert converted.stac_version == "1.1.0"
+    assert converted == item.model_copy(update={name: getattr(converted, name) for name in {*common, "stac_version"}})
+    assert Item.from_pystac(item.to_pystac()).model_dump_json(exclude={"stac_version"}) == item.model_dump_json(
+        exclude={"stac_version"}
+    )
@@ -665,3 +665,80 @@ def test_item_with_valid_datetime_combinations(
     item_dict["properties"]["start_datetime"] = start_datetime
     item_dict["properties"]["end_datetime"] = end_datetime
     Item.model_validate(item_dict)
+
+
+def test_item_canonical_json() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item = Item.model_validate(json.loads(Path(fixture_dir / "minimal.json").read_text()))
+
+    canonical = item.canonical_json()
+    assert canonical == item.canonical_json()
+    assert canonical == json.dumps(json.loads(canonical), sort_keys=True, separators=(",", ":")).encode()
+
+    parsed = json.loads(canonical)
+    assert list(parsed) == sorted(parsed)
+    assert parsed["properties"]["datetime"] == "2025-04-22T09:19:42.556000Z"
+
+
+def test_item_canonical_json_normalizes_negative_zero() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item_dict = json.loads(Path(fixture_dir / "minimal.json").read_text())
+    item_dict["bbox"] = [-0.0, 0.0, 1.0, 1.0]
+    negative = Item.model_validate(item_dict)
+    item_dict = json.loads(Path(fixture_dir / "minimal.json").read_text())
+    item_dict["bbox"] = [0.0, 0.0, 1.0, 1.0]
+    positive = Item.model_validate(item_dict)
+
+    assert b"-0.0" not in negative.canonical_json()
+    assert negative.fingerprint == positive.fingerprint
+
+
+def test_item_fingerprint() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item = Item.model_validate(json.loads(Path(fixture_dir / "S2B_T38XNF_20250422T091553_L2A.json").read_text()))
+
+    assert item.fingerprint is item.fingerprint
+    assert item.model_copy().fingerprint == item.fingerprint
+
+    retitled = item.model_copy(update={"title": "Retitled"})
+    assert retitled.fingerprint.content != item.fingerprint.content
+    assert retitled.fingerprint.properties != item.fingerprint.properties
+    assert retitled.fingerprint.geometry == item.fingerprint.geometry
+    assert retitled.fingerprint.links == item.fingerprint.links
+    assert retitled.fingerprint.assets == item.fingerprint.assets
+
+
+def test_item_fingerprint_of_parsed_properties() -> None:
+    # only the datetimes of the properties are parsed, so they're the only properties in the fingerprint
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item_dict = json.loads(Path(fixture_dir / "S2B_T38XNF_20250422T091553_L2A.json").read_text())
+    item = Item.model_validate(item_dict)
+
+    item_dict["properties"] |= {"platform": "sentinel-2a", "updated": "2025-05-01T00:00:00Z", "eo:cloud_cover": 10.0}
+    assert Item.model_validate(item_dict).fingerprint == item.fingerprint
+
+    item_dict["properties"]["datetime"] = "2025-04-22T09:19:43Z"
+    assert Item.model_validate(item_dict).fingerprint.properties != item.fingerprint.properties
+
+
+def test_item_lookups() -> None:
+    fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+    item = Item.model_validate(json.loads(Path(fixture_dir / "S2B_T38XNF_20250422T091553_L2A.json").read_text()))
+
+    assert item.links_by_rel is item.links_by_rel
+    assert [link.rel for link in item.links_by_rel[LinkRelation.self]] == ["self"]
+    assert "alternate" not in item.links_by_rel
+    assert item.assets_by_name["red"] is item.assets[0]
+    assert [asset.name for asset in item.assets_by_role[AssetRole.metadata]] == [
+        "granule_metadata",
+        "tileinfo_metadata",
+        "product_metadata",
+    ]
+    assert [asset.name for asset in item.assets_by_role["visual"]] == ["visual"]
+
+    # dropped with the assets they were built from
+    red = item.assets_by_name["red"]
+    renamed = item.model_copy(update={"assets": [red.model_copy(update={"name": "B04"}), *item.assets[1:]]})
+    assert "red" not in renamed.assets_by_name
+    assert renamed.assets_by_name["B04"].href == red.href
+    assert item.model_copy(deep=True) == item
@@ -0,0 +1,109 @@
+import copy
+import gzip
+import json
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from stac_factory.cli.__main__ import app
+from stac_factory.migrate import migrate_item, migrate_lines, read_lines, write_migrated
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+OLD = json.loads((fixture_dir / "S2B_T01WCR_20250427T000611_L2A.json").read_text())
+CURRENT = json.dumps(json.loads((fixture_dir / "minimal.json").read_text())).encode()
+
+
+def test_migrate_item() -> None:
+    item = copy.deepcopy(OLD)
+    assert migrate_item(item) == ("stac_version", "bands", "proj:code", "extensions")
+    assert item["stac_version"] == "1.1.0"
+    assert item["properties"]["proj:code"] == "EPSG:32601"
+    assert "proj:epsg" not in item["properties"]
+    assert "https://stac-extensions.github.io/eo/v2.0.0/schema.json" in item["stac_extensions"]
+    assert "https://stac-extensions.github.io/raster/v2.0.0/schema.json" in item["stac_extensions"]
+    assert "https://stac-extensions.github.io/projection/v2.0.0/schema.json" in item["stac_extensions"]
+    assert "https://stac-extensions.github.io/view/v1.0.0/schema.json" in item["stac_extensions"]
+    assert not any("eo:bands" in asset or "raster:bands" in asset for asset in item["assets"].values())
+    assert item["assets"]["red"]["bands"] == [
+        {
+            "name": "B04",
+            "eo:common_name": "red",
+            "eo:center_wavelength": 0.665,
+            "eo:full_width_half_max": 0.038,
+            "nodata": 0,
+            "data_type": "uint16",
+            "raster:spatial_resolution": 10,
+            "raster:scale": 0.0001,
+            "raster:offset": -0.1,
+        }
+    ]
+    assert item["assets"]["scl"]["bands"] == [{"nodata": 0, "data_type": "uint8", "raster:spatial_resolution": 20}]
+    assert len(item["assets"]["preview"]["bands"]) == 3
+    # the rest is as it was
+    assert item["properties"]["s2:tile_id"] == OLD["properties"]["s2:tile_id"]
+    assert migrate_item(item) == ()
+
+
+def test_migrate_item_rules() -> None:
+    item = {"stac_version": "1.0.0", "properties": {"license": "proprietary", "proj:epsg": None}}
+    assert migrate_item(item) == ("stac_version", "proj:code", "license")
+    assert item["properties"] == {"license": "other", "proj:code": None}
+
+    with pytest.raises(ValueError, match="eo:bands has 2 bands and raster:bands 1"):
+        migrate_item({"properties": {"eo:bands": [{}, {}], "raster:bands": [{}]}})
+    with pytest.raises(ValueError, match="bands is already set"):
+        migrate_item({"assets": {"a": {"bands": [], "eo:bands": []}}})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_migrate_lines(tmp_path: Path, workers: int) -> None:
+    invalid = copy.deepcopy(OLD)
+    invalid["properties"]["datetime"] = None
+    lines = [
+        ("old:1", json.dumps(OLD).encode()),
+        ("current:1", CURRENT),
+        ("invalid:1", json.dumps(invalid).encode()),
+        (
+            "mismatched:1",
+            json.dumps(OLD | {"assets": {"a": {"href": "a.tif", "eo:bands": [{}], "raster:bands": []}}}).encode(),
+        ),
+        ("not json:1", b"{"),
+    ]
+    output = BytesIO()
+    dead_letter = tmp_path / "dead-letter.ndjson"
+    stats = write_migrated(migrate_lines(lines, workers=workers, batch_size=2), output, dead_letter)
+    assert stats.items == 2
+    assert stats.current == 1
+    assert stats.failures == 3
+    assert stats.rules == {"stac_version": 1, "bands": 1, "proj:code": 1, "extensions": 1, "license": 0}
+
+    migrated, current = output.getvalue().splitlines()
+    assert json.loads(migrated)["stac_version"] == "1.1.0"
+    # an Item that's already current is written as it was
+    assert current == CURRENT
+    failures = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert [failure["source"] for failure in failures] == ["invalid:1", "mismatched:1", "not json:1"]
+    assert failures[0]["error"]["type"] == "ValidationError"
+    assert failures[1]["error"]["type"] == "ValueError"
+
+
+def test_cli_migrate(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    source = tmp_path / "items.ndjson.gz"
+    source.write_bytes(gzip.compress(json.dumps(OLD).encode() + b"\n\n" + CURRENT + b"\n"))
+    assert [line[0] for line in read_lines([source])] == [f"{source}:1", f"{source}:3"]
+    output = tmp_path / "migrated.ndjson"
+
+    app(["migrate", str(source), "--output", str(output), "--workers", "1"])
+    assert [json.loads(line)["stac_version"] for line in output.read_bytes().splitlines()] == ["1.1.0", "1.1.0"]
+    captured = capsys.readouterr()
+    assert "2 items" in captured.err
+    assert "1 already current" in captured.err
+    assert "bands: 1" in captured.err
+
+    dead_letter = tmp_path / "dead-letter.ndjson"
+    source.write_bytes(gzip.compress(b"{\n"))
+    app(["migrate", str(source), "--dead-letter", str(dead_letter), "--workers", "1"])
+    assert "1 failures" in capsys.readouterr().err
+    assert dead_letter.exists()
@@ -3,7 +3,19 @@ import pytest
 from pydantic import AnyUrl, ValidationError
 
 from stac_factory.constants import AssetRole, HttpMethod, LinkRelation, MediaType
-from stac_factory.models import Asset, BBox2d, BBox3d, Link, Polygon
+from stac_factory.models import (
+    GEOMETRY_CACHE_SIZE,
+    URL_CACHE_SIZE,
+    Asset,
+    BBox2d,
+    BBox3d,
+    Link,
+    Polygon,
+    clear_geometry_cache,
+    clear_url_cache,
+    geometry_cache_info,
+    url_cache_info,
+)
 
 
 def test_bbox2d() -> None:
@@ -151,3 +163,34 @@ def test_asset_create() -> None:
         type=MediaType.JSON,
         roles=[AssetRole.data],
     )
+
+
+def test_link_href_cached() -> None:
+    clear_url_cache()
+    assert url_cache_info().hit_rate == 0.0
+
+    links = [Link.model_validate({"href": "https://example.com/license", "rel": "license"}) for _ in range(4)]
+    assert links[0].href is links[3].href
+    info = url_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.size) == (3, 1, URL_CACHE_SIZE, 1)
+    assert info.hit_rate == 0.75
+
+    with pytest.raises(ValidationError, match="href"):
+        Link.model_validate({"href": "not a url", "rel": "license"})
+    assert url_cache_info().size == 1
+
+
+def test_polygon_validation_cached() -> None:
+    clear_geometry_cache()
+    assert geometry_cache_info().hit_rate == 0.0
+
+    footprint = {"type": "Polygon", "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]}
+    for _ in range(3):
+        Polygon.model_validate(footprint)
+    clockwise = {"type": "Polygon", "coordinates": [footprint["coordinates"][0][::-1]]}
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="counter-clockwise"):
+            Polygon.model_validate(clockwise)
+    info = geometry_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.size) == (3, 2, GEOMETRY_CACHE_SIZE, 2)
+    assert info.hit_rate == 0.6
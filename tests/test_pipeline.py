@@ -0,0 +1,64 @@
+import json
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pydantic import ValidationError
+
+from stac_factory.models import Item
+from stac_factory.pipeline import DeadLetters, error_details, map_bounded
+
+
+def test_error_details() -> None:
+    assert error_details(KeyError("datetime")) == {"type": "KeyError", "message": "'datetime'"}
+    with pytest.raises(ValidationError) as e:
+        Item.model_validate_json(b"{")
+    details = error_details(e.value)
+    assert details["type"] == "ValidationError"
+    assert [error["type"] for error in details["errors"]] == ["json_invalid"]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_map_bounded(ordered: bool) -> None:  # noqa: FBT001
+    submitted = 0
+
+    def batches() -> Iterator[int]:
+        nonlocal submitted
+        for batch in range(20):
+            submitted += 1
+            yield batch
+
+    results: list[int] = []
+    in_flight = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for result in map_bounded(executor, lambda batch: batch * batch, batches(), in_flight=3, ordered=ordered):
+            in_flight.append(submitted - len(results))
+            results.append(result)
+    expected = [batch * batch for batch in range(20)]
+    assert results == expected if ordered else sorted(results) == expected
+    assert max(in_flight) == 3
+
+
+def test_dead_letters(tmp_path: Path) -> None:
+    path = tmp_path / "dead-letter.ndjson"
+    with DeadLetters(path) as failed:
+        pass
+    assert not path.exists()
+    assert failed.count == 0
+
+    with DeadLetters(path) as failed:
+        failed.write("records.jsonl:1", {"type": "KeyError", "message": "'id'"})
+        failed.write("records.jsonl:2", None)
+    assert failed.count == 2
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [
+        {"source": "records.jsonl:1", "error": {"type": "KeyError", "message": "'id'"}},
+        {"source": "records.jsonl:2", "error": None},
+    ]
+
+    # a run without failures removes the failures of the run before
+    with DeadLetters(path):
+        pass
+    assert not path.exists()
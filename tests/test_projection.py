@@ -0,0 +1,70 @@
+import json
+import lzma
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from pydantic import ValidationError
+
+from stac_factory.models import BBox2d, Item
+from stac_factory.projection import project, scan_ndjson
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+DOCUMENT = (fixture_dir / "S2B_T38XNF_20250422T091553_L2A.json").read_bytes()
+
+
+def test_project() -> None:
+    inventory = project("id", "collection", "bbox", "datetime", "platform", "eo:cloud_cover")
+    record = inventory.model_validate_json(DOCUMENT)
+    item = Item.model_validate_json(DOCUMENT)
+
+    assert record.id == item.id  # type: ignore[attr-defined]
+    assert record.collection == "sentinel-2-c1-l2a"  # type: ignore[attr-defined]
+    assert record.bbox == item.bbox  # type: ignore[attr-defined]
+    assert isinstance(record.bbox, BBox2d)  # type: ignore[attr-defined]
+    assert record.datetime == datetime(2025, 4, 22, 9, 19, 42, 556000, tzinfo=UTC)  # type: ignore[attr-defined]
+    assert record.platform == "sentinel-2b"  # type: ignore[attr-defined]
+    assert record.eo_cloud_cover == 91.145676  # type: ignore[attr-defined]
+    assert set(inventory.model_fields) == {"id", "collection", "bbox", "datetime", "platform", "eo_cloud_cover"}
+    assert project("id", "collection", "bbox", "datetime", "platform", "eo:cloud_cover") is inventory
+
+
+def test_project_validates_named_fields_only() -> None:
+    document = json.loads(DOCUMENT)
+    document["assets"]["red"]["href"] = "not a url"
+    document["links"] = "not a list"
+    record = project("id", "stac_extensions").model_validate(document)
+    assert record.id == "S2B_T38XNF_20250422T091553_L2A"  # type: ignore[attr-defined]
+
+    with pytest.raises(ValidationError, match="assets"):
+        project("id", "assets").model_validate(document)
+    document["bbox"] = [1, 2, 3]
+    with pytest.raises(ValidationError, match="4 or 6 coordinates"):
+        project("bbox").model_validate(document)
+    document["stac_extensions"] *= 2
+    with pytest.raises(ValidationError, match="unique"):
+        project("stac_extensions").model_validate(document)
+    document["properties"]["datetime"] = "2025-04-22T09:19:42"
+    with pytest.raises(ValidationError, match="timezone"):
+        project("datetime").model_validate(document)
+
+
+def test_project_properties() -> None:
+    record = project("id", properties={"s2:product_type": str, "missing": int}).model_validate_json(DOCUMENT)
+    assert record.s2_product_type == "S2MSI2A"  # type: ignore[attr-defined]
+    assert record.missing is None  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError, match="s2:product_type isn't an Item field"):
+        project("s2:product_type")
+    with pytest.raises(ValueError, match="at least one field"):
+        project()
+
+
+def test_scan_ndjson(tmp_path: Path) -> None:
+    path = tmp_path / "items.ndjson.xz"
+    path.write_bytes(lzma.compress(json.dumps(json.loads(DOCUMENT)).encode() + b"\n\n" + DOCUMENT.replace(b"\n", b"")))
+    records = list(scan_ndjson(path, project("id", "view:off_nadir")))
+    assert [record.id for record in records] == ["S2B_T38XNF_20250422T091553_L2A"] * 2
+    assert records[0].view_off_nadir is None  # type: ignore[attr-defined]
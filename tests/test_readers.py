@@ -0,0 +1,113 @@
+import gzip
+import io
+import json
+
+from pathlib import Path
+
+import pytest
+import zstandard
+
+from pydantic import ValidationError
+
+from stac_factory import readers
+from stac_factory.readers import feature_spans, read_feature_collection, stream_features
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+
+FIXTURES = ["minimal.json", "typical.json", "S2B_T01WCR_20250427T000611_L2A.json"]
+
+
+@pytest.fixture
+def feature_collection(tmp_path: Path) -> Path:
+    features = [json.loads((fixture_dir / name).read_text()) for name in FIXTURES * 2]
+    path = tmp_path / "collection.json"
+    # "features" also appears nested and as a string value, and brackets appear inside strings
+    path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "description": 'not "features": [{',
+                "context": {"features": [{"id": "nested"}]},
+                "features": features,
+                "links": [{"rel": "self", "href": "https://example.com/{features}"}],
+            },
+            indent=2,
+        )
+    )
+    return path
+
+
+def test_feature_spans(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = b'{"features" : [ {"id": "a", "x": {"y": "}"}} , {"id": "b\\\\\\"}"}, [{}], {"id": "\\\\"} ], "z": [{}]}'
+    expected = ["a", 'b\\"}', "\\"]
+    assert [json.loads(buffer[start:end])["id"] for start, end in feature_spans(buffer)] == expected
+
+    # features and escapes split across chunks
+    for chunk_size in range(1, len(buffer)):
+        monkeypatch.setattr(readers, "_CHUNK_SIZE", chunk_size)
+        assert [json.loads(buffer[start:end])["id"] for start, end in feature_spans(buffer)] == expected
+
+    assert list(feature_spans(b'{"type": "features", "features": []}')) == []
+    assert list(feature_spans(b'{"id": "not a collection"}')) == []
+
+
+def test_stream_features(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = b'{"features" : [ {"id": "a", "x": {"y": "}"}} , {"id": "b\\\\\\"}"}, [{}], {"id": "\\\\"} ], "z": [{}]}'
+    expected = ["a", 'b\\"}', "\\"]
+    for chunk_size in range(1, len(buffer) + 1):
+        monkeypatch.setattr(readers, "_CHUNK_SIZE", chunk_size)
+        assert [json.loads(feature)["id"] for feature in stream_features(io.BytesIO(buffer))] == expected
+    assert list(stream_features(io.BytesIO(b'{"id": "not a collection"}'))) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_feature_collection(feature_collection: Path, workers: int) -> None:
+    items = list(read_feature_collection(feature_collection, workers=workers, chunk_size=1))
+    assert [item.id for item in items] == [json.loads((fixture_dir / name).read_text())["id"] for name in FIXTURES * 2]
+
+
+def test_read_feature_collection_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": [{"type": "Feature"}]}))
+    with pytest.raises(ValidationError):
+        list(read_feature_collection(path))
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_read_feature_collection_invalid_in_chunk(tmp_path: Path, compressed: bool) -> None:  # noqa: FBT001
+    # the Items before an invalid feature in the same chunk are read before its error
+    valid = json.loads((fixture_dir / "minimal.json").read_text())
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": [valid, {"type": "Feature"}, valid]}))
+    if compressed:
+        path = path.with_suffix(".json.gz")
+        path.write_bytes(gzip.compress((tmp_path / "collection.json").read_bytes()))
+    items = read_feature_collection(path, workers=2)
+    assert next(items).id == valid["id"]
+    with pytest.raises(ValidationError):
+        next(items)
+
+
+def test_validate_chunk_in_worker(feature_collection: Path) -> None:
+    spans = tuple(feature_spans(feature_collection.read_bytes()))
+    items, error = readers._validate_spans(feature_collection, spans)  # noqa: SLF001
+    assert len(items) == len(spans)
+    assert error is None
+
+    features = (b'{"type": "Feature"}', feature_collection.read_bytes()[slice(*spans[0])])
+    assert readers._validate_features(features)[0] == []  # noqa: SLF001
+    assert isinstance(readers._validate_features(features[::-1])[1], ValidationError)  # noqa: SLF001
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_feature_collection_compressed(feature_collection: Path, workers: int) -> None:
+    data = feature_collection.read_bytes()
+    gzipped = feature_collection.with_suffix(".json.gz")
+    gzipped.write_bytes(gzip.compress(data))
+    frames = feature_collection.with_suffix(".json.zst")
+    compressor = zstandard.ZstdCompressor()
+    frames.write_bytes(b"".join(compressor.compress(data[i : i + 4096]) for i in range(0, len(data), 4096)))
+
+    expected = [item.id for item in read_feature_collection(feature_collection)]
+    for path in [gzipped, frames]:
+        assert [item.id for item in read_feature_collection(path, workers=workers, chunk_size=1)] == expected
@@ -0,0 +1,106 @@
+import copy
+import json
+import warnings
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pydantic import ValidationError
+
+from stac_factory.models import Item
+from stac_factory.repair import RepairReport, repair_geometries, repair_items
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+
+# crossing the antimeridian eastward at the equator and back at 10N, which is counter-clockwise
+CROSSING = [[170, 0], [-170, 0], [-170, 10], [170, 10], [170, 0]]
+SQUARE = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+
+
+def polygon(ring: list[Any]) -> dict[str, Any]:
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def test_repair_geometries() -> None:
+    multipolygon = {"type": "MultiPolygon", "coordinates": [[SQUARE], [[[2, 0], [2, 1], [3, 1], [3, 0], [2, 0]]]]}
+    geometries = [
+        polygon(SQUARE),
+        polygon(SQUARE[::-1]),
+        polygon([[*position, 5.0] for position in SQUARE[::-1]]),
+        multipolygon,
+        polygon(CROSSING),
+        polygon(CROSSING[::-1]),
+        # eastward around the north pole
+        polygon([[-170, 80], [-90, 80], [0, 80], [90, 80], [170, 80], [-170, 80]]),
+    ]
+    with warnings.catch_warnings():
+        # fix_polygon warns if it fixes the winding itself
+        warnings.simplefilter("error")
+        repaired, repairs = repair_geometries(geometries)
+
+    assert repairs == [
+        (),
+        ("winding",),
+        ("winding",),
+        ("winding",),
+        ("antimeridian",),
+        ("winding", "antimeridian"),
+        ("antimeridian",),
+    ]
+    assert repaired[0] is geometries[0]
+    assert repaired[1] == polygon(SQUARE)
+    assert repaired[2] == polygon([[*position, 5.0] for position in SQUARE])
+    assert repaired[3]["coordinates"] == [[SQUARE], [[[2, 0], [3, 0], [3, 1], [2, 1], [2, 0]]]]
+    # the input isn't changed
+    assert geometries[1] == polygon(SQUARE[::-1])
+    assert multipolygon["coordinates"][1] == [[[2, 0], [2, 1], [3, 1], [3, 0], [2, 0]]]
+
+    split = repaired[4]
+    assert split["type"] == "MultiPolygon"
+    assert [[position[0] for position in part[0]] for part in split["coordinates"]] == [
+        [180, 170, 170, 180, 180],
+        [-180, -170, -170, -180, -180],
+    ]
+    assert repaired[5] == split
+    # closed over the pole along the antimeridian
+    assert max(position[1] for position in repaired[6]["coordinates"][0]) == 90
+
+
+def test_repair_geometries_leaves_others() -> None:
+    crossing_3d = polygon([[*position, 5.0] for position in CROSSING])
+    geometries = [
+        None,
+        "Polygon",
+        {"type": "Point", "coordinates": [0, 0]},
+        {"type": "Polygon", "coordinates": []},
+        {"type": "Polygon"},
+        polygon([[0, 0], [1, 0], [0, 0]]),
+        polygon([[0, 0], [1, 0], [1, 1, 1], [0, 0]]),
+        polygon([[0, 0], [1, 0], [1, "x"], [0, 0]]),
+        crossing_3d,
+    ]
+    repaired, repairs = repair_geometries(geometries)
+    assert repairs == [()] * len(geometries)
+    assert all(after is before for after, before in zip(repaired, geometries, strict=True))
+    assert repair_geometries([]) == ([], [])
+
+
+def test_repair_items() -> None:
+    item = json.loads((fixture_dir / "S2B_T01WCR_20250427T000611_L2A.json").read_text())
+    crossing = {**item, "id": "crossing", "geometry": polygon(CROSSING), "bbox": [170, 0, -170, 10.2]}
+    clockwise = {**item, "id": "clockwise", "geometry": polygon(SQUARE[::-1]), "bbox": [0, 0, 1, 1]}
+    square = {**item, "id": "square", "geometry": polygon(SQUARE), "bbox": [0, 0, 1, 1]}
+    for document in crossing, clockwise:
+        with pytest.raises(ValidationError):
+            # a copy, as validation moves the datetimes out of properties
+            Item.model_validate(copy.deepcopy(document))
+
+    assert repair_items([square, crossing, clockwise]) == [
+        RepairReport(1, "crossing", ("antimeridian",)),
+        RepairReport(2, "clockwise", ("winding",)),
+    ]
+    assert square["geometry"] == polygon(SQUARE)
+    assert Item.model_validate(copy.deepcopy(crossing)).geometry.type == "MultiPolygon"
+    assert Item.model_validate(copy.deepcopy(clockwise)).geometry.coordinates[0][1] == (1, 0)
@@ -0,0 +1,162 @@
+import gzip
+import http.client
+import os
+import signal
+import socket
+import threading
+import time
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from stac_factory.cli.__main__ import app
+from stac_factory.client import ValidationClient, main, parse_address
+from stac_factory.server import ValidationServer
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+VALID = (fixture_dir / "minimal.json").read_bytes()
+INVALID = (fixture_dir / "invalid.json").read_bytes()
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[ValidationServer]:
+    address = "127.0.0.1:0" if request.param == "tcp" else str(tmp_path / "validate.sock")
+    with ValidationServer(address) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def test_validation_server(server: ValidationServer) -> None:
+    with ValidationClient(server.url) as client:
+        assert client.health()
+        assert client.validate(VALID) == {"valid": True, "id": "S2B_T38XNF_20250422T091553_L2A"}
+        result = client.validate(INVALID)
+        assert not result["valid"]
+        assert result["errors"][0]["type"] == "value_error"
+        assert [result["valid"] for result in client.validate_many([VALID, INVALID, b"{", VALID])] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert client.validate_many([]) == []
+        # a result for blank documents too, which aren't lines the server validates
+        results = client.validate_many([b"", VALID, b" \n "])
+        assert [result["valid"] for result in results] == [False, True, False]
+        assert results[0]["errors"][0]["type"] == "json_invalid"
+        assert [result["valid"] for result in client.validate_many([b"\n"])] == [False]
+        with pytest.raises(http.client.HTTPException, match="404"):
+            client._request("GET", "/items")  # noqa: SLF001
+        with pytest.raises(http.client.HTTPException, match="404"):
+            client._request("POST", "/items", b"{}")  # noqa: SLF001
+
+
+def test_validation_server_concurrent_clients(server: ValidationServer) -> None:
+    results: list[bool] = []
+
+    def run() -> None:
+        with ValidationClient(server.url) as client:
+            results.extend(client.validate(VALID)["valid"] for _ in range(10))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 40
+
+
+def test_validation_server_workers(tmp_path: Path) -> None:
+    with ValidationServer(str(tmp_path / "validate.sock"), workers=2, batch_size=2) as server:
+        assert server.validate([VALID, INVALID, VALID, VALID, INVALID]) == [
+            {"valid": True, "id": "S2B_T38XNF_20250422T091553_L2A"},
+            *server.validate([INVALID]),
+            *server.validate([VALID, VALID]),
+            *server.validate([INVALID]),
+        ]
+
+
+def test_validation_server_shutdown_closes_idle_connections() -> None:
+    server = ValidationServer("127.0.0.1:0")
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    client = ValidationClient(server.url)
+    assert client.health()
+    # the kept-alive connection, once idle, doesn't hold up the shutdown
+    time.sleep(0.1)
+    server.shutdown()
+    server.close()
+    thread.join()
+    with pytest.raises((http.client.HTTPException, ConnectionError)):
+        client.health()
+    client.close()
+
+
+def test_validation_server_socket_file(tmp_path: Path) -> None:
+    path = tmp_path / "validate.sock"
+    # left by a server that didn't shut down
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    with ValidationServer(str(path)):
+        assert path.exists()
+        with pytest.raises(ValueError, match="already listening"):
+            ValidationServer(str(path))
+    assert not path.exists()
+
+    path.write_text("not a socket")
+    with pytest.raises(ValueError, match="not a socket"):
+        ValidationServer(str(path))
+
+
+def test_parse_address() -> None:
+    assert parse_address("localhost:8000") == ("localhost", 8000)
+    assert parse_address("run/validate.sock") == Path("run/validate.sock")
+    with pytest.raises(ValueError, match="host:port"):
+        parse_address("localhost")
+
+
+def test_client_main(server: ValidationServer, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    valid, invalid = tmp_path / "valid.json.gz", tmp_path / "invalid.json"
+    valid.write_bytes(gzip.compress(VALID))
+    invalid.write_bytes(INVALID)
+
+    main(["validate", str(valid), "--address", server.url])
+    assert capsys.readouterr().out == "Success!\n"
+
+    main(["validate", str(valid), str(invalid), "--address", server.url])
+    out = capsys.readouterr().out
+    assert f"{valid}: Success!\n{invalid}: Failure:\n" in out
+    assert "datetime must be not null" in out
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"\n")
+    main(["validate", str(empty), str(valid), "--address", server.url])
+    assert capsys.readouterr().out.startswith(f"{empty}: Failure:\n")
+
+
+def test_cli_serve(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "validate.sock"
+    monkeypatch.setenv("STAC_FACTORY_ADDRESS", str(path))
+    results = []
+
+    def request_then_stop() -> None:
+        while not path.exists():
+            time.sleep(0.01)
+        with ValidationClient(str(path)) as client:
+            results.append(client.validate(VALID)["valid"])
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    thread = threading.Thread(target=request_then_stop)
+    thread.start()
+    previous = signal.getsignal(signal.SIGTERM)
+    app(["serve", "--workers", "1"])
+    thread.join()
+    assert results == [True]
+    assert signal.getsignal(signal.SIGTERM) == previous
+    assert not path.exists()
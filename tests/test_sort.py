@@ -0,0 +1,139 @@
+import gzip
+import io
+import json
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stac_factory import sort
+from stac_factory.cli.__main__ import app
+from stac_factory.models import Item
+from stac_factory.sort import SortStats, sort_items
+
+
+def line(item_id: str, collection: str | None, day: int, *, updated: int | None = None, title: str = "") -> bytes:
+    return (
+        Item.create(
+            extensions=[],
+            id=item_id,
+            geometry={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]},
+            bbox=[0, 0, 1, 1],
+            assets=[],
+            links=[],
+            collection=collection,
+            datetime=datetime(2021, 1, day, tzinfo=UTC),
+            updated=None if updated is None else datetime(2022, 1, updated, tzinfo=UTC),
+            title=title or None,
+        )
+        .model_dump_json()
+        .encode()
+    )
+
+
+def keys(output: bytes) -> list[tuple[str, str, str | None]]:
+    items = [json.loads(line) for line in output.splitlines()]
+    return [(item["collection"], item["id"], item["properties"].get("title")) for item in items]
+
+
+def test_sort_items(tmp_path: Path) -> None:
+    lines = [line(f"item-{i}", ("b", "a", None)[i % 3], 1 + i % 5) for i in range(30)]
+    lines = [lines[i] for i in np.random.default_rng(0).permutation(len(lines))]
+    first, second = tmp_path / "first.ndjson", tmp_path / "second.ndjson.gz"
+    first.write_bytes(b"\n".join(lines[:10]) + b"\n\n")
+    # without a final newline
+    second.write_bytes(gzip.compress(b"\n".join(lines[10:])))
+
+    def key(line: bytes) -> tuple[str, str, str]:
+        item = json.loads(line)
+        return item["collection"] or "", item["properties"]["datetime"], item["id"]
+
+    output = io.BytesIO()
+    assert sort_items([first, second], output) == SortStats(30, 0)
+    assert output.getvalue().splitlines() == sorted(lines, key=key)
+
+
+def test_sort_items_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sort, "_FAN_IN", 3)
+    lines = [line(f"item-{i:02}", "a", 1 + i % 7) for i in range(40)]
+    lines = [lines[i] for i in np.random.default_rng(1).permutation(len(lines))]
+    path = tmp_path / "items.ndjson"
+    path.write_bytes(b"\n".join(lines))
+    expected = io.BytesIO()
+    sort_items([path], expected)
+
+    runs = tmp_path / "runs"
+    runs.mkdir()
+    output = io.BytesIO()
+    # a run per couple of lines, merged three at a time
+    assert sort_items([path], output, memory=1_000, temp_dir=runs) == SortStats(40, 0)
+    assert output.getvalue() == expected.getvalue()
+    assert not any(runs.iterdir())
+
+
+@pytest.mark.parametrize("memory", [1 << 20, 1_000])
+def test_sort_items_latest(tmp_path: Path, memory: int) -> None:
+    base, updates = tmp_path / "base.ndjson", tmp_path / "updates.ndjson"
+    base.write_bytes(
+        b"\n".join(
+            [
+                line("a", "c", 1, updated=1, title="base"),
+                line("b", "c", 2, updated=3, title="base"),
+                line("c", "c", 3, updated=1, title="base"),
+                line("a", "d", 1, title="base"),
+            ]
+        )
+    )
+    updates.write_bytes(
+        b"\n".join(
+            [
+                # a moved to a later datetime
+                line("a", "c", 5, updated=2, title="update"),
+                # older than the base
+                line("b", "c", 2, updated=2, title="update"),
+                line("c", "c", 3, updated=1, title="first update"),
+                line("c", "c", 3, updated=1, title="update"),
+                line("a", "d", 1, title="update"),
+                line("e", "c", 4, title="update"),
+            ]
+        )
+    )
+    output = io.BytesIO()
+    assert sort_items([base, updates], output, latest=True, memory=memory) == SortStats(5, 5)
+    assert keys(output.getvalue()) == [
+        ("c", "b", "base"),
+        ("c", "c", "update"),
+        ("c", "e", "update"),
+        ("c", "a", "update"),
+        ("d", "a", "update"),
+    ]
+
+
+def test_sort_items_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "items.ndjson"
+    path.write_bytes(line("a", "c", 1) + b'\n{"id": "b"}\n')
+    with pytest.raises(ValueError, match=r"items.ndjson:2 isn't an Item"):
+        sort_items([path], io.BytesIO())
+
+    item = json.loads(line("a", "c", 1))
+    item["properties"]["datetime"] = None
+    path.write_text(json.dumps(item))
+    with pytest.raises(ValueError, match=r"items\.ndjson:1 has neither a datetime nor a start_datetime"):
+        sort_items([path], io.BytesIO())
+
+
+def test_cli_sort(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    base, updates, output = tmp_path / "base.ndjson", tmp_path / "updates.ndjson", tmp_path / "sorted.ndjson"
+    base.write_bytes(line("b", "c", 1) + b"\n" + line("a", "c", 2) + b"\n")
+    updates.write_bytes(line("b", "c", 1, title="update") + b"\n")
+
+    app(["sort", str(base), str(updates), "--output", str(output)])
+    assert keys(output.read_bytes()) == [("c", "b", None), ("c", "b", "update"), ("c", "a", None)]
+    assert "3 items" in capsys.readouterr().err
+
+    app(["sort", str(base), str(updates), "--latest"])
+    captured = capsys.readouterr()
+    assert keys(captured.out.encode()) == [("c", "b", "update"), ("c", "a", None)]
+    assert "1 superseded" in captured.err
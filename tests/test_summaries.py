@@ -0,0 +1,129 @@
+import copy
+import json
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stac_factory.models import EOExtension, Item, ViewExtension
+from stac_factory.projection import scan_ndjson
+from stac_factory.summaries import DistinctValues, HyperLogLog, QuantileSketch, SummaryBuilder
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+
+
+def item(n: int, **fields: object) -> Item:
+    return Item.create(
+        id=f"item-{n}",
+        geometry={"type": "Polygon", "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]},
+        bbox=[0, 0, 1, 1],
+        assets=[],
+        links=[],
+        datetime="2025-01-01T00:00:00Z",
+        collection="c",
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+def test_hyperloglog() -> None:
+    whole, first, second = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    for i in range(50_000):
+        whole.add(f"value-{i}")
+        (first if i % 3 else second).add(f"value-{i}")
+        first.add(f"value-{i // 2}")
+    assert whole.cardinality() == pytest.approx(50_000, rel=0.03)
+    assert np.array_equal(first.merge(second).registers, whole.registers)
+    assert HyperLogLog(precision=10).cardinality() == 0
+
+    with pytest.raises(ValueError, match="precision"):
+        HyperLogLog(precision=2)
+    with pytest.raises(ValueError, match="precisions"):
+        whole.merge(HyperLogLog(precision=10))
+
+
+def test_distinct_values() -> None:
+    values = DistinctValues(cap=3)
+    for value in ["b", "a", "b", "c"]:
+        values.add(value)
+    assert values.exact
+    assert values.values == ["a", "b", "c"]
+    assert values.cardinality() == 3
+
+    other = DistinctValues(cap=3)
+    other.add("d")
+    merged = copy.deepcopy(values).merge(other)
+    assert not merged.exact
+    assert merged.values is None
+    assert merged.cardinality() == pytest.approx(4, abs=0.1)
+
+    # an exact one merged into one past its cap, and one past its cap into an exact one
+    assert copy.deepcopy(merged).merge(values).cardinality() == pytest.approx(4, abs=0.1)
+    assert copy.deepcopy(values).merge(merged).cardinality() == pytest.approx(4, abs=0.1)
+
+
+def test_quantile_sketch() -> None:
+    rng = np.random.default_rng(0)
+    numbers = np.concatenate([rng.lognormal(2.0, 1.5, 20_000), -rng.lognormal(0.0, 1.0, 5_000), np.zeros(1_000)])
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    parts = [QuantileSketch(relative_accuracy=0.01) for _ in range(3)]
+    for i, number in enumerate(rng.permutation(numbers).tolist()):
+        sketch.add(number)
+        parts[i % 3].add(number)
+
+    assert (sketch.count, sketch.min, sketch.max) == (len(numbers), numbers.min(), numbers.max())
+    for q in [0.0, 0.01, 0.1, 0.2, 0.5, 0.9, 0.99, 1.0]:
+        expected = float(np.quantile(numbers, q, method="lower"))
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01, abs=1e-9)
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert [merged.quantile(q) for q in [0.1, 0.5, 0.9]] == [sketch.quantile(q) for q in [0.1, 0.5, 0.9]]
+    assert QuantileSketch().quantile(0.5) is None
+
+    with pytest.raises(ValueError, match="relative_accuracy"):
+        QuantileSketch(relative_accuracy=0)
+    with pytest.raises(ValueError, match="accuracies"):
+        sketch.merge(QuantileSketch(relative_accuracy=0.02))
+
+
+def test_summary_builder_items() -> None:
+    items = [
+        item(0, extensions=[EOExtension.create(cloud_cover=12.5)], platform="sentinel-2a", instruments=["msi"], gsd=10),
+        item(1, extensions=[ViewExtension.create(off_nadir=3.0)], platform="sentinel-2b", instruments=["msi"]),
+        item(2, extensions=[EOExtension.create(cloud_cover=0.0)], platform="sentinel-2a", gsd=20),
+    ]
+    builder = SummaryBuilder().update(items)
+    assert builder.count == 3
+    assert builder.summaries() == {
+        "platform": ["sentinel-2a", "sentinel-2b"],
+        "instruments": ["msi"],
+        "gsd": {"minimum": 10, "maximum": 20},
+        "eo:cloud_cover": {"minimum": 0.0, "maximum": 12.5},
+        "view:off_nadir": {"minimum": 3.0, "maximum": 3.0},
+    }
+
+    parts = [SummaryBuilder().update(items[:1]), SummaryBuilder().update(items[1:])]
+    merged = copy.deepcopy(parts[0]).merge(copy.deepcopy(parts[1]))
+    assert merged.count == 3
+    assert merged.summaries() == builder.summaries()
+    with pytest.raises(ValueError, match="different fields"):
+        builder.merge(SummaryBuilder(numeric=["gsd"]))
+
+
+def test_summary_builder_projection(tmp_path: Path) -> None:
+    document = json.loads((fixture_dir / "S2B_T38XNF_20250422T091553_L2A.json").read_text())
+    ndjson = tmp_path / "items.ndjson"
+    lines = []
+    for tile in ["38XNF", "38XNG", "38XNF"]:
+        document["properties"]["s2:mgrs_tile"] = tile
+        lines.append(json.dumps(document))
+    ndjson.write_text("\n".join(lines))
+
+    builder = SummaryBuilder(distinct=["platform", "constellation", "s2:mgrs_tile"], numeric=["eo:cloud_cover", "x"])
+    builder.update(scan_ndjson(ndjson, builder.projection))
+    assert builder.summaries() == {
+        "platform": ["sentinel-2b"],
+        "constellation": ["sentinel-2"],
+        "s2:mgrs_tile": ["38XNF", "38XNG"],
+        "eo:cloud_cover": {"minimum": 91.145676, "maximum": 91.145676},
+    }
+    assert builder.numeric["eo:cloud_cover"].quantile(0.5) == pytest.approx(91.145676, rel=0.01)
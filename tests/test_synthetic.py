@@ -0,0 +1,97 @@
+import json
+
+from datetime import datetime, timezone
+
+import pytest
+import shapely
+
+from stac_factory.geometry import bbox_mismatches
+from stac_factory.models import Item, MultiPolygon, Polygon
+from stac_factory.synthetic import EXTENSIONS, SyntheticItems
+
+
+def test_synthetic_items_are_valid() -> None:
+    items = list(
+        SyntheticItems(1, median_vertices=64, antimeridian_fraction=0.2, interval_fraction=0.3, footprints=256).items(
+            2_000
+        )
+    )
+    assert len(items) == 2_000
+    assert len({item.id for item in items}) == 2_000
+    assert not bbox_mismatches(items).any()
+    assert all(shapely.is_valid(item.geometry.to_shapely()) for item in items)
+    multipolygons = [item for item in items if isinstance(item.geometry, MultiPolygon)]
+    assert multipolygons
+    assert all(item.bbox.crosses_antimeridian for item in multipolygons)
+    assert any(item.start_datetime is not None and item.datetime is None for item in items)
+    assert all(
+        item.start_datetime <= item.end_datetime  # type: ignore[operator]
+        for item in items
+        if item.start_datetime is not None
+    )
+
+
+def test_synthetic_items_vertex_limit() -> None:
+    items = list(SyntheticItems(2, median_vertices=10_000, footprints=16, antimeridian_fraction=0).items(50))
+    assert {len(item.geometry.coordinates[0]) for item in items} == {512}  # type: ignore[union-attr]
+    assert all(isinstance(item.geometry, Polygon) for item in items)
+
+
+def test_synthetic_items_are_seeded() -> None:
+    assert list(SyntheticItems(3, footprints=8).json(100)) == list(SyntheticItems(3, footprints=8).json(100))
+    assert list(SyntheticItems(3, footprints=8).json(100)) != list(SyntheticItems(4, footprints=8).json(100))
+
+
+def test_synthetic_items_continue_across_batches() -> None:
+    generator = SyntheticItems(footprints=8)
+    ids = [json.loads(raw)["id"] for raw in [*generator.json(10_005), *generator.json(3)]]
+    assert ids == [f"synthetic-{i}" for i in range(10_008)]
+
+
+def test_synthetic_items_distributions() -> None:
+    generator = SyntheticItems(
+        5,
+        collection="load-test",
+        mean_assets=3,
+        max_assets=4,
+        mean_links=100,
+        extension_probability={"eo": 1.0, "sat": 0.0},
+        interval_fraction=0,
+        start=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        end=datetime(2020, 1, 2, tzinfo=timezone.utc),
+        footprints=8,
+    )
+    features = [json.loads(raw) for raw in generator.json(500)]
+    assert {feature["collection"] for feature in features} == {"load-test"}
+    assert max(len(feature["assets"]) for feature in features) == 4
+    assert {len(feature["links"]) for feature in features} == {8}
+    assert {tuple(feature["stac_extensions"]) for feature in features} == {(EXTENSIONS["eo"][0],)}
+    assert all(0 <= feature["properties"]["eo:cloud_cover"] <= 100 for feature in features)
+    assert all(feature["properties"]["datetime"].startswith("2020-01-01T") for feature in features)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_vertices": 513}, "max_vertices"),
+        ({"max_assets": 100}, "max_assets"),
+        ({"max_links": -1}, "max_links"),
+        ({"extension_probability": {"proj": 0.5}}, "unknown extensions"),
+        ({"start": datetime(2025, 1, 1, tzinfo=timezone.utc)}, "start must be before end"),
+    ],
+)
+def test_synthetic_items_invalid_distributions(kwargs: dict[str, object], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        SyntheticItems(**kwargs)  # type: ignore[arg-type]
+
+
+def test_synthetic_items_integer_properties() -> None:
+    generator = SyntheticItems(extension_probability={"sat": 1.0}, footprints=8)
+    orbits = [json.loads(raw)["properties"]["sat:relative_orbit"] for raw in generator.json(500)]
+    assert all(isinstance(orbit, int) and 1 <= orbit <= 233 for orbit in orbits)
+    assert len(set(orbits)) > 100
+
+
+def test_synthetic_item_validates_as_item() -> None:
+    raw = next(SyntheticItems(footprints=1).json(1))
+    assert Item.model_validate_json(raw).id == "synthetic-0"
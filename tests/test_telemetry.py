@@ -0,0 +1,111 @@
+import json
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from stac_factory.cli.__main__ import app
+from stac_factory.telemetry import LatencyHistogram, Telemetry
+from stac_factory.writers import PartitionedWriter
+
+from .test_index import make_item
+
+fixture_dir = Path(__file__).parent.absolute() / "fixtures"
+
+
+def test_latency_histogram() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    for ms in range(1, 101):
+        histogram.add(ms / 1000)
+    histogram.add(0.0)
+
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.02)
+    assert histogram.percentile(100) == histogram.max == 0.1
+    assert histogram.percentile(0) == 1e-6
+
+
+def test_telemetry_report() -> None:
+    output = StringIO()
+    telemetry = Telemetry(output)
+    telemetry.set_workers("build", 2)
+    telemetry.record("build", 0.002, items=2, failures=1)
+    with telemetry.measure("serialize", items=3):
+        pass
+    with pytest.raises(RuntimeError), telemetry.measure("serialize"):
+        raise RuntimeError
+    assert output.getvalue() == ""
+
+    telemetry.close()
+    report = json.loads(output.getvalue())
+    assert report["final"]
+    assert report["peak_rss_bytes"] > 0
+    build = report["stages"]["build"]
+    assert (build["items"], build["failures"], build["workers"], build["busy_seconds"]) == (2, 1, 2, 0.002)
+    assert build["latency_seconds"]["p50"] == pytest.approx(0.001, rel=0.02)
+    assert build["worker_utilization"] > 0
+    assert len(build["timeline"]) == 1
+    assert report["stages"]["serialize"]["items"] == 4
+    assert report["stages"]["serialize"]["failures"] == 1
+    assert set(report["caches"]) == {"url", "geometry"}
+    assert {"hits", "misses", "maxsize", "size", "hit_rate"} <= report["caches"]["geometry"].keys()
+
+
+def test_telemetry_periodic() -> None:
+    output = StringIO()
+    telemetry = Telemetry(output, interval=1e-9)
+    telemetry.record("validate", 0.001)
+    telemetry.record("validate", 0.001)
+    telemetry.close()
+
+    reports = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [report["final"] for report in reports] == [False, False, True]
+    assert [report["stages"]["validate"]["items"] for report in reports] == [1, 2, 2]
+    assert "timeline" not in reports[0]["stages"]["validate"]
+    assert reports[1]["stages"]["validate"]["interval_items_per_second"] > 0
+    assert len(reports[2]["stages"]["validate"]["timeline"]) == 3
+
+
+def test_partitioned_writer_telemetry(tmp_path: Path) -> None:
+    output = StringIO()
+    telemetry = Telemetry(output)
+    with PartitionedWriter(tmp_path, [lambda _: "all"], buffer_size=2, workers=2, telemetry=telemetry) as writer:
+        writer.write_all(make_item(str(i), 0, 0, 1, 1) for i in range(5))
+    assert telemetry.report()["stages"]["serialize"]["items"] == 5
+    assert telemetry.report()["stages"]["serialize"]["workers"] == 2
+
+
+def test_cli_telemetry(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    report_path = tmp_path / "telemetry.jsonl"
+
+    app(["validate", str(fixture_dir / "minimal.json"), "--telemetry", str(report_path)])
+    assert json.loads(report_path.read_text())["stages"]["validate"]["items"] == 1
+
+    app(["validate", str(fixture_dir / "invalid.json"), "--telemetry", str(report_path)])
+    assert json.loads(report_path.read_text())["stages"]["validate"]["failures"] == 1
+
+    features = [json.loads((fixture_dir / "minimal.json").read_text())] * 3
+    collection = tmp_path / "collection.json"
+    collection.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    app(["validate", str(collection), "--feature-collection", "--telemetry", str(report_path)])
+    assert json.loads(report_path.read_text())["stages"]["validate"]["items"] == 3
+
+    records = tmp_path / "records.jsonl"
+    records.write_text('{"id": "a", "lon": 0, "lat": 0, "datetime": "2021-01-01T00:00:00Z"}\n')
+    app(
+        [
+            "build",
+            str(records),
+            "tests.test_build:map_record",
+            "--workers",
+            "1",
+            "--output",
+            str(tmp_path / "items.ndjson"),
+            "--telemetry",
+            str(report_path),
+        ]
+    )
+    assert json.loads(report_path.read_text())["stages"]["build"]["items"] == 1
+    capsys.readouterr()
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from pydantic import ValidationError
+
+from stac_factory.models import Asset, Item, Link, Polygon, Provider
+from stac_factory.template import ItemTemplate
+
+FOOTPRINT = Polygon.model_validate({"type": "Polygon", "coordinates": [[[0, 0], [2, 0], [2, 1], [0, 1], [0, 0]]]})
+
+
+@pytest.fixture
+def template() -> ItemTemplate:
+    return ItemTemplate(
+        collection="landsat",
+        links=[Link.model_validate({"rel": "collection", "href": "https://example.com/collections/landsat"})],
+        asset_defaults={
+            "red": {"title": "Red", "type": "image/tiff; application=geotiff", "roles": ["data"]},
+            "thumbnail": {"type": "image/png", "roles": ["thumbnail"]},
+        },
+        license="CC-BY-4.0",
+        providers=[
+            Provider.model_validate(
+                {"name": "USGS", "description": "the USGS", "roles": ["producer"], "url": "https://usgs.gov"}
+            )
+        ],
+        platform="landsat-9",
+        instruments=["oli"],
+        gsd=30,
+    )
+
+
+def test_item_template_create(template: ItemTemplate) -> None:
+    item = template.create(
+        id="LC09_1",
+        geometry=FOOTPRINT,
+        datetime=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        assets={
+            "red": "https://example.com/LC09_1/red.tif",
+            "thumbnail": "https://example.com/LC09_1/thumb.png",
+            "extra": "https://example.com/LC09_1/extra.txt",
+            "metadata": Asset.create(name="metadata", href="https://example.com/LC09_1/mtl.xml", title="MTL"),
+        },
+        links=[Link.model_validate({"rel": "self", "href": "https://example.com/items/LC09_1"})],
+    )
+
+    assert item.bbox.model_dump() == [0, 0, 2, 1]
+    assert [link.rel for link in item.links] == ["collection", "self"]
+    assert item.links[0] is template.links[0]
+    assert item.providers is not None
+    assert item.providers[0] is template.fields["providers"][0]
+    assert (item.collection, item.license, item.platform, item.gsd) == ("landsat", "CC-BY-4.0", "landsat-9", 30)
+
+    red, thumbnail, extra, metadata = item.assets
+    assert (str(red.href), red.title, red.roles) == ("https://example.com/LC09_1/red.tif", "Red", ["data"])
+    assert (thumbnail.title, thumbnail.type) == (None, "image/png")
+    assert (extra.name, extra.type) == ("extra", None)
+    assert metadata.title == "MTL"
+
+    same = Item.create(
+        extensions=[],
+        id="LC09_1",
+        geometry=FOOTPRINT,
+        bbox=item.bbox,
+        links=item.links,
+        assets=item.assets,
+        collection="landsat",
+        datetime=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        license="CC-BY-4.0",
+        providers=item.providers,
+        platform="landsat-9",
+        instruments=["oli"],
+        gsd=30,
+    )
+    assert item.canonical_json() == same.canonical_json()
+
+
+def test_item_template_validates_shared_fields_once() -> None:
+    with pytest.raises(ValidationError, match="gsd"):
+        ItemTemplate(collection="landsat", gsd=-1)
+    with pytest.raises(ValidationError, match="type"):
+        ItemTemplate(collection="landsat", asset_defaults={"red": {"type": "not a media type"}})
+
+
+def test_item_template_validates_item_fields(template: ItemTemplate) -> None:
+    with pytest.raises(ValidationError, match="href"):
+        template.create(
+            id="LC09_1", geometry=FOOTPRINT, datetime=datetime(2021, 1, 1, tzinfo=timezone.utc), assets={"red": "x"}
+        )
+    with pytest.raises(ValidationError, match="datetime"):
+        template.create(id="LC09_1", geometry=FOOTPRINT, datetime=None, assets={})
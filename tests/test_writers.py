@@ -0,0 +1,124 @@
+import json
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from stac_factory.models import Item
+from stac_factory.writers import PartitionedWriter, collection_key, datetime_key, spatial_key
+
+from .test_index import make_item
+
+
+def with_collection(item: Item, collection: str | None) -> Item:
+    item_dict = item.model_dump(mode="json")
+    item_dict["collection"] = collection
+    if collection:
+        item_dict["links"] = [{"rel": "collection", "href": f"https://example.com/collections/{collection}"}]
+    return Item.model_validate(item_dict)
+
+
+@pytest.fixture
+def items() -> list[Item]:
+    return [
+        with_collection(make_item("a", 0, 0, 1, 1, day=1), "landsat"),
+        with_collection(make_item("b", 10, 10, 11, 11, day=2), "landsat"),
+        with_collection(make_item("c", 0, 0, 1, 1, day=1), "sentinel"),
+        with_collection(make_item("d", 0, 0, 1, 1, day=1), "landsat"),
+        with_collection(make_item("e", 0, 0, 1, 1, day=1, end_day=3), None),
+    ]
+
+
+def read_ndjson(path: Path) -> list[str]:
+    return [Item.model_validate_json(line).id for line in path.read_text().splitlines()]
+
+
+def test_partition_keys(items: list[Item]) -> None:
+    assert [collection_key(item) for item in items] == ["landsat", "landsat", "sentinel", "landsat", "no-collection"]
+    assert datetime_key("year")(items[1]) == "2021"
+    assert datetime_key("month")(items[1]) == "2021/01"
+    assert datetime_key()(items[1]) == "2021/01/02"
+    assert spatial_key()(items[1]) == "10_10"
+    assert spatial_key(1)(make_item("sw", -0.5, -0.5, -0.1, -0.1)) == "-1_-1"
+
+    crossing = Item.model_validate(
+        make_item("x", 179, 0, 179.5, 1).model_dump(mode="json") | {"bbox": [170, 0, -160, 1]}
+    )
+    assert spatial_key(5)(crossing) == "-175_0"
+
+
+@pytest.mark.parametrize(("buffer_size", "max_open_files"), [(1, 1), (2, 2), (100, 4)])
+def test_partitioned_writer_ndjson(tmp_path: Path, items: list[Item], buffer_size: int, max_open_files: int) -> None:
+    with PartitionedWriter(
+        tmp_path, buffer_size=buffer_size, max_open_files=max_open_files, workers=max_open_files
+    ) as writer:
+        writer.write_all(items)
+        writer.write(with_collection(make_item("f", 0, 0, 1, 1, day=1), "landsat"))
+
+    assert sorted(str(path.relative_to(tmp_path)) for path in tmp_path.rglob("*") if path.is_file()) == [
+        "landsat/2021/01/01.ndjson",
+        "landsat/2021/01/02.ndjson",
+        "no-collection/2021/01/01.ndjson",
+        "sentinel/2021/01/01.ndjson",
+    ]
+    assert read_ndjson(tmp_path / "landsat/2021/01/01.ndjson") == ["a", "d", "f"]
+
+
+def test_partitioned_writer_json(tmp_path: Path, items: list[Item]) -> None:
+    writer = PartitionedWriter(tmp_path, [collection_key], format="json", buffer_size=1, workers=2)
+    writer.write_all(items)
+    counts = writer.close()
+
+    assert counts == {tmp_path / "landsat.json": 3, tmp_path / "sentinel.json": 1, tmp_path / "no-collection.json": 1}
+    collection = json.loads((tmp_path / "landsat.json").read_text())
+    assert collection["type"] == "FeatureCollection"
+    assert [Item.model_validate(feature).id for feature in collection["features"]] == ["a", "b", "d"]
+
+
+def test_partitioned_writer_abort(tmp_path: Path, items: list[Item]) -> None:
+    def write_then_fail() -> None:
+        with PartitionedWriter(tmp_path, buffer_size=1) as writer:
+            writer.write_all(items)
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_then_fail()
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+def test_partitioned_writer_failed_write(tmp_path: Path, items: list[Item]) -> None:
+    (tmp_path / "landsat").write_text("not a directory")
+    writer = PartitionedWriter(tmp_path)
+    writer.write_all(items)
+    with pytest.raises(NotADirectoryError):
+        writer.close()
+    assert not (tmp_path / "sentinel/2021/01/01.ndjson.part").exists()
+
+
+def test_partitioned_writer_invalid(tmp_path: Path, items: list[Item]) -> None:
+    with pytest.raises(ValueError, match="max_open_files must be at least workers"):
+        PartitionedWriter(tmp_path, max_open_files=1, workers=2)
+
+    with pytest.raises(ValueError, match="invalid partition path"):
+        PartitionedWriter(tmp_path, [lambda _: ".."]).write(items[0])
+
+
+def test_partitioned_writer_start_datetime(tmp_path: Path) -> None:
+    item = make_item("range", 0, 0, 1, 1, day=5, end_day=9)
+    assert item.start_datetime == datetime(2021, 1, 5, tzinfo=timezone.utc)
+    with PartitionedWriter(tmp_path, [datetime_key("day")]) as writer:
+        writer.write(item)
+    assert read_ndjson(tmp_path / "2021/01/05.ndjson") == ["range"]
+
+
+@pytest.mark.parametrize("format", ["ndjson", "json"])
+def test_partitioned_writer_precision(tmp_path: Path, format: str) -> None:
+    item = make_item("precise", 0.123456, 0.123456, 1.654321, 1.654321)
+    with PartitionedWriter(tmp_path, [collection_key], format=format, precision=2) as writer:  # type: ignore[arg-type]
+        writer.write(item)
+    text = (tmp_path / f"no-collection.{format}").read_text()
+    written = json.loads(text) if format == "json" else {"features": [json.loads(text)]}
+    (feature,) = written["features"]
+    assert feature["bbox"] == [0.12, 0.12, 1.65, 1.65]
+    assert feature["geometry"]["coordinates"][0][:2] == [[0.12, 0.12], [1.65, 0.12]]